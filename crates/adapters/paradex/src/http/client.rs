@@ -5,8 +5,9 @@ use crate::common::{Fill, Market, Order, Position};
 use crate::concurrency::RateLimiter;
 use crate::config::ParadexConfig;
 use crate::error::Result;
-use crate::python_wrapper::ParadexPyWrapper;
+use crate::python_wrapper::{value_to_py, ApiArgs, ParadexPyWrapper};
 
+use pyo3::{PyObject, Python};
 use reqwest::Client;
 use serde_json::Value;
 use std::sync::Arc;
@@ -53,23 +54,28 @@ impl HttpClient {
         
         debug!("GET {} (via paradex-py)", path);
         
-        // Route to appropriate paradex-py method
-        match path {
-            "/v1/markets" => self.py_wrapper.fetch_markets(),
-            "/v1/positions" => self.py_wrapper.fetch_positions(),
-            "/v1/account" => self.py_wrapper.fetch_account(),
-            "/v1/orders" => self.py_wrapper.fetch_orders(),
-            _ if path.starts_with("/v1/orderbook/") => {
-                let market = path.strip_prefix("/v1/orderbook/").unwrap();
-                self.py_wrapper.fetch_orderbook(market)
-            }
-            _ if path.starts_with("/v1/fills?start_at=") => {
-                let start_time = path.split("start_at=").nth(1)
-                    .and_then(|s| s.parse::<u64>().ok())
-                    .unwrap_or(0);
-                self.py_wrapper.fetch_fills(start_time)
+        match sdk_route(path) {
+            Some((method, args)) => self.py_wrapper.fetch_value(method, args),
+            None => self.get_public(path).await,
+        }
+    }
+
+    /// GET ``path`` like ``get_authenticated``, returning Python objects built once
+    ///
+    /// Paths served by paradex-py return the SDK's objects untouched. Public
+    /// paths convert the parsed JSON to Python directly, without a string.
+    pub async fn get_authenticated_object(&self, path: &str) -> Result<PyObject> {
+        let _permit = self.rate_limiter.acquire().await;
+
+        debug!("GET {} (native)", path);
+
+        match sdk_route(path) {
+            Some((method, args)) => self.py_wrapper.fetch_object(method, args),
+            None => {
+                let value = self.get_public(path).await?;
+                Python::with_gil(|py| value_to_py(py, &value))
+                    .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))
             }
-            _ => self.get_public(path).await,
         }
     }
 
@@ -182,4 +188,116 @@ impl HttpClient {
         let path = format!("/v1/trades/{}", instrument_id);
         self.get_authenticated(&path).await
     }
+
+    /// Get one page of historical trades for a market within [start_at, end_at] (ms)
+    pub async fn get_trades_page(
+        &self,
+        market: &str,
+        start_at: u64,
+        end_at: u64,
+        page_size: u32,
+        cursor: Option<&str>,
+    ) -> Result<Value> {
+        let _permit = self.rate_limiter.acquire().await;
+
+        let mut path = format!(
+            "/v1/trades?market={}&start_at={}&end_at={}&page_size={}",
+            encode_query_value(market),
+            start_at,
+            end_at,
+            page_size
+        );
+        if let Some(c) = cursor {
+            path.push_str(&format!("&cursor={}", encode_query_value(c)));
+        }
+        self.get_public(&path).await
+    }
+
+    /// Get OHLCV klines for a market within [start_at, end_at] (ms)
+    pub async fn get_klines(
+        &self,
+        symbol: &str,
+        resolution: u32,
+        start_at: u64,
+        end_at: u64,
+    ) -> Result<Value> {
+        let _permit = self.rate_limiter.acquire().await;
+
+        let path = format!(
+            "/v1/markets/klines?symbol={}&resolution={}&start_at={}&end_at={}",
+            encode_query_value(symbol),
+            resolution,
+            start_at,
+            end_at
+        );
+        self.get_public(&path).await
+    }
+}
+
+/// Map a REST path to the paradex-py ``api_client`` method serving it
+///
+/// Returns ``None`` for paths the SDK does not cover, which are fetched as
+/// public requests instead.
+fn sdk_route(path: &str) -> Option<(&'static str, ApiArgs<'_>)> {
+    match path {
+        "/v1/markets" => Some(("fetch_markets", ApiArgs::None)),
+        "/v1/positions" => Some(("fetch_positions", ApiArgs::None)),
+        "/v1/account" => Some(("fetch_account_info", ApiArgs::None)),
+        "/v1/orders" => Some(("fetch_orders", ApiArgs::None)),
+        _ if path.starts_with("/v1/orderbook/") => {
+            let market = path.strip_prefix("/v1/orderbook/").unwrap();
+            Some(("fetch_orderbook", ApiArgs::Market(market)))
+        }
+        _ if path.starts_with("/v1/fills?start_at=") => {
+            let start_time = path.split("start_at=").nth(1)
+                .and_then(|s| s.parse::<u64>().ok())
+                .unwrap_or(0);
+            Some(("fetch_fills", ApiArgs::StartAt(start_time)))
+        }
+        _ => None,
+    }
+}
+
+/// Percent-encode a query string value (RFC 3986 unreserved characters pass through)
+///
+/// Cursors are opaque base64 strings, so ``+``, ``/`` and ``=`` must not reach
+/// the server unescaped.
+fn encode_query_value(value: &str) -> String {
+    let mut encoded = String::with_capacity(value.len());
+    for byte in value.bytes() {
+        match byte {
+            b'A'..=b'Z' | b'a'..=b'z' | b'0'..=b'9' | b'-' | b'_' | b'.' | b'~' => {
+                encoded.push(byte as char)
+            }
+            _ => encoded.push_str(&format!("%{:02X}", byte)),
+        }
+    }
+    encoded
+}
+
+#[cfg(test)]
+mod tests {
+    use super::{encode_query_value, sdk_route};
+    use crate::python_wrapper::ApiArgs;
+
+    #[test]
+    fn test_sdk_route_maps_sdk_paths_and_falls_back_to_public() {
+        assert_eq!(sdk_route("/v1/account"), Some(("fetch_account_info", ApiArgs::None)));
+        assert_eq!(
+            sdk_route("/v1/orderbook/BTC-USD-PERP"),
+            Some(("fetch_orderbook", ApiArgs::Market("BTC-USD-PERP"))),
+        );
+        assert_eq!(
+            sdk_route("/v1/fills?start_at=1700000000000"),
+            Some(("fetch_fills", ApiArgs::StartAt(1_700_000_000_000))),
+        );
+        assert_eq!(sdk_route("/v1/system/time"), None);
+    }
+
+    #[test]
+    fn test_encode_query_value_escapes_reserved_characters() {
+        assert_eq!(encode_query_value("BTC-USD-PERP"), "BTC-USD-PERP");
+        assert_eq!(encode_query_value("ab+c/d=="), "ab%2Bc%2Fd%3D%3D");
+        assert_eq!(encode_query_value("a&b c"), "a%26b%20c");
+    }
 }
@@ -20,7 +20,9 @@ fn paradex_adapter(_py: Python, m: &PyModule) -> PyResult<()> {
     m.add_class::<python::PyHttpClient>()?;
     m.add_class::<python::PyWebSocketClient>()?;
     m.add_class::<python::PySimpleWebSocketClient>()?;
+    m.add_class::<python::PyShardedWebSocketClient>()?;
     m.add_class::<python::PyParadexWebSocket>()?;
+    m.add_class::<python::PyReplayWebSocketClient>()?;
     m.add_class::<python::PyStarker>()?;
     Ok(())
 }
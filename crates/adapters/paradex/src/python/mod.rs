@@ -3,26 +3,56 @@
 use pyo3::prelude::*;
 use pyo3::types::PyDict;
 use pyo3_asyncio::tokio::future_into_py;
+use std::collections::HashMap;
 use std::sync::Arc;
 
 use crate::config::PyParadexConfig;
 use crate::signing::types::{OrderSignatureParams, SignatureParams};
 
 /// Python wrapper for HttpClient
+///
+/// REST responses are JSON strings by default. With ``native=True`` the
+/// markets, orders, fills, positions and account methods return Python
+/// objects instead, converted exactly once.
 #[pyclass]
 pub struct PyHttpClient {
     client: crate::http::HttpClient,
+    native: bool,
+}
+
+impl PyHttpClient {
+    /// GET ``path`` as a JSON string, or as Python objects in native mode
+    fn get<'py>(&self, py: Python<'py>, path: String) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        let native = self.native;
+        future_into_py(py, async move {
+            if native {
+                return client.get_authenticated_object(&path).await
+                    .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)));
+            }
+            let result = client.get_authenticated(&path).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
+            Ok(Python::with_gil(|py| result.to_string().into_py(py)))
+        })
+    }
 }
 
 #[pymethods]
 impl PyHttpClient {
     #[new]
-    fn new(config: &PyParadexConfig) -> Self {
+    #[pyo3(signature = (config, native=false))]
+    fn new(config: &PyParadexConfig, native: bool) -> Self {
         Self {
             client: crate::http::HttpClient::new(config.config.clone()),
+            native,
         }
     }
 
+    #[getter]
+    fn native(&self) -> bool {
+        self.native
+    }
+
     fn get_system_time<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
         let client = self.client.clone();
         future_into_py(py, async move {
@@ -33,49 +63,31 @@ impl PyHttpClient {
     }
 
     fn get_markets<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
-        future_into_py(py, async move {
-            let result = client.get_authenticated("/v1/markets").await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
-            Ok(result.to_string())
-        })
+        self.get(py, "/v1/markets".to_string())
+    }
+
+    fn get_market<'py>(&self, py: Python<'py>, symbol: String) -> PyResult<&'py PyAny> {
+        self.get(py, format!("/v1/markets?market={}", symbol))
+    }
+
+    fn get_markets_summary<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        self.get(py, "/v1/markets/summary?market=ALL".to_string())
     }
 
     fn get_open_orders<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
-        future_into_py(py, async move {
-            let result = client.get_authenticated("/v1/orders").await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
-            Ok(result.to_string())
-        })
+        self.get(py, "/v1/orders".to_string())
     }
 
     fn get_fills<'py>(&self, py: Python<'py>, start_time: u64) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
-        future_into_py(py, async move {
-            let path = format!("/v1/fills?start_at={}", start_time);
-            let result = client.get_authenticated(&path).await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
-            Ok(result.to_string())
-        })
+        self.get(py, format!("/v1/fills?start_at={}", start_time))
     }
 
     fn get_positions<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
-        future_into_py(py, async move {
-            let result = client.get_authenticated("/v1/positions").await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
-            Ok(result.to_string())
-        })
+        self.get(py, "/v1/positions".to_string())
     }
 
     fn get_account<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
-        let client = self.client.clone();
-        future_into_py(py, async move {
-            let result = client.get_authenticated("/v1/account").await
-                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
-            Ok(result.to_string())
-        })
+        self.get(py, "/v1/account".to_string())
     }
 
     fn get_orderbook<'py>(&self, py: Python<'py>, instrument_id: String) -> PyResult<&'py PyAny> {
@@ -99,6 +111,39 @@ impl PyHttpClient {
             Ok(json)
         })
     }
+
+    fn get_trades_page<'py>(
+        &self,
+        py: Python<'py>,
+        market: String,
+        start_at: u64,
+        end_at: u64,
+        page_size: u32,
+        cursor: Option<String>,
+    ) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let result = client.get_trades_page(&market, start_at, end_at, page_size, cursor.as_deref()).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
+            Ok(result.to_string())
+        })
+    }
+
+    fn get_klines<'py>(
+        &self,
+        py: Python<'py>,
+        symbol: String,
+        resolution: u32,
+        start_at: u64,
+        end_at: u64,
+    ) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            let result = client.get_klines(&symbol, resolution, start_at, end_at).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))?;
+            Ok(result.to_string())
+        })
+    }
     
     fn submit_order<'py>(
         &self,
@@ -138,6 +183,7 @@ impl PyHttpClient {
 pub struct PySimpleWebSocketClient {
     client: Arc<crate::websocket::SimpleWebSocketClient>,
     runtime: Arc<tokio::runtime::Runtime>,
+    frame_queue: parking_lot::Mutex<Option<Arc<crate::websocket::FrameQueue>>>,
 }
 
 #[pymethods]
@@ -150,6 +196,7 @@ impl PySimpleWebSocketClient {
         Self {
             client: Arc::new(client),
             runtime: Arc::new(runtime),
+            frame_queue: parking_lot::Mutex::new(None),
         }
     }
     
@@ -179,6 +226,97 @@ impl PySimpleWebSocketClient {
         });
     }
     
+    /// Register a callback receiving the raw JSON text of every channel update
+    fn on_message(&self, callback: PyObject) {
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_message_callback(move |text| {
+                Python::with_gil(|py| {
+                    let _ = callback.call1(py, (text,));
+                });
+            }).await;
+        });
+    }
+
+    /// Buffer channel frames in a bounded queue drained with `drain`
+    ///
+    /// `policies` maps channel prefix to "drop_oldest", "conflate" or "block"
+    /// (the default). `wakeup` is called without arguments from the reader
+    /// thread whenever the queue becomes non-empty after a drain.
+    fn enable_queue(
+        &self,
+        capacity: usize,
+        policies: HashMap<String, String>,
+        wakeup: PyObject,
+    ) -> PyResult<()> {
+        let queue = build_frame_queue(capacity, policies, wakeup)?;
+        *self.frame_queue.lock() = Some(queue.clone());
+
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_frame_queue(queue).await;
+        });
+        Ok(())
+    }
+
+    /// Record raw frames to zstd segment files under `directory`
+    #[pyo3(signature = (directory, segment_bytes=256 * 1024 * 1024))]
+    fn enable_recording(&self, directory: String, segment_bytes: u64) -> PyResult<()> {
+        let recorder = start_recorder(directory, segment_bytes)?;
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_recorder(Some(recorder)).await;
+        });
+        Ok(())
+    }
+
+    /// Stop recording, flushing buffered frames
+    fn disable_recording(&self) {
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_recorder(None).await;
+        });
+    }
+
+    /// Pop up to `max_frames` (ts_recv_ns, raw frame) pairs from the queue
+    fn drain(&self, max_frames: usize) -> Vec<(u64, String)> {
+        match self.frame_queue.lock().as_ref() {
+            Some(queue) => queue.drain(max_frames),
+            None => Vec::new(),
+        }
+    }
+
+    /// Queue depth and overflow counters per channel prefix
+    fn queue_stats(&self) -> HashMap<String, HashMap<String, u64>> {
+        let Some(queue) = self.frame_queue.lock().clone() else {
+            return HashMap::new();
+        };
+        queue_stats_dict(&queue)
+    }
+
+    /// Throughput of the connection, as a single-element list
+    fn connection_stats(&self) -> Vec<HashMap<String, f64>> {
+        let (frames, bytes) = self.client.throughput();
+        let channels = self.runtime.block_on(self.client.subscriptions()).len();
+        vec![connection_stats_dict(frames, bytes, channels, 0.0)]
+    }
+
+    fn subscribe<'py>(&self, py: Python<'py>, channel: String) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.subscribe(channel).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+
+    fn unsubscribe<'py>(&self, py: Python<'py>, channel: String) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.unsubscribe(channel).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+
     fn connect<'py>(&self, py: Python<'py>, channels: Vec<String>) -> PyResult<&'py PyAny> {
         let client = self.client.clone();
         future_into_py(py, async move {
@@ -186,6 +324,241 @@ impl PySimpleWebSocketClient {
                 .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
         })
     }
+
+    fn disconnect<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.close().await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+}
+
+/// Python wrapper for ShardedWebSocketClient
+///
+/// Same interface as PySimpleWebSocketClient, over `connections` sockets.
+#[pyclass]
+pub struct PyShardedWebSocketClient {
+    client: Arc<crate::websocket::ShardedWebSocketClient>,
+    runtime: Arc<tokio::runtime::Runtime>,
+    frame_queue: parking_lot::Mutex<Option<Arc<crate::websocket::FrameQueue>>>,
+}
+
+#[pymethods]
+impl PyShardedWebSocketClient {
+    #[new]
+    #[pyo3(signature = (config, connections=4, hot_ratio=2.0, rebalance_interval_secs=30))]
+    fn new(config: &PyParadexConfig, connections: usize, hot_ratio: f64, rebalance_interval_secs: u64) -> Self {
+        let client = crate::websocket::ShardedWebSocketClient::new(
+            config.config.clone(),
+            connections,
+            hot_ratio,
+            tokio::time::Duration::from_secs(rebalance_interval_secs.max(1)),
+        );
+        Self {
+            client: Arc::new(client),
+            runtime: Arc::new(tokio::runtime::Runtime::new().unwrap()),
+            frame_queue: parking_lot::Mutex::new(None),
+        }
+    }
+
+    /// Buffer frames from every connection in one bounded queue drained with `drain`
+    fn enable_queue(
+        &self,
+        capacity: usize,
+        policies: HashMap<String, String>,
+        wakeup: PyObject,
+    ) -> PyResult<()> {
+        let queue = build_frame_queue(capacity, policies, wakeup)?;
+        *self.frame_queue.lock() = Some(queue.clone());
+
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_frame_queue(queue).await;
+        });
+        Ok(())
+    }
+
+    /// Record raw frames from every connection to zstd segment files under `directory`
+    #[pyo3(signature = (directory, segment_bytes=256 * 1024 * 1024))]
+    fn enable_recording(&self, directory: String, segment_bytes: u64) -> PyResult<()> {
+        let recorder = start_recorder(directory, segment_bytes)?;
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_recorder(Some(recorder)).await;
+        });
+        Ok(())
+    }
+
+    /// Stop recording, flushing buffered frames
+    fn disable_recording(&self) {
+        let client = self.client.clone();
+        self.runtime.block_on(async move {
+            client.set_recorder(None).await;
+        });
+    }
+
+    /// Pop up to `max_frames` (ts_recv_ns, raw frame) pairs from the queue
+    fn drain(&self, max_frames: usize) -> Vec<(u64, String)> {
+        match self.frame_queue.lock().as_ref() {
+            Some(queue) => queue.drain(max_frames),
+            None => Vec::new(),
+        }
+    }
+
+    /// Queue depth and overflow counters per channel prefix
+    fn queue_stats(&self) -> HashMap<String, HashMap<String, u64>> {
+        match self.frame_queue.lock().clone() {
+            Some(queue) => queue_stats_dict(&queue),
+            None => HashMap::new(),
+        }
+    }
+
+    /// Frames, bytes, channels and recent frames/sec per connection
+    fn connection_stats(&self) -> Vec<HashMap<String, f64>> {
+        self.client
+            .stats()
+            .into_iter()
+            .map(|s| connection_stats_dict(s.frames, s.bytes, s.channels, s.frames_per_sec))
+            .collect()
+    }
+
+    /// Connection index serving `channel`
+    fn shard_for(&self, channel: &str) -> usize {
+        self.client.shard_for(channel)
+    }
+
+    fn subscribe<'py>(&self, py: Python<'py>, channel: String) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.subscribe(channel).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+
+    fn unsubscribe<'py>(&self, py: Python<'py>, channel: String) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.unsubscribe(channel).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+
+    fn connect<'py>(&self, py: Python<'py>, channels: Vec<String>) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.connect_and_subscribe(channels).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+
+    fn disconnect<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        let client = self.client.clone();
+        future_into_py(py, async move {
+            client.close().await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{:?}", e)))
+        })
+    }
+}
+
+/// Replays a recording through the same queue/drain interface as PySimpleWebSocketClient
+///
+/// Drop-in `ws_client` for `ParadexDataClient`: `connect` replays the
+/// recorded frames into the queue instead of opening a socket. `speed` is
+/// 1.0 for real time, N for N times faster and 0 for as fast as possible.
+#[pyclass]
+pub struct PyReplayWebSocketClient {
+    replayer: Arc<crate::websocket::FrameReplayer>,
+    frame_queue: parking_lot::Mutex<Option<Arc<crate::websocket::FrameQueue>>>,
+}
+
+#[pymethods]
+impl PyReplayWebSocketClient {
+    #[new]
+    #[pyo3(signature = (directory, speed=1.0, start_ns=0, end_ns=0))]
+    fn new(directory: String, speed: f64, start_ns: u64, end_ns: u64) -> Self {
+        let replayer = crate::websocket::FrameReplayer::new(
+            directory.into(),
+            crate::websocket::ReplaySpeed::from_factor(speed),
+            start_ns,
+            end_ns,
+        );
+        Self {
+            replayer: Arc::new(replayer),
+            frame_queue: parking_lot::Mutex::new(None),
+        }
+    }
+
+    /// Buffer replayed frames in a bounded queue drained with `drain`
+    fn enable_queue(
+        &self,
+        capacity: usize,
+        policies: HashMap<String, String>,
+        wakeup: PyObject,
+    ) -> PyResult<()> {
+        *self.frame_queue.lock() = Some(build_frame_queue(capacity, policies, wakeup)?);
+        Ok(())
+    }
+
+    /// Pop up to `max_frames` (ts_recv_ns, raw frame) pairs from the queue
+    fn drain(&self, max_frames: usize) -> Vec<(u64, String)> {
+        match self.frame_queue.lock().as_ref() {
+            Some(queue) => queue.drain(max_frames),
+            None => Vec::new(),
+        }
+    }
+
+    /// Queue depth and overflow counters per channel prefix
+    fn queue_stats(&self) -> HashMap<String, HashMap<String, u64>> {
+        match self.frame_queue.lock().clone() {
+            Some(queue) => queue_stats_dict(&queue),
+            None => HashMap::new(),
+        }
+    }
+
+    /// No live connections during replay
+    fn connection_stats(&self) -> Vec<HashMap<String, f64>> {
+        Vec::new()
+    }
+
+    /// Frames and bytes replayed, elapsed wall time and worst lag behind schedule
+    fn replay_stats(&self) -> HashMap<String, u64> {
+        let stats = &self.replayer.stats;
+        let mut counters = HashMap::new();
+        counters.insert("frames".to_string(), stats.frames.load(std::sync::atomic::Ordering::Relaxed));
+        counters.insert("bytes".to_string(), stats.bytes.load(std::sync::atomic::Ordering::Relaxed));
+        counters.insert("skipped".to_string(), stats.skipped.load(std::sync::atomic::Ordering::Relaxed));
+        counters.insert("elapsed_ns".to_string(), stats.elapsed_ns.load(std::sync::atomic::Ordering::Relaxed));
+        counters.insert("max_lag_ns".to_string(), stats.max_lag_ns.load(std::sync::atomic::Ordering::Relaxed));
+        counters
+    }
+
+    /// Recordings already contain their channels; accepted for interface parity
+    fn subscribe<'py>(&self, py: Python<'py>, _channel: String) -> PyResult<&'py PyAny> {
+        future_into_py(py, async move { Ok(()) })
+    }
+
+    /// Recordings already contain their channels; accepted for interface parity
+    fn unsubscribe<'py>(&self, py: Python<'py>, _channel: String) -> PyResult<&'py PyAny> {
+        future_into_py(py, async move { Ok(()) })
+    }
+
+    /// Replay the recording, completing once every frame has been queued
+    fn connect<'py>(&self, py: Python<'py>, _channels: Vec<String>) -> PyResult<&'py PyAny> {
+        let replayer = self.replayer.clone();
+        let queue = self.frame_queue.lock().clone().ok_or_else(|| {
+            pyo3::exceptions::PyRuntimeError::new_err("enable_queue must be called before connect")
+        })?;
+        future_into_py(py, async move {
+            replayer.run(queue).await
+                .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e)))
+        })
+    }
+
+    fn disconnect<'py>(&self, py: Python<'py>) -> PyResult<&'py PyAny> {
+        self.replayer.stop();
+        future_into_py(py, async move { Ok(()) })
+    }
 }
 
 /// Python wrapper for WebSocketClient
@@ -446,6 +819,22 @@ impl PyParadexWebSocket {
         })
     }
 
+    /// Record raw frames to zstd segment files under `directory` (call after connect)
+    #[pyo3(signature = (directory, segment_bytes=256 * 1024 * 1024))]
+    fn enable_recording(&self, directory: String, segment_bytes: u64) -> PyResult<()> {
+        let recorder = start_recorder(directory, segment_bytes)?;
+        let ws = self.ws.clone();
+        self.runtime.block_on(async move {
+            match ws.lock().await.as_ref() {
+                Some(client) => {
+                    client.set_recorder(Some(recorder));
+                    Ok(())
+                }
+                None => Err(pyo3::exceptions::PyRuntimeError::new_err("Not connected")),
+            }
+        })
+    }
+
     fn close(&self) -> PyResult<()> {
         let ws = self.ws.clone();
         self.runtime.block_on(async move {
@@ -459,3 +848,57 @@ impl PyParadexWebSocket {
         })
     }
 }
+
+fn start_recorder(directory: String, segment_bytes: u64) -> PyResult<Arc<crate::websocket::FrameRecorder>> {
+    let mut config = crate::websocket::RecorderConfig::new(directory.into());
+    config.segment_bytes = segment_bytes;
+    crate::websocket::FrameRecorder::start(config)
+        .map(Arc::new)
+        .map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(format!("{}", e)))
+}
+
+fn build_frame_queue(
+    capacity: usize,
+    policies: HashMap<String, String>,
+    wakeup: PyObject,
+) -> PyResult<Arc<crate::websocket::FrameQueue>> {
+    let policies = policies
+        .into_iter()
+        .map(|(prefix, policy)| Ok((prefix, policy.parse()?)))
+        .collect::<crate::error::Result<HashMap<_, _>>>()
+        .map_err(|e| pyo3::exceptions::PyValueError::new_err(format!("{}", e)))?;
+
+    Ok(Arc::new(crate::websocket::FrameQueue::new(
+        capacity,
+        policies,
+        Arc::new(move || {
+            Python::with_gil(|py| {
+                let _ = wakeup.call0(py);
+            });
+        }),
+    )))
+}
+
+fn queue_stats_dict(queue: &crate::websocket::FrameQueue) -> HashMap<String, HashMap<String, u64>> {
+    queue
+        .stats()
+        .into_iter()
+        .map(|(prefix, stats)| {
+            let mut counters = HashMap::new();
+            counters.insert("depth".to_string(), stats.depth as u64);
+            counters.insert("dropped".to_string(), stats.dropped);
+            counters.insert("conflated".to_string(), stats.conflated);
+            counters.insert("blocked".to_string(), stats.blocked);
+            (prefix, counters)
+        })
+        .collect()
+}
+
+fn connection_stats_dict(frames: u64, bytes: u64, channels: usize, frames_per_sec: f64) -> HashMap<String, f64> {
+    let mut counters = HashMap::new();
+    counters.insert("frames".to_string(), frames as f64);
+    counters.insert("bytes".to_string(), bytes as f64);
+    counters.insert("channels".to_string(), channels as f64);
+    counters.insert("frames_per_sec".to_string(), frames_per_sec);
+    counters
+}
@@ -2,11 +2,47 @@
 //! Wrapper around paradex-py SDK for correct EIP-712 implementation
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyModule};
+use pyo3::types::{PyDict, PyList, PyModule};
 use crate::config::ParadexConfig;
 use crate::error::Result;
 use serde_json::Value;
 
+/// Arguments for an SDK ``api_client`` fetch method
+#[derive(Debug, PartialEq)]
+pub enum ApiArgs<'a> {
+    None,
+    Market(&'a str),
+    StartAt(u64),
+}
+
+/// Convert a JSON value to Python objects (dicts, lists, str, int, float, bool, None)
+pub fn value_to_py(py: Python<'_>, value: &Value) -> PyResult<PyObject> {
+    Ok(match value {
+        Value::Null => py.None(),
+        Value::Bool(b) => b.to_object(py),
+        Value::Number(n) => match (n.as_i64(), n.as_u64()) {
+            (Some(i), _) => i.to_object(py),
+            (None, Some(u)) => u.to_object(py),
+            _ => n.as_f64().unwrap_or(f64::NAN).to_object(py),
+        },
+        Value::String(s) => s.to_object(py),
+        Value::Array(items) => {
+            let list = PyList::empty(py);
+            for item in items {
+                list.append(value_to_py(py, item)?)?;
+            }
+            list.to_object(py)
+        }
+        Value::Object(map) => {
+            let dict = PyDict::new(py);
+            for (key, item) in map {
+                dict.set_item(key, value_to_py(py, item)?)?;
+            }
+            dict.to_object(py)
+        }
+    })
+}
+
 /// Python SDK wrapper for Paradex
 pub struct ParadexPyWrapper {
     py_client: PyObject,
@@ -37,6 +73,47 @@ impl ParadexPyWrapper {
         })
     }
     
+    /// Call an SDK ``api_client`` fetch method and return its result as-is
+    ///
+    /// The SDK already returns Python objects, so this skips the ``json.dumps``
+    /// and ``serde_json`` round trip of the ``fetch_*`` methods for callers that
+    /// hand the result straight back to Python.
+    pub fn fetch_object(&self, method: &str, args: ApiArgs<'_>) -> Result<PyObject> {
+        Python::with_gil(|py| {
+            let api_client = self.py_client.getattr(py, "api_client")
+                .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?;
+            let result = match args {
+                ApiArgs::None => api_client.call_method0(py, method),
+                ApiArgs::Market(market) => api_client.call_method1(py, method, (market,)),
+                ApiArgs::StartAt(start_time) => {
+                    let params = PyDict::new(py);
+                    params.set_item("start_at", start_time)
+                        .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?;
+                    api_client.call_method1(py, method, (params,))
+                }
+            };
+            result.map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))
+        })
+    }
+
+    /// Call an SDK ``api_client`` fetch method and return its result as JSON
+    pub fn fetch_value(&self, method: &str, args: ApiArgs<'_>) -> Result<Value> {
+        let result = self.fetch_object(method, args)?;
+        Python::with_gil(|py| {
+            let json_module = PyModule::import(py, "json")
+                .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?;
+            let json_str = json_module.getattr("dumps")
+                .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?
+                .call1((result,))
+                .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?
+                .extract::<String>()
+                .map_err(|e| crate::error::ParadexError::Python(format!("{}", e)))?;
+            
+            serde_json::from_str(&json_str)
+                .map_err(|e| crate::error::ParadexError::Parse(format!("{}", e)))
+        })
+    }
+
     /// Fetch markets
     pub fn fetch_markets(&self) -> Result<Value> {
         Python::with_gil(|py| {
@@ -31,6 +31,7 @@ struct JsonRpcResponse {
 pub struct ParadexWebSocket {
     ws: Arc<Mutex<WsStream>>,
     message_id: AtomicU64,
+    recorder: parking_lot::Mutex<Option<Arc<crate::websocket::FrameRecorder>>>,
 }
 
 impl ParadexWebSocket {
@@ -42,9 +43,15 @@ impl ParadexWebSocket {
         Ok(Self {
             ws: Arc::new(Mutex::new(ws)),
             message_id: AtomicU64::new(0),
+            recorder: parking_lot::Mutex::new(None),
         })
     }
 
+    /// Tap every received text frame into a recorder (None stops recording)
+    pub fn set_recorder(&self, recorder: Option<Arc<crate::websocket::FrameRecorder>>) {
+        *self.recorder.lock() = recorder;
+    }
+
     fn next_id(&self) -> u64 {
         self.message_id.fetch_add(1, Ordering::SeqCst)
     }
@@ -87,6 +94,9 @@ impl ParadexWebSocket {
                 let msg = msg?;
                 match msg {
                     Message::Text(text) => {
+                        if let Some(recorder) = self.recorder.lock().as_ref() {
+                            recorder.record(&text);
+                        }
                         let value: Value = serde_json::from_str(&text)?;
                         return Ok(Some(value));
                     }
@@ -3,9 +3,25 @@
 pub mod client;
 pub mod handlers;
 pub mod jsonrpc_client;
+pub mod queue;
+pub mod recorder;
+pub mod replay;
+pub mod sharded_client;
 pub mod simple_client;
 
 pub use client::WebSocketClient;
 pub use jsonrpc_client::ParadexWebSocket;
 pub use handlers::MessageHandler;
+pub use queue::{FrameQueue, OverflowPolicy};
+pub use recorder::{FrameRecorder, RecorderConfig};
+pub use replay::{FrameReplayer, ReplaySpeed};
+pub use sharded_client::ShardedWebSocketClient;
 pub use simple_client::SimpleWebSocketClient;
+
+/// Wall-clock time in UNIX nanoseconds, the receive timestamp of queued frames
+pub(crate) fn unix_nanos_now() -> u64 {
+    std::time::SystemTime::now()
+        .duration_since(std::time::UNIX_EPOCH)
+        .map(|d| d.as_nanos() as u64)
+        .unwrap_or(0)
+}
@@ -0,0 +1,346 @@
+// crates/adapters/paradex/src/websocket/queue.rs
+//! Bounded frame queue between the WebSocket reader and the Python event loop
+
+use crossbeam_queue::ArrayQueue;
+use dashmap::DashMap;
+use serde::Deserialize;
+use std::borrow::Cow;
+use std::collections::HashMap;
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::Arc;
+use tokio::time::Duration;
+
+use crate::error::{ParadexError, Result};
+
+/// A queued frame with its local receive time (UNIX ns)
+pub type TimedFrame = (u64, String);
+
+/// Callback fired when the queue goes from drained to non-empty
+pub type WakeupCallback = Arc<dyn Fn() + Send + Sync>;
+
+/// What to do with a new frame when a channel queue is full
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+pub enum OverflowPolicy {
+    /// Evict the oldest queued frame
+    DropOldest,
+    /// Keep only the latest frame per channel and market
+    Conflate,
+    /// Hold the socket reader until the consumer makes room
+    Block,
+}
+
+impl std::str::FromStr for OverflowPolicy {
+    type Err = ParadexError;
+
+    fn from_str(s: &str) -> Result<Self> {
+        match s {
+            "drop_oldest" => Ok(Self::DropOldest),
+            "conflate" => Ok(Self::Conflate),
+            "block" => Ok(Self::Block),
+            _ => Err(ParadexError::Config(format!("Unknown overflow policy: {}", s))),
+        }
+    }
+}
+
+/// Counters for one channel queue
+#[derive(Debug, Clone, Default)]
+pub struct QueueStats {
+    pub depth: usize,
+    pub dropped: u64,
+    pub conflated: u64,
+    pub blocked: u64,
+}
+
+/// Queue for all channels sharing a prefix (e.g. `orderbook`)
+struct ChannelQueue {
+    policy: OverflowPolicy,
+    frames: ArrayQueue<TimedFrame>,
+    // Conflate only: `frames` holds conflation keys, `latest` the newest frame per key
+    latest: DashMap<String, TimedFrame>,
+    dropped: AtomicU64,
+    conflated: AtomicU64,
+    blocked: AtomicU64,
+}
+
+impl ChannelQueue {
+    fn new(policy: OverflowPolicy, capacity: usize) -> Self {
+        Self {
+            policy,
+            frames: ArrayQueue::new(capacity),
+            latest: DashMap::new(),
+            dropped: AtomicU64::new(0),
+            conflated: AtomicU64::new(0),
+            blocked: AtomicU64::new(0),
+        }
+    }
+
+    async fn push(&self, channel: &str, frame: TimedFrame) {
+        match self.policy {
+            OverflowPolicy::DropOldest => {
+                if self.frames.force_push(frame).is_some() {
+                    self.dropped.fetch_add(1, Ordering::Relaxed);
+                }
+            }
+            OverflowPolicy::Conflate => {
+                let key = conflation_key(channel, &frame.1);
+                if self.latest.insert(key.clone(), frame).is_some() {
+                    self.conflated.fetch_add(1, Ordering::Relaxed);
+                } else if self.frames.push((0, key.clone())).is_err() {
+                    self.latest.remove(&key);
+                    self.dropped.fetch_add(1, Ordering::Relaxed);
+                }
+            }
+            OverflowPolicy::Block => {
+                let mut frame = frame;
+                let mut waited = false;
+                while let Err(rejected) = self.frames.push(frame) {
+                    frame = rejected;
+                    waited = true;
+                    tokio::time::sleep(Duration::from_micros(100)).await;
+                }
+                if waited {
+                    self.blocked.fetch_add(1, Ordering::Relaxed);
+                }
+            }
+        }
+    }
+
+    fn pop(&self) -> Option<TimedFrame> {
+        let item = self.frames.pop()?;
+        match self.policy {
+            OverflowPolicy::Conflate => self.latest.remove(&item.1).map(|(_, frame)| frame),
+            _ => Some(item),
+        }
+    }
+
+    fn stats(&self) -> QueueStats {
+        QueueStats {
+            depth: self.frames.len(),
+            dropped: self.dropped.load(Ordering::Relaxed),
+            conflated: self.conflated.load(Ordering::Relaxed),
+            blocked: self.blocked.load(Ordering::Relaxed),
+        }
+    }
+}
+
+/// The fields of a channel frame that identify its market
+#[derive(Deserialize)]
+struct KeyFrame<'a> {
+    #[serde(borrow)]
+    params: Option<KeyParams<'a>>,
+}
+
+#[derive(Deserialize)]
+struct KeyParams<'a> {
+    #[serde(borrow)]
+    data: Option<KeyData<'a>>,
+}
+
+#[derive(Deserialize)]
+struct KeyData<'a> {
+    #[serde(borrow)]
+    market: Option<Cow<'a, str>>,
+    // markets_summary frames name the market `symbol`
+    #[serde(borrow)]
+    symbol: Option<Cow<'a, str>>,
+}
+
+/// Key a frame by channel and its `params.data.market` (or `.symbol`), if any
+///
+/// Aggregate channels such as `markets_summary.ALL` carry every market, so
+/// keying by channel alone would conflate one market's update into another's.
+fn conflation_key(channel: &str, frame: &str) -> String {
+    let data = serde_json::from_str::<KeyFrame>(frame)
+        .ok()
+        .and_then(|f| f.params)
+        .and_then(|p| p.data);
+    match data.and_then(|d| d.market.or(d.symbol)) {
+        Some(market) => format!("{}|{}", channel, market),
+        None => channel.to_string(),
+    }
+}
+
+/// Bounded lock-free frame queue with per-channel overflow policies
+///
+/// The reader pushes raw frames without touching Python. The consumer is
+/// woken once per batch (not per frame) and drains with `drain`.
+pub struct FrameQueue {
+    queues: HashMap<String, ChannelQueue>,
+    default_queue: ChannelQueue,
+    notified: AtomicBool,
+    wakeup: WakeupCallback,
+}
+
+impl FrameQueue {
+    /// Create a queue; `policies` maps channel prefix to policy, others use Block
+    pub fn new(
+        capacity: usize,
+        policies: HashMap<String, OverflowPolicy>,
+        wakeup: WakeupCallback,
+    ) -> Self {
+        let queues = policies
+            .into_iter()
+            .map(|(prefix, policy)| (prefix, ChannelQueue::new(policy, capacity)))
+            .collect();
+
+        Self {
+            queues,
+            default_queue: ChannelQueue::new(OverflowPolicy::Block, capacity),
+            notified: AtomicBool::new(false),
+            wakeup,
+        }
+    }
+
+    fn queue_for(&self, channel: &str) -> &ChannelQueue {
+        let prefix = channel.split('.').next().unwrap_or(channel);
+        self.queues.get(prefix).unwrap_or(&self.default_queue)
+    }
+
+    /// Push a raw frame received on `channel` at `ts_recv` (UNIX ns)
+    pub async fn push(&self, channel: &str, ts_recv: u64, frame: String) {
+        self.queue_for(channel).push(channel, (ts_recv, frame)).await;
+        if !self.notified.swap(true, Ordering::AcqRel) {
+            (self.wakeup)();
+        }
+    }
+
+    /// Pop up to `max_frames` (ts_recv, frame) pairs, round-robin across channel queues
+    pub fn drain(&self, max_frames: usize) -> Vec<TimedFrame> {
+        // Re-arm before popping so a push racing with this drain still wakes the consumer
+        self.notified.store(false, Ordering::Release);
+
+        let mut frames = Vec::with_capacity(max_frames.min(self.len()));
+        let queues: Vec<&ChannelQueue> = self
+            .queues
+            .values()
+            .chain(std::iter::once(&self.default_queue))
+            .collect();
+
+        while frames.len() < max_frames {
+            let mut popped = false;
+            for queue in queues.iter() {
+                if let Some(frame) = queue.pop() {
+                    frames.push(frame);
+                    popped = true;
+                    if frames.len() == max_frames {
+                        break;
+                    }
+                }
+            }
+            if !popped {
+                break;
+            }
+        }
+        frames
+    }
+
+    /// Total queued frames across all channels
+    pub fn len(&self) -> usize {
+        self.queues.values().map(|q| q.frames.len()).sum::<usize>() + self.default_queue.frames.len()
+    }
+
+    /// Per-prefix counters (the default queue is reported as `*`)
+    pub fn stats(&self) -> HashMap<String, QueueStats> {
+        let mut stats: HashMap<String, QueueStats> = self
+            .queues
+            .iter()
+            .map(|(prefix, q)| (prefix.clone(), q.stats()))
+            .collect();
+        stats.insert("*".to_string(), self.default_queue.stats());
+        stats
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn queue(policy: OverflowPolicy, capacity: usize) -> FrameQueue {
+        let mut policies = HashMap::new();
+        policies.insert("trades".to_string(), policy);
+        FrameQueue::new(capacity, policies, Arc::new(|| {}))
+    }
+
+    #[tokio::test]
+    async fn test_drop_oldest_keeps_newest_frames() {
+        let q = queue(OverflowPolicy::DropOldest, 2);
+        for i in 0..3 {
+            q.push("trades.BTC-USD-PERP", i, i.to_string()).await;
+        }
+        assert_eq!(q.drain(10), vec![(1, "1".to_string()), (2, "2".to_string())]);
+        assert_eq!(q.stats()["trades"].dropped, 1);
+    }
+
+    #[tokio::test]
+    async fn test_conflate_keeps_latest_per_channel() {
+        let q = queue(OverflowPolicy::Conflate, 8);
+        q.push("trades.BTC-USD-PERP", 1, "a".to_string()).await;
+        q.push("trades.ETH-USD-PERP", 2, "b".to_string()).await;
+        q.push("trades.BTC-USD-PERP", 3, "c".to_string()).await;
+        assert_eq!(q.drain(10), vec![(3, "c".to_string()), (2, "b".to_string())]);
+        assert_eq!(q.stats()["trades"].conflated, 1);
+    }
+
+    fn summary_frame(symbol: &str, mark_price: &str) -> String {
+        serde_json::json!({
+            "jsonrpc": "2.0",
+            "method": "subscription",
+            "params": {
+                "channel": "markets_summary.ALL",
+                "data": {
+                    "symbol": symbol,
+                    "mark_price": mark_price,
+                    "funding_rate": "0.0001",
+                    "created_at": 1700000000000u64,
+                },
+            },
+        })
+        .to_string()
+    }
+
+    #[tokio::test]
+    async fn test_conflate_keeps_each_market_on_aggregate_channel() {
+        let mut policies = HashMap::new();
+        policies.insert("markets_summary".to_string(), OverflowPolicy::Conflate);
+        let q = FrameQueue::new(8, policies, Arc::new(|| {}));
+        let btc = summary_frame("BTC-USD-PERP", "95000.5");
+        let eth = summary_frame("ETH-USD-PERP", "3500.1");
+        let btc_newer = summary_frame("BTC-USD-PERP", "95001.0");
+        q.push("markets_summary.ALL", 1, btc).await;
+        q.push("markets_summary.ALL", 2, eth.clone()).await;
+        q.push("markets_summary.ALL", 3, btc_newer.clone()).await;
+        assert_eq!(q.drain(10), vec![(3, btc_newer), (2, eth)]);
+        assert_eq!(q.stats()["markets_summary"].conflated, 1);
+    }
+
+    #[test]
+    fn test_conflation_key_reads_market_or_symbol() {
+        let trade = r#"{"params":{"channel":"trades.ALL","data":{"market":"ETH-USD-PERP","id":"1"}}}"#;
+        assert_eq!(conflation_key("trades.ALL", trade), "trades.ALL|ETH-USD-PERP");
+        assert_eq!(
+            conflation_key("markets_summary.ALL", &summary_frame("BTC-USD-PERP", "1")),
+            "markets_summary.ALL|BTC-USD-PERP"
+        );
+        assert_eq!(conflation_key("bbo.BTC-USD-PERP", "not json"), "bbo.BTC-USD-PERP");
+    }
+
+    #[tokio::test]
+    async fn test_wakeup_fires_once_per_drain() {
+        let count = Arc::new(AtomicU64::new(0));
+        let counter = count.clone();
+        let q = FrameQueue::new(
+            8,
+            HashMap::new(),
+            Arc::new(move || {
+                counter.fetch_add(1, Ordering::Relaxed);
+            }),
+        );
+        q.push("orderbook.BTC-USD-PERP", 0, "a".to_string()).await;
+        q.push("orderbook.BTC-USD-PERP", 0, "b".to_string()).await;
+        assert_eq!(count.load(Ordering::Relaxed), 1);
+
+        q.drain(10);
+        q.push("orderbook.BTC-USD-PERP", 0, "c".to_string()).await;
+        assert_eq!(count.load(Ordering::Relaxed), 2);
+    }
+}
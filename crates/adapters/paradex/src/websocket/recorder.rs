@@ -0,0 +1,250 @@
+// crates/adapters/paradex/src/websocket/recorder.rs
+//! Raw WebSocket frame recorder with compressed append-only segment files
+//!
+//! Layout of a recording directory:
+//!
+//! - `<first_ts_ns>.seg.zst`: segment made of independent zstd frames (blocks).
+//!   Each decompressed block is a run of records `[ts_ns: u64 LE][len: u32 LE][frame bytes]`.
+//! - `index.txt`: one line per block, `first_ts last_ts segment offset length frames`,
+//!   so replay can seek by time to a block without decompressing earlier data.
+
+use std::fs::{File, OpenOptions};
+use std::io::Write;
+use std::path::PathBuf;
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::mpsc::{sync_channel, RecvTimeoutError, SyncSender, TrySendError};
+use std::thread::JoinHandle;
+use std::time::Duration;
+
+use tracing::{error, info};
+
+use crate::error::{ParadexError, Result};
+use crate::websocket::unix_nanos_now;
+
+/// Recorder settings
+#[derive(Debug, Clone)]
+pub struct RecorderConfig {
+    /// Directory receiving segments and the index
+    pub directory: PathBuf,
+    /// Rotate to a new segment once it reaches this size
+    pub segment_bytes: u64,
+    /// Records per compressed block
+    pub block_frames: usize,
+    /// Flush a partial block after this long
+    pub flush_interval: Duration,
+    /// zstd compression level
+    pub compression_level: i32,
+    /// Frames buffered between the reader and the writer thread
+    pub channel_capacity: usize,
+}
+
+impl RecorderConfig {
+    pub fn new(directory: PathBuf) -> Self {
+        Self {
+            directory,
+            segment_bytes: 256 * 1024 * 1024,
+            block_frames: 1024,
+            flush_interval: Duration::from_secs(1),
+            compression_level: 3,
+            channel_capacity: 65_536,
+        }
+    }
+}
+
+/// Records raw frames on a background writer thread
+///
+/// `record` only timestamps the frame and hands it to a bounded channel; if the
+/// writer falls behind, frames are dropped and counted rather than stalling
+/// the socket reader.
+pub struct FrameRecorder {
+    sender: Option<SyncSender<(u64, String)>>,
+    recorded: AtomicU64,
+    dropped: AtomicU64,
+    writer: Option<JoinHandle<()>>,
+}
+
+impl FrameRecorder {
+    /// Create the directory and start the writer thread
+    pub fn start(config: RecorderConfig) -> Result<Self> {
+        std::fs::create_dir_all(&config.directory)
+            .map_err(|e| ParadexError::Config(format!("Cannot create recording directory: {}", e)))?;
+
+        let (sender, receiver) = sync_channel::<(u64, String)>(config.channel_capacity);
+        info!("Recording WebSocket frames to {:?}", config.directory);
+
+        let writer = std::thread::Builder::new()
+            .name("paradex-ws-recorder".to_string())
+            .spawn(move || {
+                let mut writer = SegmentWriter::new(config);
+                loop {
+                    match receiver.recv_timeout(writer.config.flush_interval) {
+                        Ok((ts, frame)) => writer.append(ts, &frame),
+                        Err(RecvTimeoutError::Timeout) => writer.flush_block(),
+                        Err(RecvTimeoutError::Disconnected) => break,
+                    }
+                }
+                writer.flush_block();
+            })
+            .map_err(|e| ParadexError::Config(format!("Cannot start recorder thread: {}", e)))?;
+
+        Ok(Self {
+            sender: Some(sender),
+            recorded: AtomicU64::new(0),
+            dropped: AtomicU64::new(0),
+            writer: Some(writer),
+        })
+    }
+
+    /// Record a frame with the current receive time
+    pub fn record(&self, frame: &str) {
+        let Some(sender) = self.sender.as_ref() else {
+            return;
+        };
+        match sender.try_send((unix_nanos_now(), frame.to_string())) {
+            Ok(()) => {
+                self.recorded.fetch_add(1, Ordering::Relaxed);
+            }
+            Err(TrySendError::Full(_)) | Err(TrySendError::Disconnected(_)) => {
+                self.dropped.fetch_add(1, Ordering::Relaxed);
+            }
+        }
+    }
+
+    /// (recorded, dropped) frame counts
+    pub fn stats(&self) -> (u64, u64) {
+        (
+            self.recorded.load(Ordering::Relaxed),
+            self.dropped.load(Ordering::Relaxed),
+        )
+    }
+}
+
+impl Drop for FrameRecorder {
+    fn drop(&mut self) {
+        // Closing the channel makes the writer flush and exit
+        self.sender.take();
+        if let Some(writer) = self.writer.take() {
+            let _ = writer.join();
+        }
+    }
+}
+
+struct SegmentWriter {
+    config: RecorderConfig,
+    block: Vec<u8>,
+    block_frames: usize,
+    block_first_ts: u64,
+    block_last_ts: u64,
+    segment: Option<(String, File, u64)>,
+    index: Option<File>,
+}
+
+impl SegmentWriter {
+    fn new(config: RecorderConfig) -> Self {
+        Self {
+            config,
+            block: Vec::new(),
+            block_frames: 0,
+            block_first_ts: 0,
+            block_last_ts: 0,
+            segment: None,
+            index: None,
+        }
+    }
+
+    fn append(&mut self, ts: u64, frame: &str) {
+        if self.block_frames == 0 {
+            self.block_first_ts = ts;
+        }
+        self.block_last_ts = ts;
+        self.block.extend_from_slice(&ts.to_le_bytes());
+        self.block.extend_from_slice(&(frame.len() as u32).to_le_bytes());
+        self.block.extend_from_slice(frame.as_bytes());
+        self.block_frames += 1;
+
+        if self.block_frames >= self.config.block_frames {
+            self.flush_block();
+        }
+    }
+
+    fn flush_block(&mut self) {
+        if self.block_frames == 0 {
+            return;
+        }
+        if let Err(e) = self.write_block() {
+            error!("Failed to write recorded frames: {}", e);
+        }
+        self.block.clear();
+        self.block_frames = 0;
+    }
+
+    fn write_block(&mut self) -> std::io::Result<()> {
+        let compressed = zstd::bulk::compress(&self.block, self.config.compression_level)?;
+
+        let rotate = match &self.segment {
+            Some((_, _, size)) => *size + compressed.len() as u64 > self.config.segment_bytes,
+            None => true,
+        };
+        if rotate {
+            let name = format!("{:020}.seg.zst", self.block_first_ts);
+            let file = OpenOptions::new()
+                .create(true)
+                .append(true)
+                .open(self.config.directory.join(&name))?;
+            let size = file.metadata()?.len();
+            self.segment = Some((name, file, size));
+        }
+
+        let (name, file, size) = self.segment.as_mut().expect("segment opened above");
+        let offset = *size;
+        file.write_all(&compressed)?;
+        *size += compressed.len() as u64;
+
+        if self.index.is_none() {
+            self.index = Some(
+                OpenOptions::new()
+                    .create(true)
+                    .append(true)
+                    .open(self.config.directory.join("index.txt"))?,
+            );
+        }
+        let index = self.index.as_mut().expect("index opened above");
+        writeln!(
+            index,
+            "{} {} {} {} {} {}",
+            self.block_first_ts,
+            self.block_last_ts,
+            name,
+            offset,
+            compressed.len(),
+            self.block_frames,
+        )?;
+        index.flush()
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_recorded_frames_round_trip_through_index() {
+        let directory = std::env::temp_dir().join(format!("paradex-recorder-{}", unix_nanos_now()));
+        let recorder = FrameRecorder::start(RecorderConfig::new(directory.clone())).unwrap();
+        recorder.record("{\"a\":1}");
+        recorder.record("{\"b\":2}");
+        drop(recorder);
+
+        let index = std::fs::read_to_string(directory.join("index.txt")).unwrap();
+        let fields: Vec<&str> = index.lines().next().unwrap().split(' ').collect();
+        let (segment, offset, length) = (fields[2], fields[3].parse::<usize>().unwrap(), fields[4].parse::<usize>().unwrap());
+        assert_eq!(fields[5], "2");
+
+        let bytes = std::fs::read(directory.join(segment)).unwrap();
+        let block = zstd::decode_all(&bytes[offset..offset + length]).unwrap();
+        let len = u32::from_le_bytes(block[8..12].try_into().unwrap()) as usize;
+        assert_eq!(&block[12..12 + len], b"{\"a\":1}");
+
+        std::fs::remove_dir_all(directory).unwrap();
+    }
+}
@@ -0,0 +1,289 @@
+// crates/adapters/paradex/src/websocket/replay.rs
+//! Replay of recorded WebSocket frames into a `FrameQueue`
+//!
+//! Reads the segment/index layout written by `FrameRecorder`. Segments are
+//! memory mapped and blocks are decompressed one at a time, so replay memory
+//! stays bounded by the block size regardless of recording length.
+
+use std::collections::HashMap;
+use std::fs::File;
+use std::path::{Path, PathBuf};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::Arc;
+use std::time::Instant;
+
+use memmap2::Mmap;
+use serde_json::Value;
+use tokio::time::Duration;
+
+use crate::error::{ParadexError, Result};
+use crate::websocket::queue::FrameQueue;
+use crate::websocket::unix_nanos_now;
+
+/// Replay pacing
+#[derive(Debug, Clone, Copy, PartialEq)]
+pub enum ReplaySpeed {
+    /// Reproduce the recorded inter-arrival times
+    RealTime,
+    /// Recorded inter-arrival times divided by the factor
+    Accelerated(f64),
+    /// No pacing, limited only by the consumer
+    AsFastAsPossible,
+}
+
+impl ReplaySpeed {
+    /// 1.0 is real time, N is N times faster, 0 (or less) is as fast as possible
+    pub fn from_factor(factor: f64) -> Self {
+        if factor <= 0.0 {
+            Self::AsFastAsPossible
+        } else if factor == 1.0 {
+            Self::RealTime
+        } else {
+            Self::Accelerated(factor)
+        }
+    }
+
+    fn factor(&self) -> Option<f64> {
+        match self {
+            Self::RealTime => Some(1.0),
+            Self::Accelerated(factor) => Some(*factor),
+            Self::AsFastAsPossible => None,
+        }
+    }
+}
+
+/// One compressed block as listed in `index.txt`
+#[derive(Debug, Clone)]
+struct BlockEntry {
+    first_ts: u64,
+    last_ts: u64,
+    segment: String,
+    offset: usize,
+    length: usize,
+}
+
+/// Reader over a recording directory
+pub struct RecordingReader {
+    directory: PathBuf,
+    blocks: Vec<BlockEntry>,
+    segments: HashMap<String, Mmap>,
+}
+
+impl RecordingReader {
+    /// Load the block index of a recording directory
+    pub fn open(directory: &Path) -> Result<Self> {
+        let index = std::fs::read_to_string(directory.join("index.txt"))
+            .map_err(|e| ParadexError::Config(format!("Cannot read recording index: {}", e)))?;
+
+        let mut blocks = Vec::new();
+        for line in index.lines().filter(|l| !l.is_empty()) {
+            blocks.push(parse_index_line(line)?);
+        }
+        blocks.sort_by_key(|b| b.first_ts);
+
+        Ok(Self {
+            directory: directory.to_path_buf(),
+            blocks,
+            segments: HashMap::new(),
+        })
+    }
+
+    /// Index of the first block that may hold frames at or after `start_ts`
+    fn first_block(&self, start_ts: u64) -> usize {
+        self.blocks.partition_point(|b| b.last_ts < start_ts)
+    }
+
+    /// Decompress block `i` into `(ts_ns, frame)` records
+    fn read_block(&mut self, i: usize) -> Result<Vec<(u64, String)>> {
+        let block = self.blocks[i].clone();
+        if !self.segments.contains_key(&block.segment) {
+            let file = File::open(self.directory.join(&block.segment))
+                .map_err(|e| ParadexError::Config(format!("Cannot open segment: {}", e)))?;
+            // Safety: segments are append-only and never truncated while mapped
+            let mmap = unsafe { Mmap::map(&file) }
+                .map_err(|e| ParadexError::Config(format!("Cannot map segment: {}", e)))?;
+            self.segments.insert(block.segment.clone(), mmap);
+        }
+
+        let mmap = &self.segments[&block.segment];
+        let compressed = mmap
+            .get(block.offset..block.offset + block.length)
+            .ok_or_else(|| ParadexError::Parse(format!("Block out of range in {}", block.segment)))?;
+        let raw = zstd::decode_all(compressed)
+            .map_err(|e| ParadexError::Parse(format!("Cannot decompress block: {}", e)))?;
+
+        decode_records(&raw)
+    }
+}
+
+fn parse_index_line(line: &str) -> Result<BlockEntry> {
+    let fields: Vec<&str> = line.split(' ').collect();
+    let invalid = || ParadexError::Parse(format!("Invalid index line: {}", line));
+    if fields.len() != 6 {
+        return Err(invalid());
+    }
+    Ok(BlockEntry {
+        first_ts: fields[0].parse().map_err(|_| invalid())?,
+        last_ts: fields[1].parse().map_err(|_| invalid())?,
+        segment: fields[2].to_string(),
+        offset: fields[3].parse().map_err(|_| invalid())?,
+        length: fields[4].parse().map_err(|_| invalid())?,
+    })
+}
+
+fn decode_records(raw: &[u8]) -> Result<Vec<(u64, String)>> {
+    let truncated = || ParadexError::Parse("Truncated record in block".to_string());
+    let mut records = Vec::new();
+    let mut pos = 0;
+    while pos < raw.len() {
+        let header = raw.get(pos..pos + 12).ok_or_else(truncated)?;
+        let ts = u64::from_le_bytes(header[..8].try_into().unwrap());
+        let len = u32::from_le_bytes(header[8..].try_into().unwrap()) as usize;
+        let body = raw.get(pos + 12..pos + 12 + len).ok_or_else(truncated)?;
+        let frame = String::from_utf8(body.to_vec())
+            .map_err(|e| ParadexError::Parse(format!("Invalid frame text: {}", e)))?;
+        records.push((ts, frame));
+        pos += 12 + len;
+    }
+    Ok(records)
+}
+
+/// Counters for a replay run
+#[derive(Debug, Default)]
+pub struct ReplayStats {
+    pub frames: AtomicU64,
+    pub bytes: AtomicU64,
+    pub skipped: AtomicU64,
+    pub elapsed_ns: AtomicU64,
+    /// Worst delay behind the paced schedule (consumer too slow)
+    pub max_lag_ns: AtomicU64,
+}
+
+/// Pushes recorded frames into a `FrameQueue` at the requested pace
+pub struct FrameReplayer {
+    directory: PathBuf,
+    speed: ReplaySpeed,
+    start_ts: u64,
+    end_ts: u64,
+    stopped: AtomicBool,
+    pub stats: ReplayStats,
+}
+
+impl FrameReplayer {
+    /// Replay frames received within `[start_ts, end_ts]` (0 for unbounded)
+    pub fn new(directory: PathBuf, speed: ReplaySpeed, start_ts: u64, end_ts: u64) -> Self {
+        Self {
+            directory,
+            speed,
+            start_ts,
+            end_ts: if end_ts == 0 { u64::MAX } else { end_ts },
+            stopped: AtomicBool::new(false),
+            stats: ReplayStats::default(),
+        }
+    }
+
+    /// Stop an ongoing replay after the current frame
+    pub fn stop(&self) {
+        self.stopped.store(true, Ordering::Release);
+    }
+
+    /// Replay into `queue` until the recording ends or `stop` is called
+    pub async fn run(&self, queue: Arc<FrameQueue>) -> Result<()> {
+        self.stopped.store(false, Ordering::Release);
+        let mut reader = RecordingReader::open(&self.directory)?;
+        let started = Instant::now();
+        let mut origin_ts: Option<u64> = None;
+
+        for i in reader.first_block(self.start_ts)..reader.blocks.len() {
+            if reader.blocks[i].first_ts > self.end_ts {
+                break;
+            }
+            // Decompression is CPU-bound; keep it off the async workers
+            let records = tokio::task::block_in_place(|| reader.read_block(i))?;
+
+            for (ts, frame) in records {
+                if self.stopped.load(Ordering::Acquire) {
+                    return Ok(());
+                }
+                if ts < self.start_ts || ts > self.end_ts {
+                    continue;
+                }
+                let origin = *origin_ts.get_or_insert(ts);
+                if let Some(factor) = self.speed.factor() {
+                    self.pace(started, ts - origin, factor).await;
+                }
+
+                let Some(channel) = frame_channel(&frame) else {
+                    // Subscription acks and RPC responses are not channel updates
+                    self.stats.skipped.fetch_add(1, Ordering::Relaxed);
+                    continue;
+                };
+                self.stats.bytes.fetch_add(frame.len() as u64, Ordering::Relaxed);
+                // Replayed frames are stamped on arrival, like live ones
+                queue.push(&channel, unix_nanos_now(), frame).await;
+                self.stats.frames.fetch_add(1, Ordering::Relaxed);
+            }
+            self.stats
+                .elapsed_ns
+                .store(started.elapsed().as_nanos() as u64, Ordering::Relaxed);
+        }
+
+        self.stats
+            .elapsed_ns
+            .store(started.elapsed().as_nanos() as u64, Ordering::Relaxed);
+        Ok(())
+    }
+
+    async fn pace(&self, started: Instant, recorded_offset_ns: u64, factor: f64) {
+        let due = Duration::from_nanos((recorded_offset_ns as f64 / factor) as u64);
+        let now = started.elapsed();
+        if due > now {
+            tokio::time::sleep(due - now).await;
+        } else {
+            self.stats
+                .max_lag_ns
+                .fetch_max((now - due).as_nanos() as u64, Ordering::Relaxed);
+        }
+    }
+}
+
+fn frame_channel(frame: &str) -> Option<String> {
+    let data: Value = serde_json::from_str(frame).ok()?;
+    Some(data.get("params")?.get("channel")?.as_str()?.to_string())
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use crate::websocket::recorder::{FrameRecorder, RecorderConfig};
+
+    fn update(channel: &str) -> String {
+        format!("{{\"params\":{{\"channel\":\"{}\",\"data\":{{}}}}}}", channel)
+    }
+
+    #[tokio::test(flavor = "multi_thread")]
+    async fn test_replay_pushes_recorded_channel_frames() {
+        let directory = std::env::temp_dir().join(format!(
+            "paradex-replay-{}",
+            std::time::SystemTime::now()
+                .duration_since(std::time::UNIX_EPOCH)
+                .unwrap()
+                .as_nanos()
+        ));
+        let recorder = FrameRecorder::start(RecorderConfig::new(directory.clone())).unwrap();
+        recorder.record(&update("trades.BTC-USD-PERP"));
+        recorder.record("{\"jsonrpc\":\"2.0\",\"result\":{},\"id\":1}");
+        recorder.record(&update("orderbook.BTC-USD-PERP"));
+        drop(recorder);
+
+        let queue = Arc::new(FrameQueue::new(8, HashMap::new(), Arc::new(|| {})));
+        let replayer = FrameReplayer::new(directory.clone(), ReplaySpeed::AsFastAsPossible, 0, 0);
+        replayer.run(queue.clone()).await.unwrap();
+
+        assert_eq!(queue.drain(10).len(), 2);
+        assert_eq!(replayer.stats.frames.load(Ordering::Relaxed), 2);
+        assert_eq!(replayer.stats.skipped.load(Ordering::Relaxed), 1);
+
+        std::fs::remove_dir_all(directory).unwrap();
+    }
+}
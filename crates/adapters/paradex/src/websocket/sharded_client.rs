@@ -0,0 +1,378 @@
+// crates/adapters/paradex/src/websocket/sharded_client.rs
+//! Pool of WebSocket connections with subscriptions sharded by instrument
+
+use std::collections::hash_map::DefaultHasher;
+use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::Arc;
+use std::time::Instant;
+
+use futures_util::stream::{FuturesUnordered, StreamExt};
+use tokio::time::Duration;
+use tracing::{error, info, warn};
+
+use crate::config::ParadexConfig;
+use crate::error::Result;
+use crate::websocket::queue::FrameQueue;
+use crate::websocket::recorder::FrameRecorder;
+use crate::websocket::simple_client::SimpleWebSocketClient;
+
+/// Consecutive failed connects of one shard before the pool gives up
+const MAX_SHARD_RECONNECTS: u32 = 5;
+
+/// Throughput of one pooled connection
+#[derive(Debug, Clone, Default)]
+pub struct ConnectionStats {
+    pub frames: u64,
+    pub bytes: u64,
+    pub channels: usize,
+    /// Frames per second over the last rebalance interval
+    pub frames_per_sec: f64,
+}
+
+/// Shard key of a channel: the instrument part (`orderbook.BTC-USD-PERP.50ms` -> `BTC-USD-PERP`)
+fn shard_key(channel: &str) -> &str {
+    let mut parts = channel.split('.');
+    let prefix = parts.next().unwrap_or(channel);
+    parts.next().unwrap_or(prefix)
+}
+
+/// Rendezvous hashing: stable for a given pool size and moves few keys when it changes
+fn rendezvous_shard(key: &str, shards: usize) -> usize {
+    (0..shards)
+        .max_by_key(|shard| {
+            let mut hasher = DefaultHasher::new();
+            key.hash(&mut hasher);
+            shard.hash(&mut hasher);
+            hasher.finish()
+        })
+        .unwrap_or(0)
+}
+
+#[derive(Default)]
+struct Assignments {
+    /// Keys moved off their hashed shard by rebalancing
+    overrides: HashMap<String, usize>,
+    /// Channels subscribed per key
+    channels: HashMap<String, Vec<String>>,
+    /// Per-channel frame counts and time at the last rebalance
+    last_counts: HashMap<String, u64>,
+    last_frames: Vec<u64>,
+    last_rates: Vec<f64>,
+    last_at: Option<Instant>,
+}
+
+/// WebSocket client sharding subscriptions over several connections
+///
+/// Every channel of an instrument goes to the same connection, chosen by
+/// rendezvous hashing on the instrument symbol. All connections feed one
+/// `FrameQueue`, so consumers see a single stream. `rebalance` moves one
+/// instrument from the busiest to the quietest connection when the busiest
+/// exceeds `hot_ratio` times the mean rate.
+///
+/// A connection that drops is reconnected on its own with its subscriptions.
+/// If one fails to connect `MAX_SHARD_RECONNECTS` times in a row, every
+/// connection is closed and `connect_and_subscribe` returns the error, leaving
+/// recovery to the caller.
+pub struct ShardedWebSocketClient {
+    shards: Vec<Arc<SimpleWebSocketClient>>,
+    assignments: parking_lot::Mutex<Assignments>,
+    hot_ratio: f64,
+    rebalance_interval: Duration,
+    closing: AtomicBool,
+}
+
+impl ShardedWebSocketClient {
+    pub fn new(
+        config: ParadexConfig,
+        connections: usize,
+        hot_ratio: f64,
+        rebalance_interval: Duration,
+    ) -> Self {
+        let shards = (0..connections.max(1))
+            .map(|_| Arc::new(SimpleWebSocketClient::new(config.clone())))
+            .collect::<Vec<_>>();
+        let assignments = Assignments {
+            last_frames: vec![0; shards.len()],
+            last_rates: vec![0.0; shards.len()],
+            ..Default::default()
+        };
+        Self {
+            shards,
+            assignments: parking_lot::Mutex::new(assignments),
+            hot_ratio,
+            rebalance_interval,
+            closing: AtomicBool::new(false),
+        }
+    }
+
+    /// Connection index currently assigned to `channel`
+    pub fn shard_for(&self, channel: &str) -> usize {
+        let key = shard_key(channel);
+        let assignments = self.assignments.lock();
+        match assignments.overrides.get(key) {
+            Some(shard) => *shard,
+            None => rendezvous_shard(key, self.shards.len()),
+        }
+    }
+
+    pub async fn set_frame_queue(&self, queue: Arc<FrameQueue>) {
+        for shard in self.shards.iter() {
+            shard.set_frame_queue(queue.clone()).await;
+        }
+    }
+
+    pub async fn set_recorder(&self, recorder: Option<Arc<FrameRecorder>>) {
+        for shard in self.shards.iter() {
+            shard.set_recorder(recorder.clone()).await;
+        }
+    }
+
+    pub async fn subscribe(&self, channel: String) -> Result<()> {
+        let shard = self.shard_for(&channel);
+        {
+            let mut assignments = self.assignments.lock();
+            let channels = assignments
+                .channels
+                .entry(shard_key(&channel).to_string())
+                .or_default();
+            if !channels.contains(&channel) {
+                channels.push(channel.clone());
+            }
+        }
+        self.shards[shard].subscribe(channel).await
+    }
+
+    pub async fn unsubscribe(&self, channel: String) -> Result<()> {
+        let shard = self.shard_for(&channel);
+        {
+            let mut assignments = self.assignments.lock();
+            let key = shard_key(&channel).to_string();
+            if let Some(channels) = assignments.channels.get_mut(&key) {
+                channels.retain(|c| c != &channel);
+                if channels.is_empty() {
+                    assignments.channels.remove(&key);
+                    assignments.overrides.remove(&key);
+                }
+            }
+        }
+        self.shards[shard].unsubscribe(channel).await
+    }
+
+    /// Connect every shard and rebalance periodically until all connections close
+    pub async fn connect_and_subscribe(&self, channels: Vec<String>) -> Result<()> {
+        self.closing.store(false, Ordering::Release);
+        for channel in channels {
+            self.subscribe(channel).await?;
+        }
+        info!("Connecting {} WebSocket shards", self.shards.len());
+
+        let mut connections: FuturesUnordered<_> = (0..self.shards.len())
+            .map(|shard| self.run_shard(shard, Duration::ZERO))
+            .collect();
+        let mut failures = vec![0u32; self.shards.len()];
+        let mut ticker = tokio::time::interval(self.rebalance_interval);
+        ticker.tick().await;
+
+        loop {
+            tokio::select! {
+                Some((shard, result)) = connections.next() => {
+                    if self.closing.load(Ordering::Acquire) {
+                        if connections.is_empty() {
+                            return Ok(());
+                        }
+                        continue;
+                    }
+                    match result {
+                        Ok(()) => {
+                            failures[shard] = 0;
+                            warn!("WebSocket shard {} disconnected, reconnecting", shard);
+                        }
+                        Err(e) => {
+                            failures[shard] += 1;
+                            if failures[shard] >= MAX_SHARD_RECONNECTS {
+                                error!("WebSocket shard {} failed {} times: {}", shard, failures[shard], e);
+                                let _ = self.close().await;
+                                while connections.next().await.is_some() {}
+                                return Err(e);
+                            }
+                            warn!("WebSocket shard {} failed, reconnecting: {}", shard, e);
+                        }
+                    }
+                    let backoff = Duration::from_secs(1 << failures[shard].min(4));
+                    connections.push(self.run_shard(shard, backoff));
+                }
+                _ = ticker.tick() => {
+                    if let Err(e) = self.rebalance().await {
+                        error!("WebSocket shard rebalance failed: {}", e);
+                    }
+                }
+            }
+        }
+    }
+
+    /// Run one shard's connection (resubscribing its channels) after `delay`
+    async fn run_shard(&self, shard: usize, delay: Duration) -> (usize, Result<()>) {
+        tokio::time::sleep(delay).await;
+        if self.closing.load(Ordering::Acquire) {
+            return (shard, Ok(()));
+        }
+        (shard, self.shards[shard].connect_and_subscribe(Vec::new()).await)
+    }
+
+    pub async fn close(&self) -> Result<()> {
+        self.closing.store(true, Ordering::Release);
+        for shard in self.shards.iter() {
+            shard.close().await?;
+        }
+        Ok(())
+    }
+
+    /// Per-connection throughput, rates as of the last rebalance
+    pub fn stats(&self) -> Vec<ConnectionStats> {
+        let assignments = self.assignments.lock();
+        let mut channels = vec![0; self.shards.len()];
+        for (key, key_channels) in assignments.channels.iter() {
+            let shard = match assignments.overrides.get(key) {
+                Some(shard) => *shard,
+                None => rendezvous_shard(key, self.shards.len()),
+            };
+            channels[shard] += key_channels.len();
+        }
+
+        self.shards
+            .iter()
+            .enumerate()
+            .map(|(i, shard)| {
+                let (frames, bytes) = shard.throughput();
+                ConnectionStats {
+                    frames,
+                    bytes,
+                    channels: channels[i],
+                    frames_per_sec: assignments.last_rates[i],
+                }
+            })
+            .collect()
+    }
+
+    /// Move one instrument off the hottest connection if it runs hot
+    ///
+    /// Returns the moved instrument key, if any.
+    pub async fn rebalance(&self) -> Result<Option<String>> {
+        let Some((key, from, to, channels)) = self.plan_rebalance() else {
+            return Ok(None);
+        };
+        info!("Rebalancing {} from WebSocket shard {} to {}", key, from, to);
+
+        // Subscribe on the new connection before leaving the old one so no updates are missed
+        for channel in channels.iter() {
+            self.shards[to].subscribe(channel.clone()).await?;
+        }
+        for channel in channels.iter() {
+            self.shards[from].unsubscribe(channel.clone()).await?;
+        }
+        Ok(Some(key))
+    }
+
+    fn plan_rebalance(&self) -> Option<(String, usize, usize, Vec<String>)> {
+        let now = Instant::now();
+        let mut assignments = self.assignments.lock();
+        let elapsed = assignments
+            .last_at
+            .replace(now)
+            .map(|t| now.duration_since(t).as_secs_f64())
+            .unwrap_or(0.0);
+
+        // Shard and per-channel rates since the previous call
+        let mut key_rates: HashMap<String, f64> = HashMap::new();
+        for (i, shard) in self.shards.iter().enumerate() {
+            let (frames, _) = shard.throughput();
+            let delta = frames - assignments.last_frames[i];
+            assignments.last_frames[i] = frames;
+            assignments.last_rates[i] = if elapsed > 0.0 { delta as f64 / elapsed } else { 0.0 };
+
+            for (channel, count) in shard.channel_frames() {
+                let last = assignments.last_counts.insert(channel.clone(), count).unwrap_or(0);
+                if elapsed > 0.0 {
+                    *key_rates.entry(shard_key(&channel).to_string()).or_default() +=
+                        count.saturating_sub(last) as f64 / elapsed;
+                }
+            }
+        }
+        if elapsed == 0.0 || self.shards.len() < 2 {
+            return None;
+        }
+
+        let rates = &assignments.last_rates;
+        let mean = rates.iter().sum::<f64>() / rates.len() as f64;
+        let (hot, hot_rate) = rates
+            .iter()
+            .copied()
+            .enumerate()
+            .max_by(|a, b| a.1.total_cmp(&b.1))?;
+        let (cold, cold_rate) = rates
+            .iter()
+            .copied()
+            .enumerate()
+            .min_by(|a, b| a.1.total_cmp(&b.1))?;
+        if mean == 0.0 || hot_rate <= self.hot_ratio * mean {
+            return None;
+        }
+
+        // Move the key that best evens out the pair; never one larger than the gap
+        let gap = hot_rate - cold_rate;
+        let shard_of = |key: &str| match assignments.overrides.get(key) {
+            Some(shard) => *shard,
+            None => rendezvous_shard(key, self.shards.len()),
+        };
+        let hot_keys: Vec<&String> = assignments
+            .channels
+            .keys()
+            .filter(|key| shard_of(key) == hot)
+            .collect();
+        if hot_keys.len() < 2 {
+            // A connection carrying a single instrument cannot be split further
+            return None;
+        }
+        let (key, _) = hot_keys
+            .into_iter()
+            .map(|key| (key, key_rates.get(key).copied().unwrap_or(0.0)))
+            .filter(|(_, rate)| *rate > 0.0 && *rate < gap)
+            .min_by(|a, b| (a.1 - gap / 2.0).abs().total_cmp(&(b.1 - gap / 2.0).abs()))?;
+
+        let key = key.clone();
+        let channels = assignments.channels.get(&key).cloned().unwrap_or_default();
+        assignments.overrides.insert(key.clone(), cold);
+        Some((key, hot, cold, channels))
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_shard_key_is_instrument_symbol() {
+        assert_eq!(shard_key("orderbook.BTC-USD-PERP.snapshot@15@50ms"), "BTC-USD-PERP");
+        assert_eq!(shard_key("trades.BTC-USD-PERP"), "BTC-USD-PERP");
+        assert_eq!(shard_key("markets_summary"), "markets_summary");
+    }
+
+    #[test]
+    fn test_rendezvous_assignment_is_stable_and_spread() {
+        let keys: Vec<String> = (0..200).map(|i| format!("SYM{}-USD-PERP", i)).collect();
+        let before: Vec<usize> = keys.iter().map(|k| rendezvous_shard(k, 4)).collect();
+        let again: Vec<usize> = keys.iter().map(|k| rendezvous_shard(k, 4)).collect();
+        assert_eq!(before, again);
+        for shard in 0..4 {
+            assert!(before.iter().filter(|s| **s == shard).count() > 20);
+        }
+
+        // Growing the pool only moves keys onto the new connection
+        let after: Vec<usize> = keys.iter().map(|k| rendezvous_shard(k, 5)).collect();
+        for (b, a) in before.iter().zip(after.iter()) {
+            assert!(a == b || *a == 4);
+        }
+    }
+}
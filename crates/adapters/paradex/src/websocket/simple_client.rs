@@ -3,20 +3,38 @@
 
 use crate::config::ParadexConfig;
 use crate::error::Result;
+use crate::websocket::queue::FrameQueue;
+use crate::websocket::recorder::FrameRecorder;
+use crate::websocket::unix_nanos_now;
+use dashmap::DashMap;
+use futures_util::stream::SplitSink;
 use futures_util::{SinkExt, StreamExt};
 use serde_json::{json, Value};
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
+use tokio::net::TcpStream;
 use tokio::sync::Mutex;
-use tokio_tungstenite::{connect_async, tungstenite::Message};
+use tokio_tungstenite::{connect_async, tungstenite::Message, MaybeTlsStream, WebSocketStream};
 use tracing::{debug, error, info};
 
 type Callback = Arc<dyn Fn(Value) + Send + Sync>;
+type RawCallback = Arc<dyn Fn(String) + Send + Sync>;
+type WsWriter = SplitSink<WebSocketStream<MaybeTlsStream<TcpStream>>, Message>;
 
 /// Simple WebSocket client with callbacks
 pub struct SimpleWebSocketClient {
     config: ParadexConfig,
     orderbook_callback: Arc<Mutex<Option<Callback>>>,
     trades_callback: Arc<Mutex<Option<Callback>>>,
+    message_callback: Arc<Mutex<Option<RawCallback>>>,
+    frame_queue: Arc<Mutex<Option<Arc<FrameQueue>>>>,
+    recorder: Arc<Mutex<Option<Arc<FrameRecorder>>>>,
+    writer: Arc<Mutex<Option<WsWriter>>>,
+    subscriptions: Arc<Mutex<Vec<String>>>,
+    request_id: AtomicU64,
+    frames_received: AtomicU64,
+    bytes_received: AtomicU64,
+    channel_frames: DashMap<String, u64>,
 }
 
 impl SimpleWebSocketClient {
@@ -25,6 +43,15 @@ impl SimpleWebSocketClient {
             config,
             orderbook_callback: Arc::new(Mutex::new(None)),
             trades_callback: Arc::new(Mutex::new(None)),
+            message_callback: Arc::new(Mutex::new(None)),
+            frame_queue: Arc::new(Mutex::new(None)),
+            recorder: Arc::new(Mutex::new(None)),
+            writer: Arc::new(Mutex::new(None)),
+            subscriptions: Arc::new(Mutex::new(Vec::new())),
+            request_id: AtomicU64::new(1),
+            frames_received: AtomicU64::new(0),
+            bytes_received: AtomicU64::new(0),
+            channel_frames: DashMap::new(),
         }
     }
 
@@ -44,27 +71,109 @@ impl SimpleWebSocketClient {
         *cb = Some(Arc::new(callback));
     }
 
+    /// Set callback receiving the raw text of every channel update frame
+    pub async fn set_message_callback<F>(&self, callback: F)
+    where
+        F: Fn(String) + Send + Sync + 'static,
+    {
+        let mut cb = self.message_callback.lock().await;
+        *cb = Some(Arc::new(callback));
+    }
+
+    /// Route channel update frames into a bounded queue instead of the message callback
+    pub async fn set_frame_queue(&self, queue: Arc<FrameQueue>) {
+        *self.frame_queue.lock().await = Some(queue);
+    }
+
+    /// Tap every received text frame into a recorder (None stops recording)
+    pub async fn set_recorder(&self, recorder: Option<Arc<FrameRecorder>>) {
+        *self.recorder.lock().await = recorder;
+    }
+
+    /// Total (frames, bytes) of channel updates received on this connection
+    pub fn throughput(&self) -> (u64, u64) {
+        (
+            self.frames_received.load(Ordering::Relaxed),
+            self.bytes_received.load(Ordering::Relaxed),
+        )
+    }
+
+    /// Channel updates received per channel since the connection was created
+    pub fn channel_frames(&self) -> Vec<(String, u64)> {
+        self.channel_frames
+            .iter()
+            .map(|entry| (entry.key().clone(), *entry.value()))
+            .collect()
+    }
+
+    /// Channels subscribed on this connection
+    pub async fn subscriptions(&self) -> Vec<String> {
+        self.subscriptions.lock().await.clone()
+    }
+
+    /// Subscribe to a channel, immediately if connected and on every (re)connect
+    pub async fn subscribe(&self, channel: String) -> Result<()> {
+        {
+            let mut subs = self.subscriptions.lock().await;
+            if subs.contains(&channel) {
+                return Ok(());
+            }
+            subs.push(channel.clone());
+        }
+        self.send_request("subscribe", &channel).await
+    }
+
+    /// Unsubscribe from a channel
+    pub async fn unsubscribe(&self, channel: String) -> Result<()> {
+        self.subscriptions.lock().await.retain(|c| c != &channel);
+        self.send_request("unsubscribe", &channel).await
+    }
+
+    /// Close the connection, ending the message loop in connect_and_subscribe
+    pub async fn close(&self) -> Result<()> {
+        if let Some(w) = self.writer.lock().await.as_mut() {
+            w.send(Message::Close(None)).await?;
+        }
+        Ok(())
+    }
+
+    async fn send_request(&self, method: &str, channel: &str) -> Result<()> {
+        let mut writer = self.writer.lock().await;
+        if let Some(w) = writer.as_mut() {
+            let msg = json!({
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": {"channel": channel},
+                "id": self.request_id.fetch_add(1, Ordering::Relaxed),
+            });
+            w.send(Message::Text(msg.to_string())).await?;
+            info!("{} {}", method, channel);
+        }
+        Ok(())
+    }
+
     pub async fn connect_and_subscribe(&self, channels: Vec<String>) -> Result<()> {
         let url = &self.config.ws_url;
         info!("Connecting to WebSocket: {}", url);
 
         let (ws_stream, _) = connect_async(url).await?;
-        let (mut write, mut read) = ws_stream.split();
+        let (write, mut read) = ws_stream.split();
+        *self.writer.lock().await = Some(write);
 
         info!("WebSocket connected");
 
-        // Subscribe to channels
-        for (id, channel) in channels.iter().enumerate() {
-            let subscribe_msg = json!({
-                "jsonrpc": "2.0",
-                "method": "subscribe",
-                "params": [channel],
-                "id": id + 1
-            });
-            write
-                .send(Message::Text(subscribe_msg.to_string()))
-                .await?;
-            info!("Subscribed to: {}", channel);
+        // Subscribe to requested channels plus any registered via subscribe()
+        {
+            let mut subs = self.subscriptions.lock().await;
+            for channel in channels {
+                if !subs.contains(&channel) {
+                    subs.push(channel);
+                }
+            }
+        }
+        let channels = self.subscriptions.lock().await.clone();
+        for channel in channels.iter() {
+            self.send_request("subscribe", channel).await?;
         }
 
         // Message loop
@@ -72,12 +181,18 @@ impl SimpleWebSocketClient {
             match msg_result {
                 Ok(Message::Text(text)) => {
                     debug!("Received: {}", text);
+                    if let Some(recorder) = self.recorder.lock().await.as_ref() {
+                        recorder.record(&text);
+                    }
+                    let ts_recv = unix_nanos_now();
                     if let Ok(data) = serde_json::from_str::<Value>(&text) {
-                        self.handle_message(data).await;
+                        self.handle_message(data, ts_recv, text).await;
                     }
                 }
                 Ok(Message::Ping(data)) => {
-                    write.send(Message::Pong(data)).await?;
+                    if let Some(w) = self.writer.lock().await.as_mut() {
+                        w.send(Message::Pong(data)).await?;
+                    }
                 }
                 Ok(Message::Close(_)) => {
                     info!("WebSocket closed");
@@ -91,13 +206,30 @@ impl SimpleWebSocketClient {
             }
         }
 
+        *self.writer.lock().await = None;
         Ok(())
     }
 
-    async fn handle_message(&self, data: Value) {
+    async fn handle_message(&self, data: Value, ts_recv: u64, text: String) {
         // Check if it's a subscription update
         if let Some(params) = data.get("params") {
             if let Some(channel) = params.get("channel").and_then(|c| c.as_str()) {
+                self.frames_received.fetch_add(1, Ordering::Relaxed);
+                self.bytes_received.fetch_add(text.len() as u64, Ordering::Relaxed);
+                match self.channel_frames.get_mut(channel) {
+                    Some(mut count) => *count += 1,
+                    None => {
+                        self.channel_frames.insert(channel.to_string(), 1);
+                    }
+                }
+
+                let queue = self.frame_queue.lock().await.clone();
+                if let Some(queue) = queue {
+                    queue.push(channel, ts_recv, text).await;
+                } else if let Some(cb) = self.message_callback.lock().await.as_ref() {
+                    cb(text);
+                }
+
                 if channel.starts_with("orderbook.") {
                     if let Some(cb) = self.orderbook_callback.lock().await.as_ref() {
                         if let Some(result) = params.get("result") {
@@ -2,11 +2,15 @@
 """Paradex adapter for Nautilus Trader."""
 
 from nautilus_trader.adapters.paradex.config import ParadexConfig
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
 from nautilus_trader.adapters.paradex.config import ParadexExecClientConfig
+from nautilus_trader.adapters.paradex.config import ParadexInstrumentProviderConfig
 from nautilus_trader.adapters.paradex.constants import PARADEX
 
 __all__ = [
     "PARADEX",
     "ParadexConfig",
+    "ParadexDataClientConfig",
     "ParadexExecClientConfig",
+    "ParadexInstrumentProviderConfig",
 ]
@@ -0,0 +1,181 @@
+# nautilus_trader/adapters/paradex/book_metrics.py
+"""Incrementally maintained derived order book metrics for Paradex."""
+
+from bisect import insort
+from decimal import Decimal
+from heapq import heapify
+from heapq import heappop
+from heapq import heappush
+
+from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import InstrumentId
+
+from nautilus_trader.adapters.paradex.types import ParadexBookMetrics
+
+_ZERO = Decimal(0)
+
+
+class _BookSide:
+    """
+    One side of the book, best first, with exact running top-N sums.
+
+    Levels are keyed so that ascending order is best first (bids are keyed
+    by negated price). The top N keys are kept in a sorted list of at most
+    N entries; deeper levels go to a min-heap with lazy deletion. A level
+    change is O(N) within the top N and O(log n) below it, independent of
+    book size. Sums are Decimal so they never drift.
+    """
+
+    def __init__(self, depth: int, is_bid: bool) -> None:
+        self._depth = depth
+        self._sign = Decimal(-1) if is_bid else Decimal(1)
+        self._top: list[Decimal] = []
+        self._overflow: list[Decimal] = []  # Heap; may hold removed or promoted keys
+        self._sizes: dict[Decimal, Decimal] = {}
+        self.top_qty = _ZERO
+        self.top_notional = _ZERO
+
+    def clear(self) -> None:
+        self._top.clear()
+        self._overflow.clear()
+        self._sizes.clear()
+        self.top_qty = _ZERO
+        self.top_notional = _ZERO
+
+    def best(self) -> tuple[Decimal, Decimal] | None:
+        """Return (price, size) of the best level, if any."""
+        if not self._top:
+            return None
+        key = self._top[0]
+        return key * self._sign, self._sizes[key]
+
+    def update(self, price: Decimal, size: Decimal) -> bool:
+        """Set the size at ``price`` (0 deletes); returns True if the top N changed."""
+        key = price * self._sign
+        top = self._top
+        old = self._sizes.get(key)
+        in_top = old is not None and key <= top[-1]
+
+        if size <= 0:
+            if old is None:
+                return False
+            del self._sizes[key]
+            if not in_top:
+                return False  # Its heap entry is skipped when next popped
+            top.remove(key)
+            self._add(price, -old)
+            self._promote()
+            return True
+
+        self._sizes[key] = size
+        if in_top:
+            self._add(price, size - old)
+            return True
+        if old is not None:
+            return False  # Size change below the top N
+
+        if len(top) < self._depth or key < top[-1]:
+            insort(top, key)
+            self._add(price, size)
+            if len(top) > self._depth:
+                self._demote()
+            return True
+        heappush(self._overflow, key)
+        self._compact_overflow()
+        return False
+
+    def _add(self, price: Decimal, qty: Decimal) -> None:
+        self.top_qty += qty
+        self.top_notional += price * qty
+
+    def _demote(self) -> None:
+        key = self._top.pop()
+        self._add(key * self._sign, -self._sizes[key])
+        heappush(self._overflow, key)
+
+    def _promote(self) -> None:
+        # Fill the top N from the heap, skipping stale entries
+        overflow = self._overflow
+        top = self._top
+        while overflow and len(top) < self._depth:
+            key = heappop(overflow)
+            if key not in self._sizes or (top and key <= top[-1]):
+                continue
+            top.append(key)  # Heap order is best first, so the list stays sorted
+            self._add(key * self._sign, self._sizes[key])
+
+    def _compact_overflow(self) -> None:
+        # Rebuild once stale entries outnumber live ones
+        if len(self._overflow) > 2 * len(self._sizes) + self._depth:
+            top = set(self._top)
+            self._overflow = [key for key in self._sizes if key not in top]
+            heapify(self._overflow)
+
+
+class IncrementalBookMetrics:
+    """
+    Derived metrics for one order book, maintained per level change.
+
+    Fed with the same level changes as the published deltas, so each
+    update costs O(depth + log n) rather than a pass over the book. Values are only produced after a change within the top
+    ``depth`` levels, and are published once for all subscribers:
+
+    - ``spread``: best ask minus best bid
+    - ``microprice``: best prices weighted by the opposite side's size
+    - ``imbalance``: (bid qty - ask qty) / (bid qty + ask qty) over the top N
+    - ``weighted_mid``: size-weighted average price of the top N on both sides
+    """
+
+    def __init__(self, instrument_id: InstrumentId, depth: int) -> None:
+        self.instrument_id = instrument_id
+        self.depth = depth
+        self._data_type = DataType(ParadexBookMetrics, metadata={"instrument_id": instrument_id.value})
+        self._bids = _BookSide(depth, is_bid=True)
+        self._asks = _BookSide(depth, is_bid=False)
+        self._changed = False
+
+    def clear(self) -> None:
+        self._bids.clear()
+        self._asks.clear()
+        self._changed = True
+
+    def update(self, side: OrderSide, price: Decimal, size: Decimal) -> None:
+        """Apply one level change; a zero ``size`` removes the level."""
+        book_side = self._bids if side == OrderSide.BUY else self._asks
+        if book_side.update(price, size):
+            self._changed = True
+
+    def compute(self, ts_event: int, ts_init: int) -> ParadexBookMetrics | None:
+        """Return the metrics if the top of the book changed since the last call."""
+        if not self._changed:
+            return None
+        self._changed = False
+        bid = self._bids.best()
+        ask = self._asks.best()
+        if bid is None or ask is None:
+            return None
+
+        bid_px, bid_qty = map(float, bid)
+        ask_px, ask_qty = map(float, ask)
+        bids, asks = self._bids, self._asks
+        bid_top_qty = float(bids.top_qty)
+        ask_top_qty = float(asks.top_qty)
+        top_qty = bid_top_qty + ask_top_qty
+        return ParadexBookMetrics(
+            instrument_id=self.instrument_id,
+            depth=self.depth,
+            spread=ask_px - bid_px,
+            mid=(ask_px + bid_px) / 2,
+            microprice=(bid_px * ask_qty + ask_px * bid_qty) / (bid_qty + ask_qty),
+            imbalance=(bid_top_qty - ask_top_qty) / top_qty,
+            weighted_mid=float(bids.top_notional + asks.top_notional) / top_qty,
+            ts_event=ts_event,
+            ts_init=ts_init,
+        )
+
+    def data(self, ts_event: int, ts_init: int) -> CustomData | None:
+        """Return ``compute`` wrapped as custom data for publishing."""
+        metrics = self.compute(ts_event, ts_init)
+        return CustomData(self._data_type, metrics) if metrics is not None else None
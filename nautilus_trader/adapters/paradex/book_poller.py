@@ -0,0 +1,191 @@
+# nautilus_trader/adapters/paradex/book_poller.py
+"""Order book snapshot diffing and REST polling fallback for Paradex."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from decimal import Decimal
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.model.instruments import CryptoPerpetual
+
+from nautilus_trader.adapters.paradex.book_metrics import IncrementalBookMetrics
+from nautilus_trader.adapters.paradex.factories import build_book_snapshot
+
+
+_ZERO = Decimal(0)
+
+
+def _levels(raw: list) -> dict[Decimal, Decimal]:
+    """Normalise ``[[px, sz], ...]`` or ``[{"price", "size"}, ...]`` levels to a price map."""
+    levels: dict[Decimal, Decimal] = {}
+    for level in raw:
+        if isinstance(level, dict):
+            price, size = level["price"], level["size"]
+        else:
+            price, size = level[0], level[1]
+        size = Decimal(size)
+        if size > 0:
+            levels[Decimal(price)] = size
+    return levels
+
+
+def diff_levels(
+    previous: dict[Decimal, Decimal],
+    current: dict[Decimal, Decimal],
+) -> list[tuple[BookAction, Decimal, Decimal]]:
+    """Return the (action, price, size) changes turning ``previous`` into ``current``."""
+    changes = []
+    for price, size in current.items():
+        old = previous.get(price)
+        if old is None:
+            changes.append((BookAction.ADD, price, size))
+        elif old != size:
+            changes.append((BookAction.UPDATE, price, size))
+    for price, size in previous.items():
+        if price not in current:
+            changes.append((BookAction.DELETE, price, size))
+    return changes
+
+
+class BookDiffer:
+    """
+    Turns consecutive full-depth snapshots of one book into minimal deltas.
+
+    The first snapshot is published as a snapshot (CLEAR then ADDs); later
+    ones only as the levels that were added, resized or removed. Prices are
+    compared as decimals, so snapshots from different sources (REST and the
+    WebSocket snapshot channel) can be mixed.
+
+    If derived metrics are attached, they are fed the same level changes.
+    """
+
+    def __init__(self, instrument: CryptoPerpetual) -> None:
+        self._instrument = instrument
+        self._bids: dict[Decimal, Decimal] | None = None
+        self._asks: dict[Decimal, Decimal] = {}
+        self.metrics: IncrementalBookMetrics | None = None
+
+    def top(self) -> tuple[float, float, float, float] | None:
+        """Return the best (bid, ask, bid_size, ask_size), if both sides have levels."""
+        if not self._bids or not self._asks:
+            return None
+        bid = max(self._bids)
+        ask = min(self._asks)
+        return float(bid), float(ask), float(self._bids[bid]), float(self._asks[ask])
+
+    def attach_metrics(self, metrics: IncrementalBookMetrics | None) -> None:
+        """Attach (or with None, detach) derived metrics, seeded from the current book."""
+        self.metrics = metrics
+        if metrics is not None and self._bids is not None:
+            self._seed_metrics()
+
+    def _seed_metrics(self) -> None:
+        self.metrics.clear()
+        for price, size in self._bids.items():
+            self.metrics.update(OrderSide.BUY, price, size)
+        for price, size in self._asks.items():
+            self.metrics.update(OrderSide.SELL, price, size)
+
+    def reset(self) -> None:
+        """Forget the current state so the next snapshot is published in full."""
+        self._bids = None
+        self._asks = {}
+
+    def apply(self, book_data: dict, ts_init: int) -> OrderBookDeltas | None:
+        """Diff ``book_data`` against the previous snapshot; None if nothing changed."""
+        ts_event = millis_to_nanos(book_data.get("last_updated_at", 0)) or ts_init
+        bids = _levels(book_data.get("bids", []))
+        asks = _levels(book_data.get("asks", []))
+        instrument = self._instrument
+
+        if self._bids is None:
+            self._bids, self._asks = bids, asks
+            if self.metrics is not None:
+                self._seed_metrics()
+            return build_book_snapshot(
+                instrument.id,
+                [(instrument.make_price(p), instrument.make_qty(s)) for p, s in sorted(bids.items(), reverse=True)],
+                [(instrument.make_price(p), instrument.make_qty(s)) for p, s in sorted(asks.items())],
+                ts_event,
+                ts_init,
+            )
+
+        changes = [(OrderSide.BUY, *c) for c in diff_levels(self._bids, bids)]
+        changes += [(OrderSide.SELL, *c) for c in diff_levels(self._asks, asks)]
+        self._bids, self._asks = bids, asks
+        if not changes:
+            return None
+
+        if self.metrics is not None:
+            for side, action, price, size in changes:
+                self.metrics.update(side, price, _ZERO if action == BookAction.DELETE else size)
+
+        deltas = []
+        for i, (side, action, price, size) in enumerate(changes):
+            deltas.append(
+                OrderBookDelta(
+                    instrument_id=instrument.id,
+                    action=action,
+                    order=BookOrder(side, instrument.make_price(price), instrument.make_qty(size), 0),
+                    flags=RecordFlag.F_LAST if i == len(changes) - 1 else 0,
+                    sequence=0,
+                    ts_event=ts_event,
+                    ts_init=ts_init,
+                ),
+            )
+        return OrderBookDeltas(instrument.id, deltas)
+
+
+class OrderBookPoller:
+    """
+    Polls REST snapshots for one book while the WebSocket feed is down.
+
+    The interval adapts to activity: it halves (down to ``min_interval_ms``)
+    after a poll that changed the book and grows by half (up to
+    ``max_interval_ms``) after one that did not.
+    """
+
+    def __init__(
+        self,
+        differ: BookDiffer,
+        fetch: Callable[[], Awaitable[dict]],
+        publish: Callable[[OrderBookDeltas], None],
+        clock: LiveClock,
+        logger: Logger,
+        min_interval_ms: int,
+        max_interval_ms: int,
+    ) -> None:
+        self._differ = differ
+        self._fetch = fetch
+        self._publish = publish
+        self._clock = clock
+        self._log = logger
+        self._min_interval = min_interval_ms / 1000
+        self._max_interval = max_interval_ms / 1000
+        self.interval = self._min_interval
+        self.polls = 0
+
+    async def run(self) -> None:
+        while True:
+            try:
+                book_data = await self._fetch()
+                self.polls += 1
+                deltas = self._differ.apply(book_data, self._clock.timestamp_ns())
+                if deltas is not None:
+                    self._publish(deltas)
+                    self.interval = max(self._min_interval, self.interval / 2)
+                else:
+                    self.interval = min(self._max_interval, self.interval * 1.5)
+            except Exception as e:
+                self._log.error(f"Order book poll failed: {e}")
+                self.interval = self._max_interval
+            await asyncio.sleep(self.interval)
@@ -33,6 +33,67 @@ class ParadexConfig:
             self.ws_url = "wss://ws.paradex.trade/v1"
 
 
+@dataclass
+class ParadexDataClientConfig:
+    """Configuration for Paradex data client."""
+
+    # Historical data requests
+    history_max_concurrent_requests: int = 4  # In-flight REST pages per request
+    history_requests_per_second: int = 10  # Matches the Rust HttpClient rate limiter
+    history_slice_secs: int = 3600  # Time slice paged independently
+    history_page_size: int = 1000
+    history_cache_path: str | None = None  # Parquet cache directory, disabled if None
+    history_cache_settle_secs: int = 60  # Data newer than this is never cached
+    history_cache_max_files: int = 16  # Per series, before contiguous files are merged
+
+    # WebSocket subscriptions
+    markets_summary_all_threshold: int = 20  # Symbols before switching to markets_summary.ALL
+
+    # WebSocket connections
+    ws_connections: int = 1  # Subscriptions are sharded by instrument across connections
+    ws_hot_ratio: float = 2.0  # Rebalance when a connection exceeds this multiple of the mean rate
+    ws_rebalance_interval_secs: int = 30
+
+    # Reconnection and REST polling fallback for order books while WS is down
+    ws_reconnect: bool = True
+    ws_reconnect_max_delay_secs: int = 30
+    book_poll_min_interval_ms: int = 250
+    book_poll_max_interval_ms: int = 5000
+
+    # Derived order book metrics (ParadexBookMetrics custom data)
+    book_metrics_depth: int = 5  # Levels per side for imbalance and weighted mid
+
+    # Out-of-process ingestion: a worker process owns the sockets and decodes frames
+    ws_ingest_process: bool = False
+    ws_ingest_stats_interval_secs: int = 5
+
+    # WebSocket frame queue (Rust reader -> event loop)
+    ws_queue_capacity: int = 10_000  # Frames per channel prefix
+    ws_drain_batch_size: int = 500  # Frames handled per event loop callback
+    ws_overflow_policies: dict[str, str] = field(
+        default_factory=lambda: {
+            "orderbook": "block",  # Dropping deltas would corrupt the book
+            "trades": "drop_oldest",
+            "markets_summary": "drop_oldest",  # "conflate" skips frames, which count as sequence gaps
+        },
+    )
+
+    # Raw frame recording for offline replay
+    ws_record_path: str | None = None  # Recording directory, disabled if None
+    ws_record_segment_mb: int = 256
+
+    # Shared-memory fan-out of quotes, trades and book tops to sibling processes
+    shm_fanout_name: str | None = None  # Shared memory block name, disabled if None
+    shm_fanout_slots: int = 256  # Instruments
+    shm_fanout_trade_ring: int = 1024  # Recent trades kept per instrument
+
+    # Last-value cache served to new subscriptions
+    last_value_max_age_secs: int = 60  # Older values are not served
+
+    # Order book snapshot requests
+    snapshot_cache_ttl_ms: int = 500  # REST snapshots younger than this are reused
+
+
 @dataclass
 class ParadexExecClientConfig:
     """Configuration for Paradex execution client."""
@@ -54,3 +115,22 @@ class ParadexExecClientConfig:
     ws_ping_timeout_secs: int = 10
     ws_max_reconnect_attempts: int = 5
     ws_reconnect_delay_secs: float = 5.0
+
+
+@dataclass
+class ParadexInstrumentProviderConfig:
+    """Configuration for Paradex instrument provider."""
+
+    # Warm start: instruments are loaded from this snapshot and revalidated in the background
+    snapshot_path: str | None = None  # Snapshot file, disabled if None
+
+    # Which markets to load. With none of these set every market is loaded;
+    # load_ids are always loaded, filters select further markets (all must match)
+    load_ids: list[str] | None = None  # Symbols or instrument IDs, e.g. "BTC-USD-PERP"
+    symbol_globs: list[str] | None = None  # fnmatch patterns, e.g. "BTC-*"
+    asset_kinds: list[str] | None = None  # Market asset_kind, e.g. "PERP"
+    min_volume_24h: float | None = None  # Needs a markets summary request
+    load_on_demand: bool = True  # Fetch unknown instruments on first lookup miss
+
+    # Periodic refresh: only new or changed markets are re-parsed and published
+    refresh_interval_secs: int | None = None  # Disabled if None
@@ -1,6 +1,9 @@
 # nautilus_trader/adapters/paradex/data.py
 """Data client for Paradex exchange."""
 
+import asyncio
+import json
+import time
 from typing import Any
 
 from nautilus_trader.cache.cache import Cache
@@ -42,6 +45,67 @@ from nautilus_trader.data.messages import RequestOrderBookSnapshot
 from nautilus_trader.data.messages import RequestData
 from nautilus_trader.data.enums import DataType
 from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.core.datetime import dt_to_unix_nanos
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+
+from nautilus_trader.adapters.paradex import _rust
+from nautilus_trader.adapters.paradex.book_metrics import IncrementalBookMetrics
+from nautilus_trader.adapters.paradex.book_poller import BookDiffer
+from nautilus_trader.adapters.paradex.book_poller import OrderBookPoller
+from nautilus_trader.adapters.paradex.config import ParadexConfig
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+from nautilus_trader.adapters.paradex.factories import build_book_snapshot
+from nautilus_trader.adapters.paradex.factories import parse_order_book_snapshot
+from nautilus_trader.adapters.paradex.factories import parse_quote_tick
+from nautilus_trader.adapters.paradex.factories import parse_trade_tick
+from nautilus_trader.adapters.paradex.fanout import SharedMarketDataWriter
+from nautilus_trader.adapters.paradex.history import ParadexHistoryLoader
+from nautilus_trader.adapters.paradex.ingest import RECORD_QUOTE
+from nautilus_trader.adapters.paradex.ingest import RECORD_TRADE
+from nautilus_trader.adapters.paradex.ingest import IngestProcessClient
+from nautilus_trader.adapters.paradex.last_value import LastValueCache
+from nautilus_trader.adapters.paradex.latency import LatencyTracker
+from nautilus_trader.adapters.paradex.markets_summary import MARKETS_SUMMARY_CHANNEL
+from nautilus_trader.adapters.paradex.markets_summary import MarketsSummaryDemultiplexer
+from nautilus_trader.adapters.paradex.markets_summary import SummaryKind
+from nautilus_trader.adapters.paradex.sequence import SequenceGapMonitor
+from nautilus_trader.adapters.paradex.snapshots import OrderBookSnapshotCache
+from nautilus_trader.adapters.paradex.types import ParadexBookMetrics
+
+
+def create_ws_client(
+    rust_config: Any,
+    config: ParadexDataClientConfig,
+    paradex_config: ParadexConfig | None = None,
+) -> Any:
+    """
+    Create the WebSocket client for a data client.
+
+    A single connection unless ``config.ws_connections`` asks for a sharded pool.
+    With ``config.ws_ingest_process`` the connections are owned by a worker
+    process (built from ``paradex_config``, as the Rust config cannot be
+    sent to another process) that decodes frames off the node's interpreter.
+    """
+    if config.ws_ingest_process:
+        if paradex_config is None:
+            raise ValueError("ws_ingest_process requires the ParadexConfig")
+        return IngestProcessClient(paradex_config, config)
+
+    module = _rust.get_module()
+    if config.ws_connections <= 1:
+        return module.PySimpleWebSocketClient(rust_config)
+    return module.PyShardedWebSocketClient(
+        rust_config,
+        config.ws_connections,
+        config.ws_hot_ratio,
+        config.ws_rebalance_interval_secs,
+    )
 
 
 class ParadexDataClient(LiveDataClient):
@@ -53,13 +117,14 @@ class ParadexDataClient(LiveDataClient):
 
     def __init__(
         self,
+        http_client: Any,
         ws_client: Any,
         instrument_provider: Any,
         cache: Cache,
         clock: LiveClock,
         logger: Logger,
         msgbus: MessageBus,
-        config: Any,
+        config: ParadexDataClientConfig,
     ) -> None:
         super().__init__(
             client_id=None,  # Will be set in parent
@@ -70,19 +135,399 @@ class ParadexDataClient(LiveDataClient):
             clock=clock,
             logger=logger,
         )
+        self._http = http_client
         self._ws = ws_client
         self._config = config
 
+        self._history = ParadexHistoryLoader(http_client, clock, logger, config)
+        self._snapshot_cache = OrderBookSnapshotCache(clock, config.snapshot_cache_ttl_ms)
+        self._summary = MarketsSummaryDemultiplexer(config.markets_summary_all_threshold)
+
+        # WebSocket message routing by channel prefix
+        self._ws_task: asyncio.Task | None = None
+        self._ws_dispatch = {"frames": 0, "batches": 0, "cpu_ns": 0}
+        self._latency = LatencyTracker()
+        self._gaps = SequenceGapMonitor(clock, self._log)
+        self._gaps.register("orderbook", self._resync_order_book)
+        self._channel_handlers = {
+            "bbo": self._handle_bbo,
+            "orderbook": self._handle_orderbook,
+            "trades": self._handle_trades,
+            MARKETS_SUMMARY_CHANNEL: self._handle_markets_summary,
+        }
+        self._last_values = LastValueCache()
+
+        # Order books: one differ per subscribed book, shared by WS and REST polling.
+        # A book is kept while its deltas or its derived metrics are subscribed.
+        self._books: dict[InstrumentId, BookDiffer] = {}
+        self._book_subscriptions: set[InstrumentId] = set()
+        self._pollers: dict[InstrumentId, asyncio.Task] = {}
+        self._stopping = False
+
+        # Decoded data shared with sibling processes, if enabled
+        self._fanout: SharedMarketDataWriter | None = None
+
+    def snapshot_cache_metrics(self) -> dict:
+        """Return order book snapshot cache counters (hit ratio, staleness)."""
+        return self._snapshot_cache.stats.to_dict()
+
     async def _connect(self) -> None:
         """Connect to WebSocket."""
         self._log.info("Connecting to Paradex data feed...")
-        await self._ws.connect()
+        self._ws.enable_queue(
+            self._config.ws_queue_capacity,
+            self._config.ws_overflow_policies,
+            self._on_ws_frames_ready,
+        )
+        if self._config.ws_record_path:
+            self._ws.enable_recording(
+                self._config.ws_record_path,
+                self._config.ws_record_segment_mb * 1024 * 1024,
+            )
+        if self._config.shm_fanout_name:
+            self._fanout = SharedMarketDataWriter(
+                self._config.shm_fanout_name,
+                self._config.shm_fanout_slots,
+                self._config.shm_fanout_trade_ring,
+            )
+            self._log.info(f"Publishing market data to shared memory {self._fanout.name}")
+        self._stopping = False
+        self._ws_task = self._loop.create_task(self._run_ws())
+        if self._instrument_provider is not None:
+            self._instrument_provider.start_refresh(self._on_instruments_changed)
+        await self._probe_clock_skew()
         self._log.info("Connected")
 
     async def _disconnect(self) -> None:
         """Disconnect from WebSocket."""
         self._log.info("Disconnecting from Paradex data feed...")
+        self._stopping = True
+        if self._instrument_provider is not None:
+            self._instrument_provider.stop_refresh()
+        self._stop_book_polling()
         await self._ws.disconnect()
+        if self._config.ws_record_path:
+            self._ws.disable_recording()
+        if self._ws_task:
+            self._ws_task.cancel()
+            self._ws_task = None
+        if self._fanout is not None:
+            self._fanout.close()
+            self._fanout = None
+
+    def _on_instruments_changed(self, instruments: list[Any]) -> None:
+        """Publish refreshed instruments so the cache and subscribers see the new definitions."""
+        for instrument in instruments:
+            self._handle_data(instrument)
+
+    async def _probe_clock_skew(self, probes: int = 5) -> None:
+        """Estimate venue clock skew from REST server time round trips."""
+        for _ in range(probes):
+            try:
+                send_ns = self._clock.timestamp_ns()
+                server_time_ms = await self._http.get_system_time()
+                recv_ns = self._clock.timestamp_ns()
+            except Exception as e:
+                self._log.warning(f"Clock skew probe failed: {e}")
+                return
+            self._latency.record_time_probe(send_ns, server_time_ms * 1_000_000, recv_ns)
+        self._log.info(f"Estimated venue clock skew: {self._latency.clock_skew_ns / 1e6:.1f}ms")
+
+    async def _run_ws(self) -> None:
+        """
+        Run the WebSocket message loop, reconnecting until disconnected.
+
+        While the socket is down, subscribed order books are polled over REST.
+        """
+        delay = 1
+        while True:
+            connected_ns = self._clock.timestamp_ns()
+            try:
+                await self._ws.connect([])
+            except Exception as e:
+                self._log.error(f"WebSocket error: {e}")
+            self._log.info("WebSocket message loop ended")
+            if self._stopping or not self._config.ws_reconnect:
+                return
+
+            self._start_book_polling()
+            # Back off only while connections fail quickly
+            if self._clock.timestamp_ns() - connected_ns > 60_000_000_000:
+                delay = 1
+            self._log.warning(f"Reconnecting WebSocket in {delay}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._config.ws_reconnect_max_delay_secs)
+
+    def _start_book_polling(self) -> None:
+        for instrument_id in self._books:
+            self._start_book_poller(instrument_id)
+
+    def _start_book_poller(self, instrument_id: InstrumentId) -> None:
+        if instrument_id in self._pollers:
+            return
+        instrument = self._instrument_provider.find_instrument(instrument_id)
+        if instrument is None:
+            return
+        self._log.warning(f"Polling order book for {instrument_id} over REST")
+        poller = OrderBookPoller(
+            self._books[instrument_id],
+            lambda: self._fetch_order_book(instrument),
+            lambda deltas: self._publish_book(instrument_id, deltas),
+            self._clock,
+            self._log,
+            self._config.book_poll_min_interval_ms,
+            self._config.book_poll_max_interval_ms,
+        )
+        self._pollers[instrument_id] = self._loop.create_task(poller.run())
+
+    def _stop_book_polling(self, instrument_id: InstrumentId | None = None) -> None:
+        instrument_ids = list(self._pollers) if instrument_id is None else [instrument_id]
+        for key in instrument_ids:
+            task = self._pollers.pop(key, None)
+            if task is not None:
+                task.cancel()
+
+    # -------------------------------------------------------------------------
+    # WEBSOCKET MESSAGE HANDLING
+    # -------------------------------------------------------------------------
+
+    def ws_queue_metrics(self) -> dict:
+        """Return WebSocket frame queue depth and drop counters per channel prefix."""
+        return self._ws.queue_stats()
+
+    def ws_dispatch_metrics(self) -> dict:
+        """Return frames handled on the event loop and the CPU time spent on them."""
+        frames = self._ws_dispatch["frames"]
+        return {
+            **self._ws_dispatch,
+            "cpu_ns_per_frame": self._ws_dispatch["cpu_ns"] / frames if frames else 0.0,
+        }
+
+    def ws_connection_metrics(self) -> list[dict]:
+        """Return frames, bytes, channels and recent frames/sec per WebSocket connection."""
+        return self._ws.connection_stats()
+
+    def latency_metrics(self) -> dict:
+        """Return per-channel latency histograms and the venue clock skew estimate."""
+        return self._latency.to_dict()
+
+    def sequence_metrics(self) -> dict:
+        """Return per-channel sequence gap counters and recovery times."""
+        return self._gaps.metrics()
+
+    def _on_ws_frames_ready(self) -> None:
+        """Called on the WebSocket thread once frames are queued after a drain."""
+        self._loop.call_soon_threadsafe(self._drain_ws_queue)
+
+    def _drain_ws_queue(self) -> None:
+        """Handle one batch of queued frames, yielding to the loop between batches."""
+        batch_size = self._config.ws_drain_batch_size
+        cpu_start = time.thread_time_ns()
+        frames = self._ws.drain(batch_size)
+        if frames and self._pollers:
+            self._log.info("WebSocket feed recovered, stopping REST polling")
+            self._stop_book_polling()
+        handle = self._handle_ws_record if getattr(self._ws, "decodes_frames", False) else self._handle_ws_message
+        for ts_recv, item in frames:
+            handle(item, ts_recv)
+        self._ws_dispatch["cpu_ns"] += time.thread_time_ns() - cpu_start
+        self._ws_dispatch["frames"] += len(frames)
+        self._ws_dispatch["batches"] += 1
+        if len(frames) == batch_size:
+            self._loop.call_soon(self._drain_ws_queue)
+
+    def _handle_ws_message(self, raw: str, ts_recv: int) -> None:
+        """Route a channel update frame to its handler by channel prefix."""
+        try:
+            params = json.loads(raw)["params"]
+            self._route(params["channel"], params["data"], ts_recv)
+        except Exception as e:
+            self._log.error(f"Failed to handle WebSocket message: {e}")
+
+    def _handle_ws_record(self, record: tuple, ts_recv: int) -> None:
+        """Handle a record already decoded by the ingestion worker process."""
+        try:
+            kind = record[0]
+            if kind == RECORD_QUOTE:
+                self._handle_quote_record(record, ts_recv)
+            elif kind == RECORD_TRADE:
+                self._handle_trade_record(record, ts_recv)
+            else:
+                self._route(record[1], record[2], ts_recv)
+        except Exception as e:
+            self._log.error(f"Failed to handle ingested record: {e}")
+
+    def _route(self, channel: str, data: Any, ts_recv: int) -> None:
+        seq = data.get("seq_no") if isinstance(data, dict) else None
+        if seq is not None and not self._gaps.on_message(channel, int(seq)):
+            return  # Duplicate or already covered by a resync
+        handler = self._channel_handlers.get(channel.partition(".")[0])
+        if handler is not None:
+            handler(channel, data, ts_recv)
+
+    def _handle_quote_record(self, record: tuple, ts_recv: int) -> None:
+        _, symbol, bid, ask, bid_size, ask_size, ts_event, seq = record
+        if seq >= 0 and not self._gaps.on_message(f"bbo.{symbol}", seq):
+            return
+        entry = self._instrument_provider.resolve(symbol)
+        if entry is None:
+            return
+        instrument = entry.instrument
+        quote = QuoteTick(
+            instrument_id=instrument.id,
+            bid_price=instrument.make_price(bid),
+            ask_price=instrument.make_price(ask),
+            bid_size=instrument.make_qty(bid_size),
+            ask_size=instrument.make_qty(ask_size),
+            ts_event=ts_event,
+            ts_init=ts_recv,
+        )
+        self._dispatch("bbo", quote, ts_recv)
+        if self._fanout is not None:
+            self._fanout.write_quote(quote)
+
+    def _handle_trade_record(self, record: tuple, ts_recv: int) -> None:
+        _, symbol, price, size, aggressor, ts_event, trade_id = record
+        entry = self._instrument_provider.resolve(symbol)
+        if entry is None:
+            return
+        instrument = entry.instrument
+        trade = TradeTick(
+            instrument_id=instrument.id,
+            price=instrument.make_price(price),
+            size=instrument.make_qty(size),
+            aggressor_side=AggressorSide(aggressor),
+            trade_id=TradeId(trade_id),
+            ts_event=ts_event,
+            ts_init=ts_recv,
+        )
+        self._dispatch("trades", trade, ts_recv)
+        if self._fanout is not None:
+            self._fanout.write_trade(trade)
+
+    def _dispatch(self, channel: str, data: Any, ts_recv: int) -> None:
+        """Publish decoded data, keep it as the last value and record its latency."""
+        self._handle_data(data)
+        self._last_values.update(data)
+        self._latency.record(channel, data.ts_event, ts_recv, self._clock.timestamp_ns())
+
+    def _handle_orderbook(self, channel: str, data: dict, ts_recv: int) -> None:
+        entry = self._instrument_provider.resolve(channel.split(".")[1])
+        if entry is None:
+            return
+        instrument_id = entry.instrument_id
+        differ = self._books.get(instrument_id)
+        if differ is None:
+            return
+        deltas = differ.apply(data, ts_recv)
+        if deltas is not None:
+            self._publish_book(instrument_id, deltas)
+            self._latency.record(channel, deltas.ts_event, ts_recv, self._clock.timestamp_ns())
+
+    def _publish_book(self, instrument_id: InstrumentId, deltas: Any) -> None:
+        """Publish book deltas to their subscribers and the derived metrics, if changed, to theirs."""
+        differ = self._books[instrument_id]
+        if instrument_id in self._book_subscriptions:
+            self._handle_data(deltas)
+        if self._fanout is not None:
+            top = differ.top()
+            if top is not None:
+                self._fanout.write_book_top(instrument_id.symbol.value, top, deltas.ts_event, deltas.ts_init)
+        metrics = differ.metrics
+        if metrics is not None:
+            data = metrics.data(deltas.ts_event, deltas.ts_init)
+            if data is not None:
+                self._handle_data(data)
+                self._last_values.update(data)
+
+    async def _acquire_book(self, instrument_id: InstrumentId) -> BookDiffer | None:
+        """Return the differ for a book, subscribing its channel if not yet maintained."""
+        differ = self._books.get(instrument_id)
+        if differ is not None:
+            return differ
+        instrument = await self._instrument_provider.load_async(instrument_id)
+        if instrument is None:
+            self._log.error(f"Cannot subscribe to order book: no instrument for {instrument_id}")
+            return None
+
+        # Book frames are diffed against the previous state, so only real changes are published
+        differ = BookDiffer(instrument)
+        self._books[instrument_id] = differ
+        await self._ws.subscribe(f"orderbook.{instrument_id.symbol.value}")
+        return differ
+
+    async def _release_book(self, instrument_id: InstrumentId) -> None:
+        """Stop maintaining a book once neither its deltas nor its metrics are subscribed."""
+        differ = self._books.get(instrument_id)
+        if differ is None or instrument_id in self._book_subscriptions or differ.metrics is not None:
+            return
+        await self._ws.unsubscribe(f"orderbook.{instrument_id.symbol.value}")
+        self._stop_book_polling(instrument_id)
+        del self._books[instrument_id]
+
+    async def _subscribe_book_metrics(self, instrument_id: InstrumentId) -> None:
+        differ = await self._acquire_book(instrument_id)
+        if differ is None or differ.metrics is not None:
+            return
+        differ.attach_metrics(IncrementalBookMetrics(instrument_id, self._config.book_metrics_depth))
+        self._serve_last_value(ParadexBookMetrics, instrument_id)
+
+    async def _unsubscribe_book_metrics(self, instrument_id: InstrumentId) -> None:
+        differ = self._books.get(instrument_id)
+        if differ is not None:
+            differ.attach_metrics(None)
+            await self._release_book(instrument_id)
+
+    def _handle_bbo(self, channel: str, data: dict, ts_recv: int) -> None:
+        entry = self._instrument_provider.resolve(data["market"])
+        if entry is None:
+            return
+        quote = parse_quote_tick(data, entry.instrument, ts_recv)
+        self._dispatch(channel, quote, ts_recv)
+        if self._fanout is not None:
+            self._fanout.write_quote(quote)
+
+    def _handle_trades(self, channel: str, data: dict, ts_recv: int) -> None:
+        entry = self._instrument_provider.resolve(data["market"])
+        if entry is None:
+            return
+        trade = parse_trade_tick(data, entry.instrument, ts_recv)
+        self._dispatch(channel, trade, ts_recv)
+        if self._fanout is not None:
+            self._fanout.write_trade(trade)
+
+    def _serve_last_value(self, data_cls: type, instrument_id: InstrumentId) -> None:
+        """Publish the cached last value, if fresh, so a new subscriber needn't wait."""
+        data = self._last_values.get(data_cls, instrument_id)
+        if data is not None and self._is_fresh(data):
+            self._log.debug(f"Serving last {data_cls.__name__} for {instrument_id}")
+            self._handle_data(data)
+
+    def _is_fresh(self, data: Any) -> bool:
+        max_age_ns = self._config.last_value_max_age_secs * 1_000_000_000
+        return self._clock.timestamp_ns() - data.ts_init <= max_age_ns
+
+    def _handle_markets_summary(self, channel: str, data: dict, ts_recv: int) -> None:
+        for item in self._summary.handle(data, ts_recv):
+            self._dispatch(channel, item, ts_recv)
+
+    async def _update_ws_channels(self, subscribe: list[str], unsubscribe: list[str]) -> None:
+        # Subscribe before unsubscribing so channel switches leave no gap
+        for channel in subscribe:
+            await self._ws.subscribe(channel)
+        for channel in unsubscribe:
+            await self._ws.unsubscribe(channel)
+
+    async def _subscribe_summary(self, kind: SummaryKind, instrument_id: InstrumentId) -> None:
+        await self._update_ws_channels(*self._summary.subscribe(kind, instrument_id))
+
+        # Serve the last summary frame so the subscriber needn't wait for the next one
+        data = self._summary.last(kind, instrument_id)
+        if data is not None and self._is_fresh(data):
+            self._handle_data(data)
+
+    async def _unsubscribe_summary(self, kind: SummaryKind, instrument_id: InstrumentId) -> None:
+        await self._update_ws_channels(*self._summary.unsubscribe(kind, instrument_id))
 
     # -------------------------------------------------------------------------
     # SUBSCRIPTION METHODS (Bug #001 - Fixed: Now accept command objects)
@@ -96,8 +541,8 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to trade ticks for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
-        # await self._ws.subscribe_trades(instrument_id)
+        await self._instrument_provider.load_async(instrument_id)  # Trades are parsed with it
+        await self._ws.subscribe(f"trades.{instrument_id.symbol.value}")
 
     async def _subscribe_quote_ticks(self, command: SubscribeQuoteTicks) -> None:
         """
@@ -107,8 +552,8 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to quote ticks for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
-        # await self._ws.subscribe_quotes(instrument_id)
+        await self._ws.subscribe(f"bbo.{instrument_id.symbol.value}")
+        self._serve_last_value(QuoteTick, instrument_id)
 
     async def _subscribe_order_book_deltas(self, command: SubscribeOrderBookDeltas) -> None:
         """
@@ -118,8 +563,13 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to order book deltas for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
-        # await self._ws.subscribe_order_book_deltas(instrument_id, book_type=command.book_type)
+        differ = await self._acquire_book(instrument_id)
+        if differ is None:
+            return
+        if instrument_id not in self._book_subscriptions:
+            self._book_subscriptions.add(instrument_id)
+            # Already maintained for metrics: republish the book in full for the new subscriber
+            differ.reset()
 
     async def _subscribe_order_book_snapshots(self, command: SubscribeOrderBookSnapshots) -> None:
         """
@@ -144,8 +594,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from trade ticks for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
-        # await self._ws.unsubscribe_trades(instrument_id)
+        await self._ws.unsubscribe(f"trades.{instrument_id.symbol.value}")
 
     async def _unsubscribe_quote_ticks(self, command: UnsubscribeQuoteTicks) -> None:
         """
@@ -155,8 +604,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from quote ticks for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
-        # await self._ws.unsubscribe_quotes(instrument_id)
+        await self._ws.unsubscribe(f"bbo.{instrument_id.symbol.value}")
 
     # -------------------------------------------------------------------------
     # BASE METHODS (Bug #002 - Missing: 3 methods)
@@ -170,11 +618,8 @@ class ParadexDataClient(LiveDataClient):
         Routes to specific subscription methods based on data type.
         """
         self._log.info(f"Subscribing to data type: {data_type}")
-        # TODO: Route to specific subscription methods
-        # Example:
-        # if data_type == DataType.BAR:
-        #     await self._subscribe_bars(...)
-        pass
+        if data_type.type is ParadexBookMetrics:
+            await self._subscribe_book_metrics(InstrumentId.from_str(data_type.metadata["instrument_id"]))
 
     async def _unsubscribe(self, data_type: DataType) -> None:
         """
@@ -184,8 +629,8 @@ class ParadexDataClient(LiveDataClient):
         Routes to specific unsubscription methods based on data type.
         """
         self._log.info(f"Unsubscribing from data type: {data_type}")
-        # TODO: Route to specific unsubscription methods
-        pass
+        if data_type.type is ParadexBookMetrics:
+            await self._unsubscribe_book_metrics(InstrumentId.from_str(data_type.metadata["instrument_id"]))
 
     async def _request(self, data_type: DataType, correlation_id: UUID4) -> None:
         """
@@ -221,7 +666,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to mark prices for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
+        await self._subscribe_summary(SummaryKind.MARK_PRICE, instrument_id)
 
     async def _subscribe_funding_rate(self, command: SubscribeFundingRates) -> None:
         """
@@ -231,7 +676,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to funding rates for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
+        await self._subscribe_summary(SummaryKind.FUNDING_RATE, instrument_id)
 
     async def _subscribe_index_price(self, command: SubscribeIndexPrices) -> None:
         """
@@ -241,7 +686,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to index prices for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
+        await self._subscribe_summary(SummaryKind.INDEX_PRICE, instrument_id)
 
     async def _subscribe_instrument_status(self, command: SubscribeInstrumentStatus) -> None:
         """
@@ -271,7 +716,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Subscribing to open interest for {instrument_id}...")
-        # TODO: Implement WebSocket subscription
+        await self._subscribe_summary(SummaryKind.OPEN_INTEREST, instrument_id)
 
     async def _subscribe_liquidations(self, command: SubscribeLiquidations) -> None:
         """
@@ -305,7 +750,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from mark prices for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
+        await self._unsubscribe_summary(SummaryKind.MARK_PRICE, instrument_id)
 
     async def _unsubscribe_funding_rate(self, command: UnsubscribeFundingRates) -> None:
         """
@@ -315,7 +760,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from funding rates for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
+        await self._unsubscribe_summary(SummaryKind.FUNDING_RATE, instrument_id)
 
     async def _unsubscribe_index_price(self, command: UnsubscribeIndexPrices) -> None:
         """
@@ -325,7 +770,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from index prices for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
+        await self._unsubscribe_summary(SummaryKind.INDEX_PRICE, instrument_id)
 
     async def _unsubscribe_instrument_status(self, command: UnsubscribeInstrumentStatus) -> None:
         """
@@ -355,7 +800,7 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from open interest for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
+        await self._unsubscribe_summary(SummaryKind.OPEN_INTEREST, instrument_id)
 
     async def _unsubscribe_liquidations(self, command: UnsubscribeLiquidations) -> None:
         """
@@ -375,7 +820,8 @@ class ParadexDataClient(LiveDataClient):
         """
         instrument_id = command.instrument_id
         self._log.info(f"Unsubscribing from order book deltas for {instrument_id}...")
-        # TODO: Implement WebSocket unsubscription
+        self._book_subscriptions.discard(instrument_id)
+        await self._release_book(instrument_id)
 
     async def _unsubscribe_order_book_snapshots(self, command: UnsubscribeOrderBookSnapshots) -> None:
         """
@@ -394,35 +840,105 @@ class ParadexDataClient(LiveDataClient):
     async def _request_quote_ticks(self, request: RequestQuoteTicks) -> None:
         """
         Request historical quote ticks.
-        
-        Bug #002: Missing request method.
+
+        Paradex exposes no historical BBO endpoint, so an empty batch is
+        returned to complete the request rather than leaving it pending.
         """
         instrument_id = request.instrument_id
-        self._log.debug(f"Requesting quote ticks for {instrument_id}...")
-        # TODO: Implement REST request
-        # await self._http.get_quote_ticks(instrument_id, start=request.start, end=request.end)
+        self._log.warning(
+            f"Historical quote ticks not available from Paradex for {instrument_id}, "
+            "request trade ticks instead",
+        )
+        self._handle_quote_ticks(
+            instrument_id,
+            [],
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
 
     async def _request_trade_ticks(self, request: RequestTradeTicks) -> None:
         """
         Request historical trade ticks.
-        
-        Bug #002: Missing request method.
+
+        Pages the trades endpoint concurrently across time slices and delivers
+        the result as one batch sorted by ``ts_event``.
         """
         instrument_id = request.instrument_id
         self._log.debug(f"Requesting trade ticks for {instrument_id}...")
-        # TODO: Implement REST request
-        # await self._http.get_trade_ticks(instrument_id, start=request.start, end=request.end)
+
+        # Failures still answer with an empty batch so the request never hangs
+        ticks: list[TradeTick] = []
+        instrument = await self._instrument_provider.load_async(instrument_id)
+        if instrument is None:
+            self._log.error(f"Cannot request trade ticks: no instrument for {instrument_id}")
+        else:
+            start_ns, end_ns = self._resolve_request_range(request)
+            try:
+                ticks = await self._history.fetch_trade_ticks(
+                    instrument,
+                    start_ns,
+                    end_ns,
+                    limit=request.limit,
+                )
+            except Exception as e:
+                self._log.error(f"Failed to request trade ticks for {instrument_id}: {e}")
+
+        self._handle_trade_ticks(
+            instrument_id,
+            ticks,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
+
+    def _resolve_request_range(self, request: Any) -> tuple[int, int]:
+        """Return (start_ns, end_ns) for a request, defaulting to one history slice."""
+        end_ns = dt_to_unix_nanos(request.end) if request.end else self._clock.timestamp_ns()
+        if request.start:
+            start_ns = dt_to_unix_nanos(request.start)
+        else:
+            start_ns = end_ns - self._config.history_slice_secs * 1_000_000_000
+        return start_ns, end_ns
 
     async def _request_bars(self, request: RequestBars) -> None:
         """
         Request historical OHLCV bars.
-        
-        Bug #002: Missing request method.
+
+        Served from the local history cache where configured, fetching only
+        the missing gaps from the klines endpoint.
         """
-        instrument_id = request.instrument_id
-        self._log.debug(f"Requesting bars for {instrument_id}...")
-        # TODO: Implement REST request
-        # await self._http.get_bars(instrument_id, bar_type=request.bar_type, start=request.start, end=request.end)
+        bar_type = request.bar_type
+        self._log.debug(f"Requesting bars for {bar_type}...")
+
+        bars: list[Bar] = []
+        instrument = await self._instrument_provider.load_async(bar_type.instrument_id)
+        if instrument is None:
+            self._log.error(f"Cannot request bars: no instrument for {bar_type.instrument_id}")
+        else:
+            start_ns, end_ns = self._resolve_request_range(request)
+            try:
+                bars = await self._history.fetch_bars(
+                    bar_type,
+                    instrument,
+                    start_ns,
+                    end_ns,
+                    limit=request.limit,
+                )
+            except Exception as e:
+                self._log.error(f"Failed to request bars for {bar_type}: {e}")
+
+        self._handle_bars(
+            bar_type,
+            bars,
+            None,
+            request.id,
+            request.start,
+            request.end,
+            request.params,
+        )
 
     async def _request_instrument(self, request: RequestInstrument) -> None:
         """
@@ -449,13 +965,96 @@ class ParadexDataClient(LiveDataClient):
     async def _request_order_book_snapshot(self, request: RequestOrderBookSnapshot) -> None:
         """
         Request current order book snapshot.
-        
-        Bug #002: Missing request method.
+
+        Served from the live local book when one is being maintained,
+        otherwise from a short-TTL cache that coalesces concurrent REST calls.
         """
         instrument_id = request.instrument_id
         self._log.debug(f"Requesting order book snapshot for {instrument_id}...")
-        # TODO: Implement REST request
-        # await self._http.get_order_book(instrument_id, depth=request.depth)
+
+        instrument = await self._instrument_provider.load_async(instrument_id)
+        if instrument is None:
+            self._log.error(f"Cannot request order book: no instrument for {instrument_id}")
+            snapshot = self._empty_book_snapshot(instrument_id)
+        else:
+            snapshot = await self._order_book_snapshot(instrument, request.limit or 0)
+
+        self._handle_data_response(
+            request.data_type,
+            snapshot,
+            request.id,
+            None,
+            None,
+            request.params,
+        )
+
+    async def _order_book_snapshot(self, instrument: Any, depth: int) -> OrderBookDeltas:
+        instrument_id = instrument.id
+        book = self._cache.order_book(instrument_id)
+        if book is not None and book.update_count > 0:
+            self._snapshot_cache.record_live_book_hit(self._clock.timestamp_ns() - book.ts_last)
+            return self._snapshot_from_book(book, instrument, depth)
+
+        try:
+            book_data = await self._snapshot_cache.get(
+                instrument_id,
+                lambda: self._fetch_order_book(instrument),
+            )
+        except Exception as e:
+            self._log.error(f"Failed to request order book for {instrument_id}: {e}")
+            return self._empty_book_snapshot(instrument_id)
+
+        return parse_order_book_snapshot(
+            book_data,
+            instrument,
+            self._clock.timestamp_ns(),
+            depth,
+        )
+
+    def _empty_book_snapshot(self, instrument_id: InstrumentId) -> OrderBookDeltas:
+        # A cleared book answers a failed request so the caller is not left waiting
+        now = self._clock.timestamp_ns()
+        return build_book_snapshot(instrument_id, [], [], now, now)
+
+    async def _resync_order_book(self, channel: str) -> int | None:
+        """Replace the local book for ``channel`` with a fresh REST snapshot."""
+        symbol = channel.split(".")[1]
+        entry = self._instrument_provider.resolve(symbol)
+        if entry is None:
+            raise ValueError(f"No instrument for {symbol}")
+        instrument_id = entry.instrument_id
+        instrument = entry.instrument
+
+        # Bypass the snapshot cache: a cached book may predate the gap
+        book_data = await self._fetch_order_book(instrument)
+        differ = self._books.get(instrument_id)
+        if differ is not None:
+            differ.reset()
+            self._publish_book(instrument_id, differ.apply(book_data, self._clock.timestamp_ns()))
+        else:
+            self._handle_data(
+                parse_order_book_snapshot(book_data, instrument, self._clock.timestamp_ns()),
+            )
+        seq = book_data.get("seq_no")
+        return int(seq) if seq is not None else None
+
+    async def _fetch_order_book(self, instrument: Any) -> dict:
+        payload = await self._http.get_orderbook(instrument.raw_symbol.value)
+        return json.loads(payload)
+
+    def _snapshot_from_book(self, book: Any, instrument: Any, depth: int) -> Any:
+        bids = book.bids()
+        asks = book.asks()
+        if depth > 0:
+            bids = bids[:depth]
+            asks = asks[:depth]
+        return build_book_snapshot(
+            instrument.id,
+            [(level.price, instrument.make_qty(level.size())) for level in bids],
+            [(level.price, instrument.make_qty(level.size())) for level in asks],
+            book.ts_last,
+            self._clock.timestamp_ns(),
+        )
 
     async def _request_data(self, request: RequestData) -> None:
         """
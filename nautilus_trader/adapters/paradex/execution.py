@@ -28,7 +28,6 @@ from nautilus_trader.model.enums import OmsType
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientId
 from nautilus_trader.model.identifiers import InstrumentId
-from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import VenueOrderId
 
 from nautilus_trader.adapters.paradex.config import ParadexExecClientConfig
@@ -36,9 +35,17 @@ from nautilus_trader.adapters.paradex.constants import PARADEX
 from nautilus_trader.execution.client import LiveExecutionClient
 
 # Factory imports (will be adapted for Paradex)
-from nautilus_trader.adapters.paradex.factories import parse_fill_report
-from nautilus_trader.adapters.paradex.factories import parse_order_status_report
-from nautilus_trader.adapters.paradex.factories import parse_position_status_report
+from nautilus_trader.adapters.paradex.factories import ReportParseError
+from nautilus_trader.adapters.paradex.factories import parse_fill_reports
+from nautilus_trader.adapters.paradex.factories import parse_order_status_reports
+from nautilus_trader.adapters.paradex.factories import parse_position_status_reports
+from nautilus_trader.adapters.paradex.schemas import ParadexFill
+from nautilus_trader.adapters.paradex.schemas import ParadexOrder
+from nautilus_trader.adapters.paradex.schemas import ParadexPosition
+from nautilus_trader.adapters.paradex.schemas import convert_row
+from nautilus_trader.adapters.paradex.schemas import page_rows
+from nautilus_trader.adapters.paradex.state import TrackedOrder
+from nautilus_trader.adapters.paradex.state import TrackedPosition
 
 
 class ParadexExecutionClient(LiveExecutionClient):
@@ -77,8 +84,12 @@ class ParadexExecutionClient(LiveExecutionClient):
         self._http = http_client
         self._config = config
 
-        # CRITICAL: Track emitted fills for deduplication
-        self._emitted_fills: set[TradeId] = set()
+        # CRITICAL: Track emitted fills for deduplication (venue trade IDs)
+        self._emitted_fills: set[str] = set()
+
+        # Open orders (by venue order ID) and positions (by symbol) from REST
+        self._orders: dict[str, TrackedOrder] = {}
+        self._positions: dict[str, TrackedPosition] = {}
 
         # CRITICAL: Track last reconciliation time
         self._last_reconcile_time = 0
@@ -127,9 +138,7 @@ class ParadexExecutionClient(LiveExecutionClient):
         # TODO: Sign order with subkey private key
         # TODO: Submit order via HTTP client
 
-        # Track order locally (for reconciliation)
-        # order_id = VenueOrderId(f"order_{int(self._clock.timestamp_ms())}")
-        self._emitted_orders.add(order_id)
+        # The order is tracked once reconciliation sees it open on the venue
 
         self._log.info(f"Order submitted: {order.client_order_id}")
 
@@ -142,8 +151,7 @@ class ParadexExecutionClient(LiveExecutionClient):
             await self._http.cancel_order(str(order_id))
 
             # Track cancellation
-            if order_id in self._emitted_orders:
-                self._emitted_orders.remove(order_id)
+            self._orders.pop(order_id.value, None)
 
             self._log.info(f"Order cancelled: {order_id}")
         except Exception as e:
@@ -160,15 +168,14 @@ class ParadexExecutionClient(LiveExecutionClient):
 
     async def _cancel_all_orders(self, command: CancelAllOrders) -> None:
         """Cancel all orders."""
-        orders = await self._http.get_open_orders()
+        orders = page_rows(await self._http.get_open_orders())
 
         count = 0
         for order in orders:
             try:
-                await self._http.cancel_order(order["id"])
-                order_id = VenueOrderId(order["id"])
-                if order_id in self._emitted_orders:
-                    self._emitted_orders.remove(order_id)
+                order_id = convert_row(order, ParadexOrder).id
+                await self._http.cancel_order(order_id)
+                self._orders.pop(order_id, None)
                 count += 1
             except Exception as e:
                 self._log.error(f"Cancel failed: {e}")
@@ -181,9 +188,7 @@ class ParadexExecutionClient(LiveExecutionClient):
         for cancellation in command.cancellations:
             try:
                 await self._http.cancel_order(str(cancellation.venue_order_id))
-                order_id = VenueOrderId(cancellation.venue_order_id)
-                if order_id in self._emitted_orders:
-                    self._emitted_orders.remove(order_id)
+                self._orders.pop(str(cancellation.venue_order_id), None)
                 count += 1
             except Exception as e:
                 self._log.error(f"Cancel failed: {e}")
@@ -208,9 +213,6 @@ class ParadexExecutionClient(LiveExecutionClient):
                 # Convert SubmitOrder to SubmitOrder command for existing method
                 # SubmitOrder has: client_order_id, strategy_id, instrument_id, order
                 await self._submit_order(order_command)
-                
-                # Track the order
-                self._emitted_orders.add(order_command.client_order_id)
                 count += 1
                 
                 self._log.debug(f"Submitted order {order_command.client_order_id} from list")
@@ -273,29 +275,16 @@ class ParadexExecutionClient(LiveExecutionClient):
         
         try:
             # Fetch all open orders from REST
-            open_orders = await self._http.get_open_orders()
+            open_orders = page_rows(await self._http.get_open_orders())
             
             # Convert to Nautilus OrderStatusReport format
-            reports = []
-            for order_data in open_orders:
-                try:
-                    instrument = self._instrument_provider.find_instrument(
-                        InstrumentId.from_str(order_data["instrument_id"])
-                    )
-                    if instrument is None:
-                        self._log.warning(f"Instrument not found for {order_data['instrument_id']}")
-                        continue
-                    
-                    report = parse_order_status_report(
-                        order_data,
-                        instrument,
-                        AccountId(self._account_id),
-                        self._clock,
-                    )
-                    reports.append(report)
-                    
-                except Exception as e:
-                    self._log.error(f"Failed to parse order {order_data.get('id', 'unknown')}: {e}")
+            reports, errors = parse_order_status_reports(
+                open_orders,
+                self._instrument_provider.resolve,
+                AccountId(self._account_id),
+                self._clock,
+            )
+            self._log_parse_errors("order", errors)
             
             self._log.info(f"Generated mass status for {len(reports)} orders")
             return reports
@@ -316,84 +305,115 @@ class ParadexExecutionClient(LiveExecutionClient):
         """
         self._log.info("Starting state reconciliation...")
 
-        # 1. Fetch open orders from REST
+        if not await self._reconcile_orders():
+            return
+        if not await self._reconcile_fills():
+            return
+        if not await self._reconcile_positions():
+            return
+
+        # Update last reconciliation time
+        self._last_reconcile_time = self._clock.timestamp_ns()
+
+        self._log.info("State reconciliation complete")
+
+    async def _reconcile_orders(self) -> bool:
+        """Generate order status reports for open orders from REST."""
         try:
-            open_orders = await self._http.get_open_orders()
+            open_orders = page_rows(await self._http.get_open_orders())
         except Exception as e:
             self._log.error(f"Failed to fetch open orders: {e}")
-            return
+            return False
 
-        # 2. Generate order status reports
-        for order_data in open_orders:
-            try:
-                instrument = self._instrument_provider.find_instrument(
-                    InstrumentId.from_str(order_data["instrument_id"])
-                )
-                report = parse_order_status_report(
-                    order_data,
-                    instrument,
-                    AccountId(self._account_id),
-                    self._clock,
-                )
-                self._send_order_status_report(report)
-            except Exception as e:
-                self._log.error(f"Failed to parse order: {e}")
+        orders: dict[str, TrackedOrder] = {}
 
-        # 3. Fetch recent fills (since last reconciliation)
+        def track(order: ParadexOrder) -> bool:
+            orders[order.id] = TrackedOrder.from_order(order)
+            return True
+
+        reports, errors = parse_order_status_reports(
+            open_orders,
+            self._instrument_provider.resolve,
+            AccountId(self._account_id),
+            self._clock,
+            on_row=track,
+        )
+        self._log_parse_errors("order", errors)
+        self._orders = orders
+        for report in reports:
+            self._send_order_status_report(report)
+        return True
+
+    async def _reconcile_fills(self) -> bool:
+        """Generate fill reports since the last reconciliation (with deduplication)."""
         try:
-            fills = await self._http.get_fills(start_time=self._last_reconcile_time)
+            fills = page_rows(await self._http.get_fills(start_time=self._last_reconcile_time))
         except Exception as e:
             self._log.error(f"Failed to fetch fills: {e}")
-            return
+            return False
+
+        # CRITICAL: Deduplicate - only emit if not already emitted
+        new_trade_ids: list[str] = []
+
+        def is_new(fill: ParadexFill) -> bool:
+            if fill.trade_id in self._emitted_fills:
+                return False
+            new_trade_ids.append(fill.trade_id)
+            return True
+
+        reports, errors = parse_fill_reports(
+            fills,
+            self._instrument_provider.resolve,
+            AccountId(self._account_id),
+            self._clock,
+            on_row=is_new,
+        )
+        self._log_parse_errors("fill", errors)
 
-        # 4. Generate fill reports (with deduplication)
-        for fill_data in fills:
-            trade_id = TradeId(fill_data["trade_id"])
-
-            # CRITICAL: Deduplicate - only emit if not already emitted
-            if trade_id not in self._emitted_fills:
-                try:
-                    instrument = self._instrument_provider.find_instrument(
-                        InstrumentId.from_str(fill_data["instrument_id"])
-                    )
-                    report = parse_fill_report(
-                        fill_data,
-                        instrument,
-                        AccountId(self._account_id),
-                        self._clock,
-                    )
-                    self._send_fill_report(report)
-                    self._emitted_fills.add(trade_id)
-                except Exception as e:
-                    self._log.error(f"Failed to parse fill: {e}")
-
-        # 5. Fetch positions
+        # Failed fills are not marked, so they are retried next pass
+        failed = set()
+        for error in errors:
+            try:
+                failed.add(convert_row(error.row, ParadexFill).trade_id)
+            except Exception:
+                continue  # Malformed rows never reached deduplication
+        self._emitted_fills.update(t for t in new_trade_ids if t not in failed)
+        for report in reports:
+            self._send_fill_report(report)
+        return True
+
+    async def _reconcile_positions(self) -> bool:
+        """Generate position status reports from REST."""
         try:
-            positions = await self._http.get_positions()
+            positions = page_rows(await self._http.get_positions())
         except Exception as e:
             self._log.error(f"Failed to fetch positions: {e}")
-            return
+            return False
 
-        # 6. Generate position reports
-        for position_data in positions:
-            try:
-                instrument = self._instrument_provider.find_instrument(
-                    InstrumentId.from_str(position_data["instrument_id"])
-                )
-                report = parse_position_status_report(
-                    position_data,
-                    instrument,
-                    AccountId(self._account_id),
-                    self._clock,
-                )
-                self._send_position_status_report(report)
-            except Exception as e:
-                self._log.error(f"Failed to parse position: {e}")
+        tracked_positions: dict[str, TrackedPosition] = {}
 
-        # Update last reconciliation time
-        self._last_reconcile_time = self._clock.timestamp_ns()
+        def track(position: ParadexPosition) -> bool:
+            tracked = TrackedPosition.from_position(position)
+            tracked_positions[tracked.symbol] = tracked
+            return True
 
-        self._log.info("State reconciliation complete")
+        reports, errors = parse_position_status_reports(
+            positions,
+            self._instrument_provider.resolve,
+            AccountId(self._account_id),
+            self._clock,
+            on_row=track,
+        )
+        self._log_parse_errors("position", errors)
+        self._positions = tracked_positions
+        for report in reports:
+            self._send_position_status_report(report)
+        return True
+
+    def _log_parse_errors(self, kind: str, errors: list[ReportParseError]) -> None:
+        for error in errors:
+            row_id = getattr(error.row, "id", None) or "row"  # Undecoded rows carry no id
+            self._log.error(f"Failed to parse {kind} {row_id}: {error.error}")
 
     async def _run_reconciliation_loop(self) -> None:
         """Run periodic reconciliation in background."""
@@ -1,18 +1,36 @@
 # nautilus_trader/adapters/paradex/factories.py
 """Type conversion factories for Paradex."""
 
+from collections.abc import Callable
 from decimal import Decimal
+from typing import Any
+from typing import NamedTuple
 
 from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.core.uuid import UUID4
 from nautilus_trader.execution.reports import FillReport
 from nautilus_trader.execution.reports import OrderStatusReport
 from nautilus_trader.execution.reports import PositionStatusReport
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import BookOrder
+from nautilus_trader.model.data import FundingRateUpdate
+from nautilus_trader.model.data import IndexPriceUpdate
+from nautilus_trader.model.data import MarkPriceUpdate
+from nautilus_trader.model.data import OrderBookDelta
+from nautilus_trader.model.data import OrderBookDeltas
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import RecordFlag
 from nautilus_trader.model.enums import LiquiditySide
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import OrderSide as Side
 from nautilus_trader.model.enums import OrderStatus
 from nautilus_trader.model.enums import OrderType
 from nautilus_trader.model.enums import PositionSide
+from nautilus_trader.model.enums import TimeInForce
 from nautilus_trader.model.identifiers import AccountId
 from nautilus_trader.model.identifiers import ClientOrderId
 from nautilus_trader.model.identifiers import InstrumentId
@@ -21,126 +39,502 @@ from nautilus_trader.model.identifiers import TradeId
 from nautilus_trader.model.identifiers import Venue
 from nautilus_trader.model.identifiers import VenueOrderId
 from nautilus_trader.model.instruments import CryptoPerpetual
+from nautilus_trader.model.objects import FIXED_PRECISION
+from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.objects import Money
 from nautilus_trader.model.objects import Price
 from nautilus_trader.model.objects import Quantity
 
+from nautilus_trader.adapters.paradex.schemas import ParadexFill
+from nautilus_trader.adapters.paradex.schemas import ParadexMarket
+from nautilus_trader.adapters.paradex.schemas import ParadexOrder
+from nautilus_trader.adapters.paradex.schemas import ParadexPosition
+from nautilus_trader.adapters.paradex.schemas import convert_row
+from nautilus_trader.adapters.paradex.types import ParadexOpenInterest
 
-def parse_instrument(market_data: dict, venue: Venue) -> CryptoPerpetual:
+
+_MARGIN_INIT = Decimal("0.1")
+_MARGIN_MAINT = Decimal("0.05")
+_MAKER_FEE = Decimal("0.0002")
+_TAKER_FEE = Decimal("0.0005")
+
+# Markets share a handful of tick sizes, limits and currencies, so their
+# objects are built once per distinct venue string and reused
+_PRECISIONS: dict[str, int] = {}
+_PRICES: dict[str, Price] = {}
+_QUANTITIES: dict[str, Quantity] = {}
+_CURRENCIES: dict[str, Currency] = {}
+
+
+def decimal_precision(value: str) -> int:
+    """Return the number of decimal places in a venue decimal string, e.g. 2 for "0.01", 5 for "5e-05"."""
+    precision = _PRECISIONS.get(value)
+    if precision is None:
+        precision = _PRECISIONS[value] = max(0, -Decimal(value).as_tuple().exponent)
+    return precision
+
+
+def _price(value: str) -> Price:
+    price = _PRICES.get(value)
+    if price is None:
+        price = _PRICES[value] = Price(float(Decimal(value)), decimal_precision(value))
+    return price
+
+
+def _quantity(value: str, precision: int) -> Quantity:
+    key = f"{value}/{precision}"
+    quantity = _QUANTITIES.get(key)
+    if quantity is None:
+        quantity = _QUANTITIES[key] = Quantity(float(Decimal(value)), precision)
+    return quantity
+
+
+def _currency(code: str) -> Currency:
+    currency = _CURRENCIES.get(code)
+    if currency is None:
+        currency = _CURRENCIES[code] = Currency.from_str(code, strict=False)
+    return currency
+
+
+# Raw fixed-point scale for each precision, e.g. 10**7 for 2 decimal places at FIXED_PRECISION 9
+_RAW_SCALES = [10 ** (FIXED_PRECISION - precision) for precision in range(FIXED_PRECISION + 1)]
+
+
+def _to_raw(value: str, precision: int) -> int | None:
+    """
+    Convert a plain venue decimal string to a raw fixed-point integer at ``precision``.
+
+    Returns None for exponent notation or more significant decimals than
+    ``precision``, which the callers then parse through ``Decimal``.
+    """
+    whole, _, frac = value.partition(".")
+    frac = frac.rstrip("0")
+    if len(frac) > precision or "e" in value or "E" in value:
+        return None
+    return int(whole + frac.ljust(precision, "0")) * _RAW_SCALES[precision]
+
+
+def _make_price(value: str, instrument: CryptoPerpetual) -> Price:
+    precision = instrument.price_precision
+    raw = _to_raw(value, precision)
+    if raw is None:
+        return instrument.make_price(Decimal(value))
+    return Price.from_raw(raw, precision)
+
+
+def _make_qty(value: str, instrument: CryptoPerpetual) -> Quantity:
+    precision = instrument.size_precision
+    raw = _to_raw(value, precision)
+    if raw is None:
+        return instrument.make_qty(Decimal(value))
+    return Quantity.from_raw(raw, precision)
+
+
+def _make_money(value: str, currency_code: str) -> Money:
+    currency = _currency(currency_code)
+    raw = _to_raw(value, currency.precision)
+    if raw is None:
+        return Money(Decimal(value), currency)
+    return Money.from_raw(raw, currency)
+
+
+def parse_instruments(markets: list[ParadexMarket], venue: Venue) -> list[CryptoPerpetual]:
+    """Parse a batch of Paradex markets to Nautilus instruments."""
+    instruments = []
+    for market_data in markets:
+        symbol = Symbol(market_data.symbol)
+        quote_currency = _currency(market_data.quote_currency)
+        size_precision = decimal_precision(market_data.quantity_tick_size)
+        instruments.append(
+            CryptoPerpetual(
+                instrument_id=InstrumentId(symbol, venue),
+                raw_symbol=symbol,
+                base_currency=_currency(market_data.base_currency),
+                quote_currency=quote_currency,
+                settlement_currency=quote_currency,
+                is_inverse=False,
+                price_precision=decimal_precision(market_data.price_tick_size),
+                size_precision=size_precision,
+                price_increment=_price(market_data.price_tick_size),
+                size_increment=_quantity(market_data.quantity_tick_size, size_precision),
+                max_quantity=_quantity(market_data.max_quantity, size_precision),
+                min_quantity=_quantity(market_data.min_quantity, size_precision),
+                max_price=None,
+                min_price=None,
+                margin_init=_MARGIN_INIT,
+                margin_maint=_MARGIN_MAINT,
+                maker_fee=_MAKER_FEE,
+                taker_fee=_TAKER_FEE,
+                ts_event=0,
+                ts_init=0,
+            ),
+        )
+    return instruments
+
+
+def parse_instrument(market_data: ParadexMarket, venue: Venue) -> CryptoPerpetual:
     """Parse Paradex market to Nautilus instrument."""
-    return CryptoPerpetual(
-        instrument_id=InstrumentId(Symbol(market_data["symbol"]), venue),
-        raw_symbol=Symbol(market_data["symbol"]),
-        base_currency=market_data["base_currency"],
-        quote_currency=market_data["quote_currency"],
-        settlement_currency=market_data["quote_currency"],
-        is_inverse=False,
-        price_precision=len(market_data["price_tick_size"].split(".")[-1]),
-        size_precision=len(market_data["quantity_tick_size"].split(".")[-1]),
-        price_increment=Price.from_str(market_data["price_tick_size"]),
-        size_increment=Quantity.from_str(market_data["quantity_tick_size"]),
-        max_quantity=Quantity.from_str(market_data["max_quantity"]),
-        min_quantity=Quantity.from_str(market_data["min_quantity"]),
-        max_price=None,
-        min_price=None,
-        margin_init=Decimal("0.1"),
-        margin_maint=Decimal("0.05"),
-        maker_fee=Decimal("0.0002"),
-        taker_fee=Decimal("0.0005"),
-        ts_event=0,
-        ts_init=0,
-    )
+    return parse_instruments([market_data], venue)[0]
+
+
+class ReportParseError(NamedTuple):
+    """A REST result row that could not be parsed into a report."""
+
+    row: Any
+    error: Exception
+
+
+def _parse_reports(
+    parse: Callable[[Any, CryptoPerpetual, AccountId, int], Any],
+    row_type: type,
+    results: list[Any],
+    resolve: Callable[[str], Any],
+    account_id: AccountId,
+    clock,
+    on_row: Callable[[Any], bool] | None = None,
+) -> tuple[list[Any], list[ReportParseError]]:
+    """
+    Convert and parse every row of a REST ``results`` page with one ``ts_init``.
+
+    Rows may be typed, or undecoded as returned by ``page_rows``. ``resolve``
+    maps a row's ``market`` (or ``instrument_id``) to an entry with an
+    ``instrument`` (see ``ParadexInstrumentProvider.resolve``). ``on_row`` is
+    called with each converted row and skips it by returning False. Rows that
+    fail, including malformed rows and those for unknown instruments, are
+    returned as errors rather than raised, so one bad row does not drop the page.
+    """
+    ts_init = clock.timestamp_ns()
+    reports = []
+    errors = []
+    for row in results:
+        try:
+            data = convert_row(row, row_type)
+            if on_row is not None and not on_row(data):
+                continue
+            symbol = data.market or data.instrument_id
+            entry = resolve(symbol)
+            if entry is None:
+                raise KeyError(f"Instrument not found for {symbol}")
+            reports.append(parse(data, entry.instrument, account_id, ts_init))
+        except Exception as e:
+            errors.append(ReportParseError(row, e))
+    return reports, errors
 
 
 def parse_order_status_report(
-    order_data: dict,
+    order_data: ParadexOrder,
     instrument: CryptoPerpetual,
     account_id: AccountId,
     clock,
 ) -> OrderStatusReport:
     """Parse Paradex order to OrderStatusReport."""
+    return _order_status_report(order_data, instrument, account_id, clock.timestamp_ns())
+
+
+def parse_order_status_reports(
+    results: list[Any],
+    resolve: Callable[[str], Any],
+    account_id: AccountId,
+    clock,
+    on_row: Callable[[ParadexOrder], bool] | None = None,
+) -> tuple[list[OrderStatusReport], list[ReportParseError]]:
+    """Parse a page of Paradex orders to OrderStatusReports, collecting failed rows."""
+    return _parse_reports(_order_status_report, ParadexOrder, results, resolve, account_id, clock, on_row)
+
+
+def _order_status_report(
+    order_data: ParadexOrder,
+    instrument: CryptoPerpetual,
+    account_id: AccountId,
+    ts_init: int,
+) -> OrderStatusReport:
     return OrderStatusReport(
         account_id=account_id,
         instrument_id=instrument.id,
-        client_order_id=ClientOrderId(order_data.get("client_id", "")),
-        venue_order_id=VenueOrderId(order_data["id"]),
-        order_side=OrderSide.BUY if order_data["side"] == "BUY" else OrderSide.SELL,
-        order_type=OrderType.LIMIT if order_data["type"] == "LIMIT" else OrderType.MARKET,
-        time_in_force="GTC",
-        order_status=_parse_order_status(order_data["status"]),
-        price=Price.from_str(order_data["price"]) if order_data.get("price") else None,
-        quantity=Quantity.from_str(order_data["size"]),
-        filled_qty=Quantity.from_str(order_data.get("filled_size", "0")),
-        ts_accepted=millis_to_nanos(order_data["created_at"]),
-        ts_last=millis_to_nanos(order_data["updated_at"]),
-        report_id=order_data["id"],
-        ts_init=clock.timestamp_ns(),
+        client_order_id=ClientOrderId(order_data.client_id) if order_data.client_id else None,
+        venue_order_id=VenueOrderId(order_data.id),
+        order_side=OrderSide.BUY if order_data.side == "BUY" else OrderSide.SELL,
+        order_type=OrderType.LIMIT if order_data.type == "LIMIT" else OrderType.MARKET,
+        time_in_force=TimeInForce.GTC,
+        order_status=parse_order_status(order_data.status),
+        price=_make_price(order_data.price, instrument) if order_data.price else None,
+        quantity=_make_qty(order_data.size, instrument),
+        filled_qty=_make_qty(order_data.filled_size, instrument),
+        ts_accepted=millis_to_nanos(order_data.created_at),
+        ts_last=millis_to_nanos(order_data.updated_at),
+        report_id=UUID4(),
+        ts_init=ts_init,
     )
 
 
 def parse_fill_report(
-    fill_data: dict,
+    fill_data: ParadexFill,
     instrument: CryptoPerpetual,
     account_id: AccountId,
     clock,
 ) -> FillReport:
     """Parse Paradex fill to FillReport."""
+    return _fill_report(fill_data, instrument, account_id, clock.timestamp_ns())
+
+
+def parse_fill_reports(
+    results: list[Any],
+    resolve: Callable[[str], Any],
+    account_id: AccountId,
+    clock,
+    on_row: Callable[[ParadexFill], bool] | None = None,
+) -> tuple[list[FillReport], list[ReportParseError]]:
+    """Parse a page of Paradex fills to FillReports, collecting failed rows."""
+    return _parse_reports(_fill_report, ParadexFill, results, resolve, account_id, clock, on_row)
+
+
+def _fill_report(
+    fill_data: ParadexFill,
+    instrument: CryptoPerpetual,
+    account_id: AccountId,
+    ts_init: int,
+) -> FillReport:
     return FillReport(
         account_id=account_id,
         instrument_id=instrument.id,
-        venue_order_id=VenueOrderId(fill_data["order_id"]),
-        trade_id=TradeId(fill_data["id"]),
-        order_side=OrderSide.BUY if fill_data["side"] == "BUY" else OrderSide.SELL,
-        last_qty=Quantity.from_str(fill_data["size"]),
-        last_px=Price.from_str(fill_data["price"]),
-        commission=Money.from_str(f"{fill_data['fee']} {fill_data['fee_currency']}"),
-        liquidity_side=LiquiditySide.MAKER if fill_data["liquidity"] == "MAKER" else LiquiditySide.TAKER,
-        ts_event=millis_to_nanos(fill_data["created_at"]),
-        report_id=fill_data["id"],
-        ts_init=clock.timestamp_ns(),
+        venue_order_id=VenueOrderId(fill_data.order_id),
+        trade_id=TradeId(fill_data.id),
+        order_side=OrderSide.BUY if fill_data.side == "BUY" else OrderSide.SELL,
+        last_qty=_make_qty(fill_data.size, instrument),
+        last_px=_make_price(fill_data.price, instrument),
+        commission=_make_money(fill_data.fee, fill_data.fee_currency),
+        liquidity_side=LiquiditySide.MAKER if fill_data.liquidity == "MAKER" else LiquiditySide.TAKER,
+        ts_event=millis_to_nanos(fill_data.created_at),
+        report_id=UUID4(),
+        ts_init=ts_init,
     )
 
 
 def parse_position_status_report(
-    position_data: dict,
+    position_data: ParadexPosition,
     instrument: CryptoPerpetual,
     account_id: AccountId,
     clock,
 ) -> PositionStatusReport:
     """Parse Paradex position to PositionStatusReport."""
-    side = PositionSide.LONG if position_data["side"] == "LONG" else PositionSide.SHORT
-    quantity = Quantity.from_str(position_data["size"])
+    return _position_status_report(position_data, instrument, account_id, clock.timestamp_ns())
+
+
+def parse_position_status_reports(
+    results: list[Any],
+    resolve: Callable[[str], Any],
+    account_id: AccountId,
+    clock,
+    on_row: Callable[[ParadexPosition], bool] | None = None,
+) -> tuple[list[PositionStatusReport], list[ReportParseError]]:
+    """Parse a page of Paradex positions to PositionStatusReports, collecting failed rows."""
+    return _parse_reports(_position_status_report, ParadexPosition, results, resolve, account_id, clock, on_row)
+
+
+def _position_status_report(
+    position_data: ParadexPosition,
+    instrument: CryptoPerpetual,
+    account_id: AccountId,
+    ts_init: int,
+) -> PositionStatusReport:
+    side = PositionSide.LONG if position_data.side == "LONG" else PositionSide.SHORT
+    quantity = _make_qty(position_data.size, instrument)
 
     return PositionStatusReport(
         account_id=account_id,
         instrument_id=instrument.id,
         position_side=side,
         quantity=quantity,
-        quantity_px=None,  # Average entry price
-        break_even_price=None,
-        realized_pnl=None,
-        unrealized_pnl=None,
-        total_pnl=None,
-        ts_last=millis_to_nanos(position_data["updated_at"]),
-        report_id=position_data["id"],
-        ts_init=clock.timestamp_ns(),
+        avg_px_open=Decimal(position_data.avg_entry_price) if position_data.avg_entry_price else None,
+        ts_last=millis_to_nanos(position_data.updated_at),
+        report_id=UUID4(),
+        ts_init=ts_init,
+    )
+
+
+def parse_trade_tick(
+    trade_data: dict,
+    instrument: CryptoPerpetual,
+    ts_init: int,
+) -> TradeTick:
+    """Parse Paradex trade to TradeTick."""
+    return TradeTick(
+        instrument_id=instrument.id,
+        price=instrument.make_price(trade_data["price"]),
+        size=instrument.make_qty(trade_data["size"]),
+        aggressor_side=AggressorSide.BUYER if trade_data["side"] == "BUY" else AggressorSide.SELLER,
+        trade_id=TradeId(trade_data["id"]),
+        ts_event=millis_to_nanos(trade_data["created_at"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_bar(
+    kline: list,
+    bar_type: BarType,
+    instrument: CryptoPerpetual,
+    interval_ms: int,
+    ts_init: int,
+) -> Bar:
+    """Parse Paradex kline ``[open_time, open, high, low, close, volume]`` to Bar."""
+    return Bar(
+        bar_type=bar_type,
+        open=instrument.make_price(kline[1]),
+        high=instrument.make_price(kline[2]),
+        low=instrument.make_price(kline[3]),
+        close=instrument.make_price(kline[4]),
+        volume=instrument.make_qty(kline[5]),
+        ts_event=millis_to_nanos(kline[0] + interval_ms),  # Bars are timestamped on close
+        ts_init=ts_init,
+    )
+
+
+def parse_order_book_snapshot(
+    book_data: dict,
+    instrument: CryptoPerpetual,
+    ts_init: int,
+    depth: int = 0,
+) -> OrderBookDeltas:
+    """
+    Parse Paradex order book ``{"bids": [[px, sz], ...], "asks": [...]}`` to a
+    snapshot (CLEAR followed by one ADD per level).
+
+    If ``depth`` is positive only the top ``depth`` levels per side are kept.
+    """
+    ts_event = millis_to_nanos(book_data.get("last_updated_at", 0)) or ts_init
+    bids = book_data.get("bids", [])
+    asks = book_data.get("asks", [])
+    if depth > 0:
+        bids = bids[:depth]
+        asks = asks[:depth]
+
+    return build_book_snapshot(
+        instrument.id,
+        [(Price.from_str(px), Quantity.from_str(sz)) for px, sz in bids],
+        [(Price.from_str(px), Quantity.from_str(sz)) for px, sz in asks],
+        ts_event,
+        ts_init,
     )
 
 
-def _parse_order_status(status: str) -> OrderStatus:
+def build_book_snapshot(
+    instrument_id: InstrumentId,
+    bids: list[tuple[Price, Quantity]],
+    asks: list[tuple[Price, Quantity]],
+    ts_event: int,
+    ts_init: int,
+) -> OrderBookDeltas:
+    """Build snapshot deltas from (price, size) levels, best level first."""
+    deltas = [OrderBookDelta.clear(instrument_id, 0, ts_event, ts_init)]
+    levels = [(OrderSide.BUY, px, sz) for px, sz in bids]
+    levels += [(OrderSide.SELL, px, sz) for px, sz in asks]
+
+    for i, (side, price, size) in enumerate(levels):
+        flags = RecordFlag.F_LAST if i == len(levels) - 1 else 0
+        deltas.append(
+            OrderBookDelta(
+                instrument_id=instrument_id,
+                action=BookAction.ADD,
+                order=BookOrder(side, price, size, 0),
+                flags=flags | RecordFlag.F_SNAPSHOT,
+                sequence=0,
+                ts_event=ts_event,
+                ts_init=ts_init,
+            ),
+        )
+
+    return OrderBookDeltas(instrument_id, deltas)
+
+
+def parse_quote_tick(
+    bbo: dict,
+    instrument: CryptoPerpetual,
+    ts_init: int,
+) -> QuoteTick:
+    """Parse Paradex ``bbo`` channel update to QuoteTick."""
+    return QuoteTick(
+        instrument_id=instrument.id,
+        bid_price=instrument.make_price(bbo["bid"]),
+        ask_price=instrument.make_price(bbo["ask"]),
+        bid_size=instrument.make_qty(bbo["bid_size"]),
+        ask_size=instrument.make_qty(bbo["ask_size"]),
+        ts_event=millis_to_nanos(bbo["last_updated_at"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_mark_price_update(
+    summary: dict,
+    instrument_id: InstrumentId,
+    ts_init: int,
+) -> MarkPriceUpdate:
+    """Parse Paradex market summary to MarkPriceUpdate."""
+    return MarkPriceUpdate(
+        instrument_id=instrument_id,
+        value=Price.from_str(summary["mark_price"]),
+        ts_event=millis_to_nanos(summary["created_at"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_index_price_update(
+    summary: dict,
+    instrument_id: InstrumentId,
+    ts_init: int,
+) -> IndexPriceUpdate:
+    """Parse Paradex market summary (``underlying_price``) to IndexPriceUpdate."""
+    return IndexPriceUpdate(
+        instrument_id=instrument_id,
+        value=Price.from_str(summary["underlying_price"]),
+        ts_event=millis_to_nanos(summary["created_at"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_funding_rate_update(
+    summary: dict,
+    instrument_id: InstrumentId,
+    ts_init: int,
+) -> FundingRateUpdate:
+    """Parse Paradex market summary to FundingRateUpdate."""
+    return FundingRateUpdate(
+        instrument_id=instrument_id,
+        rate=Decimal(summary["funding_rate"]),
+        ts_event=millis_to_nanos(summary["created_at"]),
+        ts_init=ts_init,
+    )
+
+
+def parse_open_interest(
+    summary: dict,
+    instrument_id: InstrumentId,
+    ts_init: int,
+) -> ParadexOpenInterest:
+    """Parse Paradex market summary to ParadexOpenInterest."""
+    return ParadexOpenInterest(
+        instrument_id=instrument_id,
+        open_interest=Decimal(summary["open_interest"]),
+        ts_event=millis_to_nanos(summary["created_at"]),
+        ts_init=ts_init,
+    )
+
+
+_ORDER_STATUSES = {
+    "PENDING": OrderStatus.SUBMITTED,
+    "OPEN": OrderStatus.ACCEPTED,
+    "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELLED": OrderStatus.CANCELED,
+    "REJECTED": OrderStatus.REJECTED,
+}
+
+
+def parse_order_status(status: str) -> OrderStatus:
     """Convert Paradex order status to Nautilus."""
-    mapping = {
-        "PENDING": OrderStatus.SUBMITTED,
-        "OPEN": OrderStatus.ACCEPTED,
-        "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
-        "FILLED": OrderStatus.FILLED,
-        "CANCELLED": OrderStatus.CANCELED,
-        "REJECTED": OrderStatus.REJECTED,
-    }
-    return mapping.get(status, OrderStatus.PENDING_CANCEL)
-
-
-def get_paradex_instrument_provider(http_client, clock, logger):
+    return _ORDER_STATUSES.get(status, OrderStatus.PENDING_CANCEL)
+
+
+def get_paradex_instrument_provider(http_client, clock, logger, config=None):
     """Factory function for instrument provider."""
     from nautilus_trader.adapters.paradex.providers import ParadexInstrumentProvider
-    return ParadexInstrumentProvider(http_client, clock, logger)
+    return ParadexInstrumentProvider(http_client, clock, logger, config)
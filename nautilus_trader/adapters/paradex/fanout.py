@@ -0,0 +1,334 @@
+# nautilus_trader/adapters/paradex/fanout.py
+"""
+Shared-memory fan-out of decoded Paradex market data to sibling processes.
+
+One node ingests and decodes the feed and writes the latest quote and book
+top, plus a ring of recent trades, per instrument into a
+``multiprocessing.shared_memory`` block. Other processes on the host attach
+with ``SharedMarketDataReader`` and read the records in place, instead of
+each opening its own WebSocket and decoding the same frames.
+
+Layout (little endian, 8-byte aligned)::
+
+    header  magic, version, slots, trade_ring, used_slots, writer_pid, last_write_ns
+    slot[i] symbol[48] | quote top | book top | trade head | trade entries[trade_ring]
+
+Each top record is guarded by a seqlock: the writer makes the sequence odd,
+writes the record and makes it even again; readers retry until they see the
+same even sequence before and after reading. Trades are a ring indexed by a
+monotonic head, so each reader keeps its own cursor and can tell when it
+fell more than a ring behind. There is a single writer per block.
+
+The seqlock relies on stores becoming visible in program order, which holds
+on x86-64; weakly ordered CPUs may rarely expose a torn record.
+"""
+
+import os
+import struct
+import time
+from multiprocessing import resource_tracker
+from multiprocessing import shared_memory
+from typing import NamedTuple
+
+from nautilus_trader.model.data import QuoteTick
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.instruments import CryptoPerpetual
+
+_MAGIC = 0x5844524150464F31  # "1OFPARDX"
+_VERSION = 1
+
+_HEADER = struct.Struct("<QIIIIQQ")  # magic, version, slots, trade_ring, used_slots, pid, last_write_ns
+_HEADER_SIZE = 64
+_USED_SLOTS_OFFSET = 20
+_LAST_WRITE_OFFSET = 32
+_SYMBOL_SIZE = 48
+
+_SEQ = struct.Struct("<Q")
+_TOP = struct.Struct("<ddddQQ")  # bid, ask, bid_size, ask_size, ts_event, ts_init
+_TOP_SIZE = _SEQ.size + _TOP.size
+_TRADE = struct.Struct("<ddqQQ32s")  # price, size, aggressor, ts_event, ts_init, trade_id
+
+_SPIN_LIMIT = 1_000
+
+
+class SharedTop(NamedTuple):
+    """Best bid/ask record as read from shared memory."""
+
+    bid: float
+    ask: float
+    bid_size: float
+    ask_size: float
+    ts_event: int
+    ts_init: int
+
+
+class SharedTrade(NamedTuple):
+    """Trade record as read from shared memory."""
+
+    price: float
+    size: float
+    aggressor_side: int
+    ts_event: int
+    ts_init: int
+    trade_id: str
+
+
+def _slot_size(trade_ring: int) -> int:
+    return _SYMBOL_SIZE + 2 * _TOP_SIZE + _SEQ.size + trade_ring * _TRADE.size
+
+
+def block_size(slots: int, trade_ring: int) -> int:
+    """Return the shared memory size needed for ``slots`` instruments."""
+    return _HEADER_SIZE + slots * _slot_size(trade_ring)
+
+
+class SharedMarketDataWriter:
+    """
+    Creates the shared block and writes decoded market data into it.
+
+    Instruments are assigned a slot on their first write; writes for more
+    than ``slots`` instruments are counted in ``dropped`` and ignored.
+    """
+
+    def __init__(self, name: str, slots: int = 256, trade_ring: int = 1024) -> None:
+        self._slots = slots
+        self._trade_ring = trade_ring
+        self._slot_size = _slot_size(trade_ring)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=block_size(slots, trade_ring))
+        self._buf = self._shm.buf
+        self._offsets: dict[str, int] = {}
+        self._trade_heads: dict[str, int] = {}
+        self.dropped = 0
+        _HEADER.pack_into(self._buf, 0, _MAGIC, _VERSION, slots, trade_ring, 0, os.getpid(), 0)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        """Release and remove the block; attached readers keep their mapping."""
+        self._buf.release()
+        self._shm.close()
+        self._shm.unlink()
+
+    def write_quote(self, quote: QuoteTick) -> None:
+        offset = self._slot(quote.instrument_id.symbol.value)
+        if offset is not None:
+            self._write_top(
+                offset + _SYMBOL_SIZE,
+                quote.bid_price.as_double(),
+                quote.ask_price.as_double(),
+                quote.bid_size.as_double(),
+                quote.ask_size.as_double(),
+                quote.ts_event,
+                quote.ts_init,
+            )
+
+    def write_book_top(
+        self,
+        symbol: str,
+        top: tuple[float, float, float, float],
+        ts_event: int,
+        ts_init: int,
+    ) -> None:
+        """Write the best (bid, ask, bid_size, ask_size) of the order book for ``symbol``."""
+        offset = self._slot(symbol)
+        if offset is not None:
+            self._write_top(offset + _SYMBOL_SIZE + _TOP_SIZE, *top, ts_event, ts_init)
+
+    def write_trade(self, trade: TradeTick) -> None:
+        symbol = trade.instrument_id.symbol.value
+        offset = self._slot(symbol)
+        if offset is None:
+            return
+        head_offset = offset + _SYMBOL_SIZE + 2 * _TOP_SIZE
+        head = self._trade_heads[symbol]
+        entry = head_offset + _SEQ.size + (head % self._trade_ring) * _TRADE.size
+        _TRADE.pack_into(
+            self._buf,
+            entry,
+            trade.price.as_double(),
+            trade.size.as_double(),
+            int(trade.aggressor_side),
+            trade.ts_event,
+            trade.ts_init,
+            trade.trade_id.value.encode()[:32],
+        )
+        # Publish the entry only once it is fully written
+        self._trade_heads[symbol] = head + 1
+        _SEQ.pack_into(self._buf, head_offset, head + 1)
+        self._touch()
+
+    def _slot(self, symbol: str) -> int | None:
+        offset = self._offsets.get(symbol)
+        if offset is not None:
+            return offset
+        used = len(self._offsets)
+        if used == self._slots:
+            self.dropped += 1
+            return None
+        offset = _HEADER_SIZE + used * self._slot_size
+        self._buf[offset:offset + _SYMBOL_SIZE] = symbol.encode().ljust(_SYMBOL_SIZE, b"\0")
+        self._offsets[symbol] = offset
+        self._trade_heads[symbol] = 0
+        # Readers only look at slots below used_slots, so the symbol is written first
+        struct.pack_into("<I", self._buf, _USED_SLOTS_OFFSET, used + 1)
+        return offset
+
+    def _write_top(self, offset: int, *record: float | int) -> None:
+        seq = _SEQ.unpack_from(self._buf, offset)[0]
+        _SEQ.pack_into(self._buf, offset, seq + 1)
+        _TOP.pack_into(self._buf, offset + _SEQ.size, *record)
+        _SEQ.pack_into(self._buf, offset, seq + 2)
+        self._touch()
+
+    def _touch(self) -> None:
+        _SEQ.pack_into(self._buf, _LAST_WRITE_OFFSET, time.time_ns())
+
+
+class SharedMarketDataReader:
+    """
+    Attaches to a block created by ``SharedMarketDataWriter`` and reads it in place.
+
+    Records are unpacked straight from the mapping; nothing is copied or
+    decoded besides the fields themselves.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, version, slots, trade_ring, _, pid, _ = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Shared memory block {name!r} is not a Paradex fan-out block")
+        self.writer_pid = pid
+        self._trade_ring = trade_ring
+        self._slot_size = _slot_size(trade_ring)
+        self._offsets: dict[str, int] = {}
+
+    def close(self) -> None:
+        self._buf.release()
+        self._shm.close()
+
+    @property
+    def last_write_ns(self) -> int:
+        """UNIX timestamp (nanoseconds) of the writer's latest write, 0 if none."""
+        return _SEQ.unpack_from(self._buf, _LAST_WRITE_OFFSET)[0]
+
+    def symbols(self) -> list[str]:
+        """Return the symbols the writer has published so far."""
+        self._refresh()
+        return list(self._offsets)
+
+    def quote(self, symbol: str) -> SharedTop | None:
+        offset = self._slot(symbol)
+        return self._read_top(offset + _SYMBOL_SIZE) if offset is not None else None
+
+    def book_top(self, symbol: str) -> SharedTop | None:
+        offset = self._slot(symbol)
+        return self._read_top(offset + _SYMBOL_SIZE + _TOP_SIZE) if offset is not None else None
+
+    def trades(self, symbol: str, cursor: int = 0) -> tuple[list[SharedTrade], int, int]:
+        """
+        Read the trades written since ``cursor``.
+
+        Returns (trades, next cursor, trades lost because the reader fell
+        more than a ring behind). Pass the returned cursor to the next call.
+        """
+        offset = self._slot(symbol)
+        if offset is None:
+            return [], cursor, 0
+        head_offset = offset + _SYMBOL_SIZE + 2 * _TOP_SIZE
+        entries = head_offset + _SEQ.size
+        head = _SEQ.unpack_from(self._buf, head_offset)[0]
+        # The oldest slot is the next one the writer overwrites, so it is never read
+        start = max(cursor, head - self._trade_ring + 1)
+        lost = start - cursor
+
+        trades = []
+        for i in range(start, head):
+            price, size, aggressor, ts_event, ts_init, trade_id = _TRADE.unpack_from(
+                self._buf,
+                entries + (i % self._trade_ring) * _TRADE.size,
+            )
+            trades.append(
+                SharedTrade(price, size, aggressor, ts_event, ts_init, trade_id.rstrip(b"\0").decode()),
+            )
+
+        # Entries the writer reached while we were reading them are discarded
+        overrun = _SEQ.unpack_from(self._buf, head_offset)[0] - self._trade_ring + 1 - start
+        if overrun > 0:
+            trades = trades[overrun:]
+            lost += overrun
+        return trades, head, lost
+
+    def quote_tick(self, instrument: CryptoPerpetual) -> QuoteTick | None:
+        """Return the latest quote for ``instrument`` as a QuoteTick."""
+        top = self.quote(instrument.id.symbol.value)
+        if top is None:
+            return None
+        return QuoteTick(
+            instrument_id=instrument.id,
+            bid_price=instrument.make_price(top.bid),
+            ask_price=instrument.make_price(top.ask),
+            bid_size=instrument.make_qty(top.bid_size),
+            ask_size=instrument.make_qty(top.ask_size),
+            ts_event=top.ts_event,
+            ts_init=top.ts_init,
+        )
+
+    def trade_ticks(self, instrument: CryptoPerpetual, cursor: int = 0) -> tuple[list[TradeTick], int, int]:
+        """Return ``trades`` for ``instrument`` as TradeTicks."""
+        trades, cursor, lost = self.trades(instrument.id.symbol.value, cursor)
+        ticks = [
+            TradeTick(
+                instrument_id=instrument.id,
+                price=instrument.make_price(t.price),
+                size=instrument.make_qty(t.size),
+                aggressor_side=AggressorSide(t.aggressor_side),
+                trade_id=TradeId(t.trade_id),
+                ts_event=t.ts_event,
+                ts_init=t.ts_init,
+            )
+            for t in trades
+        ]
+        return ticks, cursor, lost
+
+    def _slot(self, symbol: str) -> int | None:
+        offset = self._offsets.get(symbol)
+        if offset is None:
+            self._refresh()
+            offset = self._offsets.get(symbol)
+        return offset
+
+    def _refresh(self) -> None:
+        used = struct.unpack_from("<I", self._buf, _USED_SLOTS_OFFSET)[0]
+        for i in range(len(self._offsets), used):
+            offset = _HEADER_SIZE + i * self._slot_size
+            symbol = bytes(self._buf[offset:offset + _SYMBOL_SIZE]).rstrip(b"\0").decode()
+            self._offsets[symbol] = offset
+
+    def _read_top(self, offset: int) -> SharedTop | None:
+        buf = self._buf
+        for _ in range(_SPIN_LIMIT):
+            before = _SEQ.unpack_from(buf, offset)[0]
+            if before == 0:
+                return None  # Never written
+            if before & 1:
+                continue  # Write in progress
+            record = _TOP.unpack_from(buf, offset + _SEQ.size)
+            if _SEQ.unpack_from(buf, offset)[0] == before:
+                return SharedTop(*record)
+        raise TimeoutError("Shared memory record kept changing while being read")
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing block without letting this process's tracker unlink it."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
@@ -0,0 +1,329 @@
+# nautilus_trader/adapters/paradex/history.py
+"""Historical market data loading for Paradex."""
+
+import asyncio
+import json
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.model.enums import BarAggregation
+from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.instruments import CryptoPerpetual
+
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+from nautilus_trader.adapters.paradex.factories import parse_bar
+from nautilus_trader.adapters.paradex.factories import parse_trade_tick
+from nautilus_trader.adapters.paradex.history_cache import ParadexHistoryCache
+
+# Kline resolutions (minutes) supported by /v1/markets/klines
+KLINE_RESOLUTIONS = (1, 3, 5, 15, 30, 60)
+
+
+class ParadexHistoryLoader:
+    """
+    Loads historical data from the Paradex REST API.
+
+    The requested range is split into time slices which are paged concurrently,
+    bounded by the configured concurrency and requests-per-second budget.
+    Response pages are decoded in a worker thread so large payloads never
+    stall the event loop.
+
+    When ``history_cache_path`` is configured, settled history is persisted to
+    a local Parquet cache and only the gaps missing from it are fetched.
+    """
+
+    def __init__(
+        self,
+        http_client: Any,
+        clock: LiveClock,
+        logger: Logger,
+        config: ParadexDataClientConfig,
+    ) -> None:
+        self._http = http_client
+        self._clock = clock
+        self._log = logger
+        self._config = config
+
+        self._semaphore = asyncio.Semaphore(config.history_max_concurrent_requests)
+        self._request_interval = 1.0 / config.history_requests_per_second
+        self._next_request_time = 0.0
+        self._pace_lock = asyncio.Lock()
+
+        self._cache: ParadexHistoryCache | None = None
+        if config.history_cache_path:
+            self._cache = ParadexHistoryCache(
+                config.history_cache_path,
+                max_files=config.history_cache_max_files,
+            )
+
+    async def fetch_trade_ticks(
+        self,
+        instrument: CryptoPerpetual,
+        start_ns: int,
+        end_ns: int,
+        limit: int = 0,
+    ) -> list[TradeTick]:
+        """
+        Fetch trade ticks for ``instrument`` within [start_ns, end_ns].
+
+        Returns a single batch sorted by ``ts_event`` with duplicates removed.
+        If ``limit`` is positive only the most recent ``limit`` ticks are kept.
+        """
+        if self._cache is None:
+            # Without a cache only the newest slices needed to satisfy the limit are paged
+            result = await self._fetch_trade_ticks_remote(instrument, start_ns, end_ns, limit)
+        else:
+            # Cache gaps are recorded as fully covered, so they must be paged in full
+            result = await self._fetch_cached(
+                "trades",
+                instrument.id.value,
+                start_ns,
+                end_ns,
+                TradeTick,
+                lambda s, e: self._fetch_trade_ticks_remote(instrument, s, e),
+            )
+        if limit > 0:
+            result = result[-limit:]
+        return result
+
+    async def fetch_bars(
+        self,
+        bar_type: BarType,
+        instrument: CryptoPerpetual,
+        start_ns: int,
+        end_ns: int,
+        limit: int = 0,
+    ) -> list[Bar]:
+        """
+        Fetch bars for ``bar_type`` with ``ts_event`` within [start_ns, end_ns].
+
+        Raises ValueError if the bar type has no matching Paradex kline resolution.
+        """
+        resolution = kline_resolution(bar_type)
+        result = await self._fetch_cached(
+            "bars",
+            str(bar_type),
+            start_ns,
+            end_ns,
+            Bar,
+            lambda s, e: self._fetch_bars_remote(bar_type, instrument, resolution, s, e),
+        )
+        if limit > 0:
+            result = result[-limit:]
+        return result
+
+    async def _fetch_cached(
+        self,
+        kind: str,
+        key: str,
+        start_ns: int,
+        end_ns: int,
+        data_cls: type,
+        fetch: Callable[[int, int], Awaitable[list[Data]]],
+    ) -> list[Data]:
+        if self._cache is None:
+            return await fetch(start_ns, end_ns)
+
+        # Recent data may still change, so only settled history is cached
+        settled_ns = self._clock.timestamp_ns() - self._config.history_cache_settle_secs * 1_000_000_000
+        cached_end_ns = min(end_ns, settled_ns)
+
+        gaps = self._cache.missing_intervals(kind, key, start_ns, cached_end_ns)
+        live_range = (max(start_ns, settled_ns + 1), end_ns) if end_ns > settled_ns else None
+
+        requests = [fetch(s, e) for s, e in gaps]
+        if live_range is not None:
+            requests.append(fetch(*live_range))
+        fetched = await asyncio.gather(*requests)
+
+        for (s, e), data in zip(gaps, fetched):
+            await asyncio.to_thread(self._cache.write, kind, key, s, e, data, data_cls)
+        if gaps:
+            await asyncio.to_thread(self._cache.compact, kind, key)
+
+        result: list[Data] = []
+        if start_ns <= cached_end_ns:
+            result = await asyncio.to_thread(self._cache.read, kind, key, start_ns, cached_end_ns, data_cls)
+        if live_range is not None:
+            result.extend(fetched[-1])
+
+        self._log.debug(
+            f"History {kind} {key}: {len(result)} records, {len(gaps)} gaps fetched",
+        )
+        return sorted(result, key=lambda d: d.ts_event)
+
+    async def _fetch_trade_ticks_remote(
+        self,
+        instrument: CryptoPerpetual,
+        start_ns: int,
+        end_ns: int,
+        limit: int = 0,
+    ) -> list[TradeTick]:
+        start_ms = start_ns // 1_000_000
+        end_ms = end_ns // 1_000_000
+        slices = time_slices(start_ms, end_ms, self._config.history_slice_secs * 1000)
+
+        # With a limit, slices are paged newest first one concurrent wave at a time,
+        # stopping once the waves so far hold enough ticks to fill it
+        wave_size = self._config.history_max_concurrent_requests if limit > 0 else len(slices)
+        pending = slices[::-1]
+
+        ticks: dict[str, TradeTick] = {}
+        while pending:
+            wave, pending = pending[:wave_size], pending[wave_size:]
+            pages = await asyncio.gather(
+                *(self._fetch_trades_slice(instrument, s, e) for s, e in wave),
+            )
+            for page in pages:
+                for tick in page:
+                    if start_ns <= tick.ts_event <= end_ns:
+                        ticks[tick.trade_id.value] = tick
+            if 0 < limit <= len(ticks):
+                break
+
+        return sorted(ticks.values(), key=lambda t: t.ts_event)
+
+    async def _fetch_bars_remote(
+        self,
+        bar_type: BarType,
+        instrument: CryptoPerpetual,
+        resolution: int,
+        start_ns: int,
+        end_ns: int,
+    ) -> list[Bar]:
+        interval_ms = resolution * 60_000
+        # Query by open time, so shift back one interval to include bars closing at start
+        start_ms = start_ns // 1_000_000 - interval_ms
+        end_ms = end_ns // 1_000_000
+        slices = time_slices(start_ms, end_ms, self._config.history_page_size * interval_ms)
+        ts_init = self._clock.timestamp_ns()
+
+        async def fetch_slice(lower: int, upper: int) -> list[Bar]:
+            async with self._semaphore:
+                await self._pace()
+                payload = await self._http.get_klines(
+                    instrument.raw_symbol.value,
+                    resolution,
+                    lower,
+                    upper,
+                )
+            return await asyncio.to_thread(
+                decode_klines_page,
+                payload,
+                bar_type,
+                instrument,
+                interval_ms,
+                ts_init,
+            )
+
+        pages = await asyncio.gather(*(fetch_slice(s, e) for s, e in slices))
+
+        bars: dict[int, Bar] = {}
+        for page in pages:
+            for bar in page:
+                if start_ns <= bar.ts_event <= end_ns:
+                    bars[bar.ts_event] = bar
+
+        return sorted(bars.values(), key=lambda b: b.ts_event)
+
+    async def _fetch_trades_slice(
+        self,
+        instrument: CryptoPerpetual,
+        start_ms: int,
+        end_ms: int,
+    ) -> list[TradeTick]:
+        symbol = instrument.raw_symbol.value
+        ts_init = self._clock.timestamp_ns()
+        ticks: list[TradeTick] = []
+        cursor: str | None = None
+
+        while True:
+            async with self._semaphore:
+                await self._pace()
+                payload = await self._http.get_trades_page(
+                    symbol,
+                    start_ms,
+                    end_ms,
+                    self._config.history_page_size,
+                    cursor,
+                )
+
+            page, cursor = await asyncio.to_thread(
+                decode_trades_page,
+                payload,
+                instrument,
+                ts_init,
+            )
+            ticks.extend(page)
+
+            if not cursor or not page:
+                return ticks
+
+    async def _pace(self) -> None:
+        """Space out request starts to stay within the requests-per-second budget."""
+        loop = asyncio.get_running_loop()
+        async with self._pace_lock:
+            now = loop.time()
+            delay = self._next_request_time - now
+            self._next_request_time = max(now, self._next_request_time) + self._request_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def time_slices(start_ms: int, end_ms: int, slice_ms: int) -> list[tuple[int, int]]:
+    """Split the inclusive range [start_ms, end_ms] into non-overlapping slices."""
+    slices = []
+    lower = start_ms
+    while lower <= end_ms:
+        upper = min(lower + slice_ms - 1, end_ms)
+        slices.append((lower, upper))
+        lower = upper + 1
+    return slices
+
+
+def kline_resolution(bar_type: BarType) -> int:
+    """Return the Paradex kline resolution in minutes for ``bar_type``."""
+    spec = bar_type.spec
+    minutes = {
+        BarAggregation.MINUTE: spec.step,
+        BarAggregation.HOUR: spec.step * 60,
+    }.get(spec.aggregation)
+
+    if (
+        minutes not in KLINE_RESOLUTIONS
+        or spec.price_type != PriceType.LAST
+        or bar_type.aggregation_source != AggregationSource.EXTERNAL
+    ):
+        raise ValueError(f"Unsupported Paradex bar type {bar_type}")
+    return minutes
+
+
+def decode_trades_page(
+    payload: str,
+    instrument: CryptoPerpetual,
+    ts_init: int,
+) -> tuple[list[TradeTick], str | None]:
+    """Decode a ``/v1/trades`` response page into trade ticks and the next cursor."""
+    data = json.loads(payload)
+    ticks = [parse_trade_tick(t, instrument, ts_init) for t in data.get("results", [])]
+    return ticks, data.get("next")
+
+
+def decode_klines_page(
+    payload: str,
+    bar_type: BarType,
+    instrument: CryptoPerpetual,
+    interval_ms: int,
+    ts_init: int,
+) -> list[Bar]:
+    """Decode a ``/v1/markets/klines`` response into bars."""
+    data = json.loads(payload)
+    return [parse_bar(k, bar_type, instrument, interval_ms, ts_init) for k in data.get("results", [])]
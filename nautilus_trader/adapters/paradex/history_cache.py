@@ -0,0 +1,174 @@
+# nautilus_trader/adapters/paradex/history_cache.py
+"""On-disk Parquet cache for historical Paradex data."""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from nautilus_trader.core.data import Data
+from nautilus_trader.serialization.arrow.schema import NAUTILUS_ARROW_SCHEMA
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+
+class ParadexHistoryCache:
+    """
+    Columnar cache of historical data keyed by series and time range.
+
+    Each fetched interval is written to its own Parquet file named
+    ``<start_ns>-<end_ns>.parquet`` under ``<root>/<kind>/<key>/``. The file
+    names double as the coverage index, so an interval fetched from REST
+    (even one that contained no data) is never fetched again.
+
+    Once a series holds more than ``max_files`` files, ``compact`` merges each
+    run of contiguous intervals into a single file. Gaps between runs are kept,
+    since merging across them would mark unfetched ranges as covered.
+    """
+
+    def __init__(self, root: str, max_files: int = 16) -> None:
+        self._root = Path(root)
+        self._max_files = max_files
+
+    def missing_intervals(self, kind: str, key: str, start_ns: int, end_ns: int) -> list[tuple[int, int]]:
+        """Return the sub-ranges of [start_ns, end_ns] not covered by cached files."""
+        return subtract_intervals((start_ns, end_ns), self._covered(kind, key))
+
+    def write(
+        self,
+        kind: str,
+        key: str,
+        start_ns: int,
+        end_ns: int,
+        data: list[Data],
+        data_cls: type,
+    ) -> None:
+        """Persist ``data`` as the complete content of the interval [start_ns, end_ns]."""
+        directory = self._series_dir(kind, key)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        if data:
+            table = ArrowSerializer.serialize_batch(data, data_cls)
+            if isinstance(table, pa.RecordBatch):  # Older nautilus versions return a batch
+                table = pa.Table.from_batches([table])
+        else:
+            # Empty interval still gets a file so it counts as covered
+            table = NAUTILUS_ARROW_SCHEMA[data_cls].empty_table()
+
+        tmp_path = directory / f".{start_ns}-{end_ns}.parquet.tmp"
+        pq.write_table(table, tmp_path)
+        tmp_path.replace(directory / f"{start_ns}-{end_ns}.parquet")
+
+    def compact(self, kind: str, key: str) -> None:
+        """Merge contiguous cached intervals of a series once it exceeds ``max_files`` files."""
+        files = self._files(kind, key)
+        if len(files) <= self._max_files:
+            return
+
+        directory = self._series_dir(kind, key)
+        for run in contiguous_runs([interval for interval, _ in files]):
+            if len(run) < 2:
+                continue
+            paths = [files[i][1] for i in run]
+            lower = files[run[0]][0][0]
+            upper = max(files[i][0][1] for i in run)
+
+            tables = []
+            empty = None
+            covered_to = lower - 1
+            for i in run:
+                (_, file_upper), path = files[i]
+                table = pq.read_table(path)
+                if table.num_rows == 0:
+                    empty = table  # Lacks the instrument metadata data files carry
+                else:
+                    # Rows already held by an overlapping earlier file are dropped
+                    tables.append(table.filter(pc.greater(table["ts_event"], covered_to)))
+                covered_to = max(covered_to, file_upper)
+
+            tmp_path = directory / f".{lower}-{upper}.parquet.tmp"
+            pq.write_table(pa.concat_tables(tables) if tables else empty, tmp_path)
+            tmp_path.replace(directory / f"{lower}-{upper}.parquet")
+            for path in paths:
+                if path.stem != f"{lower}-{upper}":
+                    path.unlink(missing_ok=True)
+
+    def read(self, kind: str, key: str, start_ns: int, end_ns: int, data_cls: type) -> list[Data]:
+        """Read cached data with ``ts_event`` within [start_ns, end_ns]."""
+        data: list[Data] = []
+        for (lower, upper), path in self._files(kind, key):
+            if upper < start_ns or lower > end_ns:
+                continue
+            table = pq.read_table(path)
+            if table.num_rows == 0:
+                continue
+            data.extend(
+                d for d in ArrowSerializer.deserialize(data_cls, table)
+                if start_ns <= d.ts_event <= end_ns
+            )
+        return data
+
+    def _series_dir(self, kind: str, key: str) -> Path:
+        return self._root / kind / key
+
+    def _files(self, kind: str, key: str) -> list[tuple[tuple[int, int], Path]]:
+        directory = self._series_dir(kind, key)
+        if not directory.exists():
+            return []
+
+        files = []
+        for path in directory.glob("*.parquet"):
+            lower, _, upper = path.stem.partition("-")
+            files.append(((int(lower), int(upper)), path))
+
+        # A file nested in a merged one is left over from an interrupted compaction
+        result = []
+        for interval, path in sorted(files, key=lambda f: (f[0][0], -f[0][1])):
+            if result and interval[1] <= result[-1][0][1] and interval[0] >= result[-1][0][0]:
+                continue
+            result.append((interval, path))
+        return result
+
+    def _covered(self, kind: str, key: str) -> list[tuple[int, int]]:
+        return [interval for interval, _ in self._files(kind, key)]
+
+
+def subtract_intervals(
+    interval: tuple[int, int],
+    covered: list[tuple[int, int]],
+) -> list[tuple[int, int]]:
+    """Return the parts of the inclusive ``interval`` not covered by ``covered``."""
+    start, end = interval
+    gaps = []
+    cursor = start
+    for lower, upper in sorted(covered):
+        if upper < cursor:
+            continue
+        if lower > end:
+            break
+        if lower > cursor:
+            gaps.append((cursor, lower - 1))
+        cursor = max(cursor, upper + 1)
+        if cursor > end:
+            break
+    if cursor <= end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def contiguous_runs(intervals: list[tuple[int, int]]) -> list[list[int]]:
+    """
+    Group sorted inclusive ``intervals`` into runs with no gap between them.
+
+    Returns the index lists of each run, in order.
+    """
+    runs: list[list[int]] = []
+    run_upper = 0
+    for i, (lower, upper) in enumerate(intervals):
+        if runs and lower <= run_upper + 1:
+            runs[-1].append(i)
+            run_upper = max(run_upper, upper)
+        else:
+            runs.append([i])
+            run_upper = upper
+    return runs
@@ -0,0 +1,444 @@
+# nautilus_trader/adapters/paradex/ingest.py
+"""
+Out-of-process WebSocket ingestion for the Paradex data client.
+
+The worker process owns the WebSocket connection(s) and does the JSON
+decoding. It sends compact binary records to the node over a pipe:
+
+- quotes (``bbo``) and trades as fixed-layout structs with float fields
+- every other channel as a ``marshal``-encoded ``(channel, data)`` pair
+
+Symbols are sent once and then referred to by a 16-bit id. On the node,
+``IngestProcessClient`` presents the same interface as the Rust WebSocket
+clients, so the data client only builds Nautilus objects from records and
+the strategy's interpreter never parses JSON.
+"""
+
+import asyncio
+import dataclasses
+import json
+import marshal
+import multiprocessing
+import struct
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from nautilus_trader.adapters.paradex import _rust
+from nautilus_trader.adapters.paradex.config import ParadexConfig
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+
+# Record kinds, as the first field of a decoded record
+RECORD_QUOTE = 1
+RECORD_TRADE = 2
+RECORD_FRAME = 3
+_RECORD_SYMBOL = 0
+
+# Pipe message types
+_MSG_RECORDS = 0x52  # "R": a batch of records
+_MSG_STATUS = 0x53  # "S": a marshal-encoded status dict
+
+_HEAD = struct.Struct("<BQ")  # kind, ts_recv
+_SYMBOL = struct.Struct("<HB")  # id, length; followed by the symbol
+_QUOTE = struct.Struct("<HddddQq")  # symbol id, bid, ask, bid_size, ask_size, ts_event, seq_no (-1 if none)
+_TRADE = struct.Struct("<HddBQB")  # symbol id, price, size, aggressor, ts_event, id length; followed by the id
+_FRAME = struct.Struct("<I")  # length; followed by marshal((channel, data))
+
+_AGGRESSOR_BUYER = 1
+_AGGRESSOR_SELLER = 2
+
+
+class RecordEncoder:
+    """Decodes raw channel frames into one binary record batch (worker side)."""
+
+    def __init__(self) -> None:
+        self._symbol_ids: dict[str, int] = {}
+        self._parts: list[bytes] = []
+        self.records = 0
+
+    def add(self, ts_recv: int, raw: str) -> None:
+        params = json.loads(raw)["params"]
+        channel = params["channel"]
+        data = params["data"]
+        prefix = channel.partition(".")[0]
+        parts = self._parts
+
+        if prefix == "bbo":
+            seq = data.get("seq_no")
+            symbol_id = self._symbol_id(data["market"], ts_recv)  # May emit the symbol record first
+            parts.append(_HEAD.pack(RECORD_QUOTE, ts_recv))
+            parts.append(
+                _QUOTE.pack(
+                    symbol_id,
+                    float(data["bid"]),
+                    float(data["ask"]),
+                    float(data["bid_size"]),
+                    float(data["ask_size"]),
+                    int(data["last_updated_at"]) * 1_000_000,
+                    int(seq) if seq is not None else -1,
+                ),
+            )
+        elif prefix == "trades":
+            trade_id = str(data["id"]).encode()
+            symbol_id = self._symbol_id(data["market"], ts_recv)
+            parts.append(_HEAD.pack(RECORD_TRADE, ts_recv))
+            parts.append(
+                _TRADE.pack(
+                    symbol_id,
+                    float(data["price"]),
+                    float(data["size"]),
+                    _AGGRESSOR_BUYER if data["side"] == "BUY" else _AGGRESSOR_SELLER,
+                    int(data["created_at"]) * 1_000_000,
+                    len(trade_id),
+                ),
+            )
+            parts.append(trade_id)
+        else:
+            payload = marshal.dumps((channel, data))
+            parts.append(_HEAD.pack(RECORD_FRAME, ts_recv))
+            parts.append(_FRAME.pack(len(payload)))
+            parts.append(payload)
+        self.records += 1
+
+    def flush(self) -> bytes | None:
+        """Return the pending records as one pipe message, or None if there are none."""
+        if not self._parts:
+            return None
+        message = bytes([_MSG_RECORDS]) + b"".join(self._parts)
+        self._parts = []
+        return message
+
+    def _symbol_id(self, symbol: str, ts_recv: int) -> int:
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self._symbol_ids)
+            self._symbol_ids[symbol] = symbol_id
+            encoded = symbol.encode()
+            self._parts.append(_HEAD.pack(_RECORD_SYMBOL, ts_recv))
+            self._parts.append(_SYMBOL.pack(symbol_id, len(encoded)))
+            self._parts.append(encoded)
+        return symbol_id
+
+
+def decode_records(message: bytes, symbols: dict[int, str]) -> list[tuple[int, tuple]]:
+    """
+    Decode a record batch into ``(ts_recv, record)`` pairs (node side).
+
+    Records are ``(RECORD_QUOTE, symbol, bid, ask, bid_size, ask_size, ts_event, seq_no)``,
+    ``(RECORD_TRADE, symbol, price, size, aggressor, ts_event, trade_id)`` or
+    ``(RECORD_FRAME, channel, data)``. ``symbols`` is updated in place.
+    """
+    records = []
+    pos = 1
+    end = len(message)
+    while pos < end:
+        kind, ts_recv = _HEAD.unpack_from(message, pos)
+        pos += _HEAD.size
+        if kind == RECORD_QUOTE:
+            symbol_id, *fields = _QUOTE.unpack_from(message, pos)
+            pos += _QUOTE.size
+            records.append((ts_recv, (RECORD_QUOTE, symbols[symbol_id], *fields)))
+        elif kind == RECORD_TRADE:
+            symbol_id, price, size, aggressor, ts_event, id_len = _TRADE.unpack_from(message, pos)
+            pos += _TRADE.size
+            trade_id = message[pos:pos + id_len].decode()
+            pos += id_len
+            records.append((ts_recv, (RECORD_TRADE, symbols[symbol_id], price, size, aggressor, ts_event, trade_id)))
+        elif kind == RECORD_FRAME:
+            length = _FRAME.unpack_from(message, pos)[0]
+            pos += _FRAME.size
+            channel, data = marshal.loads(message[pos:pos + length])
+            pos += length
+            records.append((ts_recv, (RECORD_FRAME, channel, data)))
+        elif kind == _RECORD_SYMBOL:
+            symbol_id, length = _SYMBOL.unpack_from(message, pos)
+            pos += _SYMBOL.size
+            symbols[symbol_id] = message[pos:pos + length].decode()
+            pos += length
+        else:
+            raise ValueError(f"Unknown ingest record kind {kind}")
+    return records
+
+
+class IngestProcessClient:
+    """
+    WebSocket client interface backed by an ingestion worker process.
+
+    ``drain`` returns decoded records rather than raw frames (see
+    ``decode_records``); ``decodes_frames`` tells the data client so.
+    Subscriptions are mirrored locally so a restarted worker resubscribes.
+    """
+
+    decodes_frames = True
+
+    def __init__(self, paradex_config: ParadexConfig, config: ParadexDataClientConfig) -> None:
+        self._paradex_config = paradex_config
+        self._config = config
+        self._subscriptions: list[str] = []
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._control: Any = None
+        self._callback: Callable[[], None] | None = None
+        self._notified = False
+        self._messages: deque[bytes] = deque()
+        self._pending: deque[tuple[int, tuple]] = deque()
+        self._symbols: dict[int, str] = {}
+        self._generation = 0  # Bumped per worker; batches from an older one are discarded
+        self._generation_lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._disconnected: asyncio.Future | None = None
+        self._worker_stats: dict = {}
+        self._stats = {"messages": 0, "records": 0, "bytes": 0, "restarts": 0, "decode_errors": 0}
+
+    def enable_queue(self, capacity: int, policies: dict[str, str], callback: Callable[[], None]) -> None:
+        # The worker sizes its own frame queue from the config
+        self._callback = callback
+
+    def enable_recording(self, path: str, segment_bytes: int) -> None:
+        self._send("enable_recording", path, segment_bytes)
+
+    def disable_recording(self) -> None:
+        self._send("disable_recording")
+
+    async def subscribe(self, channel: str) -> None:
+        if channel not in self._subscriptions:
+            self._subscriptions.append(channel)
+        self._send("subscribe", channel)
+
+    async def unsubscribe(self, channel: str) -> None:
+        if channel in self._subscriptions:
+            self._subscriptions.remove(channel)
+        self._send("unsubscribe", channel)
+
+    async def connect(self, channels: list[str]) -> None:
+        """Connect the worker's socket and wait until its message loop ends."""
+        for channel in channels:
+            if channel not in self._subscriptions:
+                self._subscriptions.append(channel)
+        self._loop = asyncio.get_running_loop()
+        self._disconnected = self._loop.create_future()
+        self._send("connect", list(self._subscriptions))
+        error = await self._disconnected
+        if error:
+            raise RuntimeError(error)
+
+    async def disconnect(self) -> None:
+        """Stop the worker process."""
+        if self._process is None:
+            return
+        self._control.send(("stop",))
+        await asyncio.get_running_loop().run_in_executor(None, self._process.join, 5)
+        if self._process.is_alive():
+            self._process.kill()
+        self._process = None
+
+    def drain(self, max_records: int) -> list[tuple[int, tuple]]:
+        """Return up to ``max_records`` decoded records."""
+        self._notified = False  # Cleared before reading, so no wakeup is lost
+        pending = self._pending
+        while len(pending) < max_records and self._messages:
+            records = decode_records(self._messages.popleft(), self._symbols)
+            self._stats["records"] += len(records)
+            pending.extend(records)
+        return [pending.popleft() for _ in range(min(max_records, len(pending)))]
+
+    def queue_stats(self) -> dict:
+        return {
+            **self._worker_stats.get("queue", {}),
+            "ingest": {**self._stats, "pending_messages": len(self._messages)},
+        }
+
+    def connection_stats(self) -> list[dict]:
+        return self._worker_stats.get("connections", [])
+
+    def _send(self, *command: Any) -> None:
+        if self._process is None or not self._process.is_alive():
+            self._start()
+        self._control.send(command)
+
+    def _start(self) -> None:
+        if self._process is not None:
+            self._stats["restarts"] += 1
+        ctx = multiprocessing.get_context("spawn")
+        records_recv, records_send = ctx.Pipe(duplex=False)
+        control_recv, self._control = ctx.Pipe(duplex=False)
+        with self._generation_lock:
+            # Queued batches reference the old worker's symbol ids
+            self._generation += 1
+            self._messages.clear()
+            self._symbols = {}
+        self._process = ctx.Process(
+            target=run_ingest_worker,
+            args=(self._paradex_config, self._config, records_send, control_recv),
+            name="paradex-ingest",
+            daemon=True,
+        )
+        self._process.start()
+        records_send.close()
+        control_recv.close()
+        for channel in self._subscriptions:
+            self._control.send(("subscribe", channel))
+        threading.Thread(
+            target=self._read_loop,
+            args=(records_recv, self._generation),
+            daemon=True,
+        ).start()
+
+    def _read_loop(self, conn: Any, generation: int) -> None:
+        """Receive worker messages; runs on its own thread, blocking outside the GIL."""
+        while True:
+            try:
+                message = conn.recv_bytes()
+            except (EOFError, OSError):
+                if generation == self._generation:
+                    self._on_disconnected("Ingestion worker exited")
+                return
+            if generation != self._generation:
+                return  # A newer worker has replaced this one
+            if message[0] == _MSG_STATUS:
+                self._on_status(marshal.loads(message[1:]))
+                continue
+            with self._generation_lock:
+                if generation != self._generation:
+                    return
+                self._messages.append(message)
+            self._stats["messages"] += 1
+            self._stats["bytes"] += len(message)
+            # Appended before checking, so a concurrent drain either sees it or we notify
+            if not self._notified and self._callback is not None:
+                self._notified = True
+                self._callback()
+
+    def _on_status(self, status: dict) -> None:
+        if status["event"] == "stats":
+            self._worker_stats = status
+        elif status["event"] == "error":
+            self._stats["decode_errors"] += 1
+        elif status["event"] == "disconnected":
+            self._on_disconnected(status.get("error"))
+
+    def _on_disconnected(self, error: str | None) -> None:
+        future = self._disconnected
+        if self._loop is not None and future is not None:
+            self._loop.call_soon_threadsafe(lambda: future.done() or future.set_result(error))
+
+
+def run_ingest_worker(
+    paradex_config: ParadexConfig,
+    config: ParadexDataClientConfig,
+    records: Any,
+    control: Any,
+) -> None:
+    """Entry point of the ingestion worker process."""
+    asyncio.run(_IngestWorker(paradex_config, config, records, control).run())
+
+
+class _IngestWorker:
+    def __init__(
+        self,
+        paradex_config: ParadexConfig,
+        config: ParadexDataClientConfig,
+        records: Any,
+        control: Any,
+    ) -> None:
+        # Imported here: the data module imports this one
+        from nautilus_trader.adapters.paradex.data import create_ws_client
+
+        module = _rust.get_module()
+        rust_config = module.PyParadexConfig(
+            paradex_config.environment.value,
+            paradex_config.l2_address,
+            paradex_config.l2_address,
+            paradex_config.subkey_private_key,
+        )
+        self._config = config
+        self._ws = create_ws_client(rust_config, dataclasses.replace(config, ws_ingest_process=False))
+        self._records = records
+        self._control = control
+        self._encoder = RecordEncoder()
+        self._stopped = False
+        self._ready = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._ws.enable_queue(
+            self._config.ws_queue_capacity,
+            self._config.ws_overflow_policies,
+            lambda: loop.call_soon_threadsafe(self._ready.set),
+        )
+        loop.add_reader(self._control.fileno(), self._on_control)
+        next_stats = time.monotonic()
+        while not self._stopped:
+            try:
+                await asyncio.wait_for(self._ready.wait(), self._config.ws_ingest_stats_interval_secs)
+            except asyncio.TimeoutError:
+                pass
+            self._ready.clear()
+            self._forward()
+            if time.monotonic() >= next_stats:
+                next_stats = time.monotonic() + self._config.ws_ingest_stats_interval_secs
+                self._send_status(
+                    {
+                        "event": "stats",
+                        "queue": self._ws.queue_stats(),
+                        "connections": self._ws.connection_stats(),
+                        "records": self._encoder.records,
+                    },
+                )
+        loop.remove_reader(self._control.fileno())
+        await self._ws.disconnect()
+
+    def _forward(self) -> None:
+        """Decode everything queued and send it as record batches."""
+        batch_size = self._config.ws_drain_batch_size
+        while True:
+            frames = self._ws.drain(batch_size)
+            for ts_recv, raw in frames:
+                try:
+                    self._encoder.add(ts_recv, raw)
+                except Exception as e:
+                    self._send_status({"event": "error", "error": f"Failed to decode frame: {e}"})
+            message = self._encoder.flush()
+            if message is not None:
+                self._records.send_bytes(message)
+            if len(frames) < batch_size:
+                return
+
+    def _on_control(self) -> None:
+        try:
+            command, *args = self._control.recv()
+        except (EOFError, OSError):
+            command, args = "stop", []  # The node went away
+
+        if command == "stop":
+            self._stopped = True
+            self._ready.set()
+        elif command == "connect":
+            self._spawn(self._connect(args[0]))
+        elif command == "subscribe":
+            self._spawn(self._ws.subscribe(args[0]))
+        elif command == "unsubscribe":
+            self._spawn(self._ws.unsubscribe(args[0]))
+        elif command == "enable_recording":
+            self._ws.enable_recording(*args)
+        elif command == "disable_recording":
+            self._ws.disable_recording()
+
+    async def _connect(self, channels: list[str]) -> None:
+        error = None
+        try:
+            await self._ws.connect(channels)
+        except Exception as e:
+            error = str(e)
+        self._forward()  # Send the tail before reporting the disconnect
+        self._send_status({"event": "disconnected", "error": error})
+
+    def _spawn(self, coro: Any) -> None:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _send_status(self, status: dict) -> None:
+        self._records.send_bytes(bytes([_MSG_STATUS]) + marshal.dumps(status))
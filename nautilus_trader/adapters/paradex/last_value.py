@@ -0,0 +1,33 @@
+# nautilus_trader/adapters/paradex/last_value.py
+"""Last-value cache for streamed Paradex market data."""
+
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+class LastValueCache:
+    """
+    Latest streamed value per (data type, instrument).
+
+    Lets a new subscription be served immediately from the running stream
+    instead of waiting for the next update or calling REST.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[tuple[type, InstrumentId], Data] = {}
+
+    @staticmethod
+    def _key(data: Data) -> tuple[type, InstrumentId]:
+        inner = data.data if isinstance(data, CustomData) else data
+        return type(inner), inner.instrument_id
+
+    def update(self, data: Data) -> None:
+        self._values[self._key(data)] = data
+
+    def get(self, data_cls: type, instrument_id: InstrumentId) -> Data | None:
+        """Return the last ``data_cls`` value for ``instrument_id``."""
+        return self._values.get((data_cls, instrument_id))
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,145 @@
+# nautilus_trader/adapters/paradex/latency.py
+"""Per-channel latency tracking for the Paradex WebSocket feed."""
+
+import math
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram in nanoseconds.
+
+    Buckets double in width from 1us, so recording is O(1) and memory is
+    fixed; percentiles are accurate to within one bucket (a factor of 2).
+    Negative samples (clock skew) are clamped into the first bucket and
+    counted separately.
+    """
+
+    _BASE_NS = 1_000
+    _BUCKETS = 32  # 1us .. ~36 minutes
+
+    def __init__(self) -> None:
+        self._counts = [0] * self._BUCKETS
+        self.count = 0
+        self.negative = 0
+        self.min_ns: int | None = None
+        self.max_ns: int | None = None
+        self._sum_ns = 0
+
+    def record(self, value_ns: int) -> None:
+        self.count += 1
+        self._sum_ns += value_ns
+        self.min_ns = value_ns if self.min_ns is None else min(self.min_ns, value_ns)
+        self.max_ns = value_ns if self.max_ns is None else max(self.max_ns, value_ns)
+        if value_ns < 0:
+            self.negative += 1
+        bucket = (max(value_ns, 0) // self._BASE_NS).bit_length()
+        self._counts[min(bucket, self._BUCKETS - 1)] += 1
+
+    @property
+    def mean_ns(self) -> float:
+        return self._sum_ns / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> int:
+        """Return the upper bound of the bucket holding the ``q`` quantile (0..1)."""
+        if self.count == 0:
+            return 0
+        rank = math.ceil(q * self.count)
+        seen = 0
+        for bucket, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return self._BASE_NS << bucket
+        return self._BASE_NS << (self._BUCKETS - 1)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "negative": self.negative,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns,
+            "mean_ns": self.mean_ns,
+            "p50_ns": self.percentile(0.50),
+            "p99_ns": self.percentile(0.99),
+            "p999_ns": self.percentile(0.999),
+        }
+
+
+class ChannelLatency:
+    """Latency histograms for one channel prefix."""
+
+    def __init__(self) -> None:
+        self.venue_to_receive = LatencyHistogram()
+        self.receive_to_dispatch = LatencyHistogram()
+        self.venue_to_dispatch = LatencyHistogram()
+
+    def to_dict(self) -> dict:
+        return {
+            "venue_to_receive": self.venue_to_receive.to_dict(),
+            "receive_to_dispatch": self.receive_to_dispatch.to_dict(),
+            "venue_to_dispatch": self.venue_to_dispatch.to_dict(),
+        }
+
+
+class LatencyTracker:
+    """
+    Splits feed latency into venue/network and local dispatch components.
+
+    ``venue_to_receive`` is ``ts_recv - ts_event`` corrected by the clock
+    skew estimate, so it covers venue publishing plus the network;
+    ``receive_to_dispatch`` is queueing and Python decoding in this process.
+
+    The skew (venue clock minus local clock) comes from REST time probes
+    when available (``record_time_probe``). Without probes, the minimum
+    observed ``ts_recv - ts_event`` gives a lower bound on the skew, since
+    real one-way delay is never negative.
+    """
+
+    def __init__(self) -> None:
+        self._channels: dict[str, ChannelLatency] = {}
+        self._probe_skew_ns: int | None = None
+        self._probe_rtt_ns: int | None = None
+        self._min_one_way_ns: int | None = None
+
+    @property
+    def clock_skew_ns(self) -> int:
+        """Estimated venue clock minus local clock."""
+        if self._probe_skew_ns is not None:
+            return self._probe_skew_ns
+        return -(self._min_one_way_ns or 0)
+
+    def record_time_probe(self, local_send_ns: int, venue_ns: int, local_recv_ns: int) -> None:
+        """
+        Add a server time probe, keeping the one with the smallest round trip.
+
+        Assumes symmetric network paths, so the venue read its clock halfway
+        through the round trip.
+        """
+        rtt = local_recv_ns - local_send_ns
+        if self._probe_rtt_ns is None or rtt < self._probe_rtt_ns:
+            self._probe_rtt_ns = rtt
+            self._probe_skew_ns = venue_ns - (local_send_ns + rtt // 2)
+
+    def record(self, channel: str, ts_event: int, ts_recv: int, ts_dispatch: int) -> None:
+        """Record one decoded message on ``channel`` (prefix is used as the key)."""
+        prefix = channel.partition(".")[0]
+        latency = self._channels.get(prefix)
+        if latency is None:
+            latency = ChannelLatency()
+            self._channels[prefix] = latency
+
+        one_way = ts_recv - ts_event
+        if self._min_one_way_ns is None or one_way < self._min_one_way_ns:
+            self._min_one_way_ns = one_way
+
+        skew = self.clock_skew_ns
+        latency.venue_to_receive.record(one_way + skew)
+        latency.receive_to_dispatch.record(ts_dispatch - ts_recv)
+        latency.venue_to_dispatch.record(ts_dispatch - ts_event + skew)
+
+    def to_dict(self) -> dict:
+        return {
+            "clock_skew_ns": self.clock_skew_ns,
+            "clock_skew_source": "probe" if self._probe_skew_ns is not None else "min_one_way",
+            "probe_rtt_ns": self._probe_rtt_ns,
+            "channels": {prefix: c.to_dict() for prefix, c in self._channels.items()},
+        }
@@ -0,0 +1,148 @@
+# nautilus_trader/adapters/paradex/markets_summary.py
+"""Demultiplexer for the Paradex ``markets_summary`` channel."""
+
+from enum import Enum
+
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.data import CustomData
+from nautilus_trader.model.data import DataType
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+
+from nautilus_trader.adapters.paradex.constants import PARADEX
+from nautilus_trader.adapters.paradex.factories import parse_funding_rate_update
+from nautilus_trader.adapters.paradex.factories import parse_index_price_update
+from nautilus_trader.adapters.paradex.factories import parse_mark_price_update
+from nautilus_trader.adapters.paradex.factories import parse_open_interest
+from nautilus_trader.adapters.paradex.types import ParadexOpenInterest
+
+MARKETS_SUMMARY_CHANNEL = "markets_summary"
+MARKETS_SUMMARY_ALL = f"{MARKETS_SUMMARY_CHANNEL}.ALL"
+
+
+class SummaryKind(Enum):
+    """Data types carried by a markets summary frame."""
+
+    MARK_PRICE = "mark_price"
+    INDEX_PRICE = "underlying_price"
+    FUNDING_RATE = "funding_rate"
+    OPEN_INTEREST = "open_interest"
+
+
+_PARSERS = {
+    SummaryKind.MARK_PRICE: parse_mark_price_update,
+    SummaryKind.INDEX_PRICE: parse_index_price_update,
+    SummaryKind.FUNDING_RATE: parse_funding_rate_update,
+    SummaryKind.OPEN_INTEREST: parse_open_interest,
+}
+
+
+class MarketsSummaryDemultiplexer:
+    """
+    Fans out ``markets_summary`` frames to the subscribed data types.
+
+    Each frame is decoded once and only the kinds subscribed for its symbol
+    are produced. Once ``all_threshold`` symbols are subscribed the single
+    ``markets_summary.ALL`` channel replaces the per-symbol channels; it is
+    kept until coverage drops below half the threshold to avoid flapping.
+    """
+
+    def __init__(self, all_threshold: int) -> None:
+        self._all_threshold = all_threshold
+        self._subscriptions: dict[str, set[SummaryKind]] = {}
+        self._instrument_ids: dict[str, InstrumentId] = {}
+        self._channels: set[str] = set()
+        self._use_all = False
+        self._last: dict[str, tuple[dict, int]] = {}
+
+    @property
+    def channels(self) -> set[str]:
+        """The channels currently required on the socket."""
+        return set(self._channels)
+
+    def subscribe(self, kind: SummaryKind, instrument_id: InstrumentId) -> tuple[list[str], list[str]]:
+        """
+        Add a subscription.
+
+        Returns the channels to subscribe and to unsubscribe on the socket.
+        """
+        symbol = instrument_id.symbol.value
+        self._instrument_ids[symbol] = instrument_id
+        self._subscriptions.setdefault(symbol, set()).add(kind)
+        return self._update_channels()
+
+    def unsubscribe(self, kind: SummaryKind, instrument_id: InstrumentId) -> tuple[list[str], list[str]]:
+        """
+        Remove a subscription.
+
+        Returns the channels to subscribe and to unsubscribe on the socket.
+        """
+        symbol = instrument_id.symbol.value
+        kinds = self._subscriptions.get(symbol)
+        if kinds is not None:
+            kinds.discard(kind)
+            if not kinds:
+                del self._subscriptions[symbol]
+        return self._update_channels()
+
+    def handle(self, summary: dict, ts_init: int) -> list[Data]:
+        """Decode one summary frame into data for the subscribed kinds only."""
+        symbol = summary.get("symbol")
+        self._last[symbol] = (summary, ts_init)  # Undecoded, for last()
+        kinds = self._subscriptions.get(symbol)
+        if not kinds:
+            return []
+
+        instrument_id = self._instrument_ids.get(symbol)
+        if instrument_id is None:
+            instrument_id = InstrumentId(Symbol(symbol), PARADEX)
+            self._instrument_ids[symbol] = instrument_id
+
+        data: list[Data] = []
+        for kind in kinds:
+            item = self._parse(kind, summary, instrument_id, ts_init)
+            if item is not None:
+                data.append(item)
+        return data
+
+    def last(self, kind: SummaryKind, instrument_id: InstrumentId) -> Data | None:
+        """
+        Decode ``kind`` from the last frame received for ``instrument_id``.
+
+        Frames are kept undecoded, so any kind can be served to a new
+        subscription even if it was not subscribed when the frame arrived.
+        """
+        cached = self._last.get(instrument_id.symbol.value)
+        if cached is None:
+            return None
+        summary, ts_init = cached
+        return self._parse(kind, summary, instrument_id, ts_init)
+
+    @staticmethod
+    def _parse(kind: SummaryKind, summary: dict, instrument_id: InstrumentId, ts_init: int) -> Data | None:
+        if summary.get(kind.value) in (None, ""):
+            return None
+        item = _PARSERS[kind](summary, instrument_id, ts_init)
+        if kind == SummaryKind.OPEN_INTEREST:
+            data_type = DataType(ParadexOpenInterest, metadata={"instrument_id": instrument_id.value})
+            item = CustomData(data_type, item)
+        return item
+
+    def _update_channels(self) -> tuple[list[str], list[str]]:
+        count = len(self._subscriptions)
+        if count >= self._all_threshold:
+            self._use_all = True
+        elif count < self._all_threshold // 2:
+            self._use_all = False
+
+        if count == 0:
+            desired: set[str] = set()
+        elif self._use_all:
+            desired = {MARKETS_SUMMARY_ALL}
+        else:
+            desired = {f"{MARKETS_SUMMARY_CHANNEL}.{s}" for s in self._subscriptions}
+
+        to_subscribe = sorted(desired - self._channels)
+        to_unsubscribe = sorted(self._channels - desired)
+        self._channels = desired
+        return to_subscribe, to_unsubscribe
@@ -1,12 +1,45 @@
 # nautilus_trader/adapters/paradex/providers.py
 """Instrument provider for Paradex exchange."""
 
+import asyncio
+import fnmatch
+import hashlib
+import json
+import pickle
+from collections.abc import Callable
+from pathlib import Path
 from typing import Any
+from typing import NamedTuple
 
+import nautilus_trader
 from nautilus_trader.common.component import LiveClock
 from nautilus_trader.common.component import Logger
 from nautilus_trader.core.correctness import PY_PREV
 from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+
+from nautilus_trader.adapters.paradex.config import ParadexInstrumentProviderConfig
+from nautilus_trader.adapters.paradex.constants import PARADEX
+from nautilus_trader.adapters.paradex.factories import parse_instruments
+from nautilus_trader.adapters.paradex.schemas import ParadexMarket
+from nautilus_trader.adapters.paradex.schemas import decode_markets
+from nautilus_trader.adapters.paradex.schemas import encode_market
+
+_SNAPSHOT_VERSION = 3
+
+
+def market_fingerprint(market_data: ParadexMarket) -> bytes:
+    """Return a digest of a market definition, independent of the payload's key order."""
+    return hashlib.blake2b(encode_market(market_data), digest_size=16).digest()
+
+
+class SymbolEntry(NamedTuple):
+    """A loaded market, keyed in the provider by its raw venue symbol."""
+
+    instrument_id: InstrumentId
+    instrument: Any
+    price_precision: int
+    size_precision: int
 
 
 class ParadexInstrumentProvider:
@@ -14,6 +47,25 @@ class ParadexInstrumentProvider:
     Instrument provider for Paradex.
 
     Fetches and caches market instruments from REST API.
+
+    With ``config.snapshot_path`` set, the parsed instruments are persisted
+    with a hash of the markets payload they came from. A later start loads
+    them from the snapshot without waiting on REST, then revalidates against
+    the markets endpoint in the background and only re-parses if the payload
+    changed.
+
+    Only markets selected by ``load_ids`` and the filters in the config are
+    parsed. Others are fetched on demand: ``load_async`` awaits one, and a
+    ``find_instrument`` miss starts a background fetch so a later lookup
+    succeeds.
+
+    ``start_refresh`` refetches the markets periodically. Each market's
+    definition is fingerprinted, so only new or changed markets are parsed
+    and reported; an unchanged payload costs one hash.
+
+    ``resolve`` maps a raw venue symbol (or full instrument ID string) to its
+    ``SymbolEntry`` with one dict lookup, for parse paths that would otherwise
+    build an ``InstrumentId`` per row.
     """
 
     def __init__(
@@ -21,35 +73,251 @@ class ParadexInstrumentProvider:
         http_client: Any,
         clock: LiveClock,
         logger: Logger,
+        config: ParadexInstrumentProviderConfig | None = None,
     ) -> None:
         self._http = http_client
         self._clock = clock
         self._log = logger
+        self._config = config or ParadexInstrumentProviderConfig()
 
         self._instruments: dict[InstrumentId, Any] = {}
+        self._symbols: dict[str, SymbolEntry] = {}  # Raw symbol and full ID string -> entry
+        self._payload_hash: str | None = None
+        self._fingerprints: dict[str, bytes] = {}  # Per loaded market symbol
+        self._revalidate_task: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+        self._load_symbols = {i.split(".")[0] for i in self._config.load_ids or []}
+        self._filtered = self._config.load_ids is not None or any(
+            f is not None
+            for f in (self._config.symbol_globs, self._config.asset_kinds, self._config.min_volume_24h)
+        )
+        self._on_demand: dict[InstrumentId, asyncio.Task] = {}
+        self._unknown: set[InstrumentId] = set()
 
     async def initialize(self) -> None:
-        """Initialize instrument provider by fetching all markets."""
+        """Initialize instrument provider from the snapshot if present, else by fetching all markets."""
         self._log.info("Initializing Paradex instrument provider...")
 
-        try:
-            markets = await self._http.get_markets()
-
-            for market_data in markets:
-                from nautilus_trader.adapters.paradex.factories import parse_instrument
-                from nautilus_trader.adapters.paradex.constants import PARADEX
-
-                instrument = parse_instrument(market_data, PARADEX)
-                self._instruments[instrument.id] = instrument
+        if self._load_snapshot():
+            self._log.info(f"Loaded {len(self._instruments)} instruments from snapshot, revalidating")
+            self._revalidate_task = asyncio.get_running_loop().create_task(self._revalidate())
+            return
 
+        try:
+            await self._load_markets()
             self._log.info(f"Loaded {len(self._instruments)} instruments")
         except Exception as e:
             self._log.error(f"Failed to initialize instruments: {e}")
             raise
 
+    async def _revalidate(self) -> None:
+        try:
+            changed = await self._load_markets()
+            if changed:
+                self._log.info(f"{len(changed)} instruments changed since snapshot, reloaded")
+        except Exception as e:
+            self._log.warning(f"Failed to revalidate instrument snapshot: {e}")
+
+    def start_refresh(self, on_changed: Callable[[list[Any]], None]) -> None:
+        """Refresh markets every ``config.refresh_interval_secs``, passing changed instruments to ``on_changed``."""
+        if not self._config.refresh_interval_secs or self._refresh_task is not None:
+            return
+        self._refresh_task = asyncio.get_running_loop().create_task(self._run_refresh(on_changed))
+
+    def stop_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+    async def _run_refresh(self, on_changed: Callable[[list[Any]], None]) -> None:
+        while True:
+            await asyncio.sleep(self._config.refresh_interval_secs)
+            try:
+                changed = await self._load_markets()
+            except Exception as e:
+                self._log.warning(f"Failed to refresh instruments: {e}")
+                continue
+            if changed:
+                self._log.info(f"Refreshed {len(changed)} changed instruments")
+                on_changed(changed)
+
+    async def _load_markets(self) -> list[Any]:
+        """Fetch markets and parse only those new or changed; returns the parsed instruments."""
+        payload = await self._http.get_markets()
+        # Native client responses are objects; per-market fingerprints still skip unchanged markets
+        payload_hash = hashlib.sha256(payload.encode()).hexdigest() if isinstance(payload, str) else None
+        if payload_hash is not None and payload_hash == self._payload_hash:
+            return []
+
+        volumes = await self._fetch_volumes() if self._config.min_volume_24h is not None else {}
+        markets = []
+        fingerprints = []
+        for market_data in decode_markets(payload):
+            symbol = market_data.symbol
+            loaded = symbol in self._fingerprints
+            if not loaded and self._filtered and not self._selected(market_data, volumes):
+                continue
+            fingerprint = market_fingerprint(market_data)
+            if loaded and self._fingerprints[symbol] == fingerprint:
+                continue
+            markets.append(market_data)
+            fingerprints.append(fingerprint)
+        changed = self._add_markets(markets, fingerprints)
+        self._payload_hash = payload_hash
+        self._write_snapshot()
+        return changed
+
+    def _add_markets(self, markets: list[ParadexMarket], fingerprints: list[bytes]) -> list[Any]:
+        instruments = parse_instruments(markets, PARADEX)
+        for market_data, fingerprint, instrument in zip(markets, fingerprints, instruments):
+            self._index(instrument)
+            self._fingerprints[market_data.symbol] = fingerprint
+        return instruments
+
+    def _index(self, instrument: Any) -> None:
+        self._instruments[instrument.id] = instrument
+        entry = SymbolEntry(instrument.id, instrument, instrument.price_precision, instrument.size_precision)
+        self._symbols[instrument.id.symbol.value] = entry
+        self._symbols[instrument.id.value] = entry
+
+    def _selected(self, market_data: ParadexMarket, volumes: dict[str, float]) -> bool:
+        symbol = market_data.symbol
+        if symbol in self._load_symbols:
+            return True
+        config = self._config
+        if config.symbol_globs is None and config.asset_kinds is None and config.min_volume_24h is None:
+            return False  # Only load_ids were given
+        if config.symbol_globs is not None and not any(fnmatch.fnmatchcase(symbol, g) for g in config.symbol_globs):
+            return False
+        if config.asset_kinds is not None and market_data.asset_kind not in config.asset_kinds:
+            return False
+        if config.min_volume_24h is not None and volumes.get(symbol, 0.0) < config.min_volume_24h:
+            return False
+        return True
+
+    async def _fetch_volumes(self) -> dict[str, float]:
+        payload = await self._http.get_markets_summary()
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        return {
+            summary["symbol"]: float(summary.get("volume_24h") or 0)
+            for summary in payload["results"]
+        }
+
+    async def load_async(self, instrument_id: InstrumentId) -> Any:
+        """Return the instrument, fetching its market if it was not loaded; None if unknown."""
+        instrument = self._instruments.get(instrument_id)
+        if instrument is not None or instrument_id in self._unknown:
+            return instrument
+        task = self._on_demand.get(instrument_id)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._fetch_instrument(instrument_id))
+            self._on_demand[instrument_id] = task
+        return await asyncio.shield(task)
+
+    async def load_ids_async(self, instrument_ids: list[InstrumentId]) -> None:
+        """Fetch every instrument in ``instrument_ids`` not yet loaded."""
+        await asyncio.gather(*(self.load_async(instrument_id) for instrument_id in instrument_ids))
+
+    async def _fetch_instrument(self, instrument_id: InstrumentId) -> Any:
+        symbol = instrument_id.symbol.value
+        try:
+            payload = await self._http.get_market(symbol)
+            for market_data in decode_markets(payload):
+                if market_data.symbol == symbol:
+                    instrument = self._add_markets([market_data], [market_fingerprint(market_data)])[0]
+                    self._log.info(f"Loaded {instrument_id} on demand")
+                    return instrument
+            self._log.warning(f"No Paradex market for {instrument_id}")
+            self._unknown.add(instrument_id)  # Not retried
+            return None
+        except Exception as e:
+            self._log.error(f"Failed to load {instrument_id} on demand: {e}")
+            return None
+        finally:
+            self._on_demand.pop(instrument_id, None)
+
+    def _load_snapshot(self) -> bool:
+        path = self._config.snapshot_path
+        if path is None or not Path(path).exists():
+            return False
+        try:
+            snapshot = pickle.loads(Path(path).read_bytes())
+        except Exception as e:
+            self._log.warning(f"Ignoring unreadable instrument snapshot {path}: {e}")
+            return False
+        # Pickled instruments are only valid for the Nautilus build that wrote them
+        if snapshot.get("version") != _SNAPSHOT_VERSION or snapshot.get("nautilus_version") != nautilus_trader.__version__:
+            self._log.info(f"Ignoring instrument snapshot {path} from another version")
+            return False
+        if snapshot.get("selection") != self._selection_key():
+            self._log.info(f"Ignoring instrument snapshot {path} taken with other load filters")
+            return False
+
+        self._instruments = {}
+        self._symbols = {}
+        for instrument in snapshot["instruments"]:
+            self._index(instrument)
+        self._fingerprints = snapshot["fingerprints"]
+        self._payload_hash = snapshot["payload_hash"]
+        return True
+
+    def _write_snapshot(self) -> None:
+        path = self._config.snapshot_path
+        if path is None:
+            return
+        snapshot = {
+            "version": _SNAPSHOT_VERSION,
+            "nautilus_version": nautilus_trader.__version__,
+            "payload_hash": self._payload_hash,
+            "selection": self._selection_key(),
+            "instruments": list(self._instruments.values()),
+            "fingerprints": self._fingerprints,
+        }
+        try:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            tmp_path.write_bytes(pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL))
+            tmp_path.replace(path)
+        except OSError as e:
+            self._log.warning(f"Failed to write instrument snapshot {path}: {e}")
+
+    def _selection_key(self) -> tuple:
+        config = self._config
+        return (
+            sorted(self._load_symbols) if config.load_ids is not None else None,
+            config.symbol_globs,
+            config.asset_kinds,
+            config.min_volume_24h,
+        )
+
     def find_instrument(self, instrument_id: InstrumentId) -> Any:
-        """Find instrument by ID."""
-        return self._instruments.get(instrument_id)
+        """Find instrument by ID, starting a background fetch on a miss."""
+        instrument = self._instruments.get(instrument_id)
+        if instrument is None and self._filtered and self._config.load_on_demand:
+            self._start_on_demand(instrument_id)
+        return instrument
+
+    def resolve(self, symbol: str) -> SymbolEntry | None:
+        """Return the entry for a raw venue symbol or full instrument ID string, starting a background fetch on a miss."""
+        entry = self._symbols.get(symbol)
+        if entry is None and self._filtered and self._config.load_on_demand:
+            if "." in symbol:
+                self._start_on_demand(InstrumentId.from_str(symbol))
+            else:
+                self._start_on_demand(InstrumentId(Symbol(symbol), PARADEX))
+        return entry
+
+    def _start_on_demand(self, instrument_id: InstrumentId) -> None:
+        if instrument_id in self._on_demand or instrument_id in self._unknown:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop to fetch on; load_async can still be awaited later
+        self._on_demand[instrument_id] = loop.create_task(self._fetch_instrument(instrument_id))
 
     def list_all(self) -> list[Any]:
         """List all instruments."""
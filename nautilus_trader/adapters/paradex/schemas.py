@@ -0,0 +1,162 @@
+# nautilus_trader/adapters/paradex/schemas.py
+"""
+Typed schemas for Paradex REST payloads, decoded with msgspec.
+
+Payloads are accepted either as JSON (``str``/``bytes``) or as the already
+decoded objects a ``PyHttpClient(config, native=True)`` returns.
+
+Report pages are split with ``page_rows`` and each row converted on its own
+with ``convert_row``, so one malformed row does not fail the page.
+"""
+
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+
+import msgspec
+
+T = TypeVar("T")
+
+
+class ParadexMarket(msgspec.Struct, frozen=True, gc=False):
+    """A market definition from ``/v1/markets``."""
+
+    symbol: str
+    base_currency: str
+    quote_currency: str
+    price_tick_size: str
+    quantity_tick_size: str
+    min_quantity: str
+    max_quantity: str
+    asset_kind: str | None = None
+
+
+class ParadexOrder(msgspec.Struct, frozen=True, gc=False):
+    """An order from ``/v1/orders``."""
+
+    id: str
+    side: str
+    type: str
+    status: str
+    size: str
+    created_at: int
+    updated_at: int
+    market: str = ""
+    instrument_id: str = ""  # Older payloads name the market this way
+    client_id: str = ""
+    price: str | None = None
+    filled_size: str = "0"
+
+
+class ParadexFill(msgspec.Struct, frozen=True, gc=False):
+    """A fill from ``/v1/fills``."""
+
+    id: str
+    trade_id: str
+    order_id: str
+    side: str
+    size: str
+    price: str
+    fee: str
+    fee_currency: str
+    liquidity: str
+    created_at: int
+    market: str = ""
+    instrument_id: str = ""
+
+
+class ParadexPosition(msgspec.Struct, frozen=True, gc=False):
+    """A position from ``/v1/positions``."""
+
+    id: str
+    side: str
+    size: str
+    updated_at: int
+    market: str = ""
+    instrument_id: str = ""
+    avg_entry_price: str | None = None
+    unrealized_pnl: str | None = None
+
+
+class ParadexAccount(msgspec.Struct, frozen=True, gc=False):
+    """The account summary from ``/v1/account``."""
+
+    account: str
+    account_value: str | None = None
+    free_collateral: str | None = None
+    total_collateral: str | None = None
+    initial_margin_requirement: str | None = None
+    maintenance_margin_requirement: str | None = None
+    settlement_asset: str | None = None
+    status: str | None = None
+    updated_at: int | None = None
+
+
+class _Page(msgspec.Struct, Generic[T], gc=False):
+    results: list[T] = []
+
+
+_RAW_PAGE = msgspec.json.Decoder(_Page[msgspec.Raw])
+_MARKETS = msgspec.json.Decoder(_Page[ParadexMarket])
+_ORDERS = msgspec.json.Decoder(_Page[ParadexOrder])
+_FILLS = msgspec.json.Decoder(_Page[ParadexFill])
+_POSITIONS = msgspec.json.Decoder(_Page[ParadexPosition])
+_ACCOUNT = msgspec.json.Decoder(ParadexAccount)
+_MARKET_ENCODER = msgspec.json.Encoder()
+_ROWS = {
+    ParadexOrder: msgspec.json.Decoder(ParadexOrder),
+    ParadexFill: msgspec.json.Decoder(ParadexFill),
+    ParadexPosition: msgspec.json.Decoder(ParadexPosition),
+}
+
+
+def _decode(decoder: msgspec.json.Decoder, payload: Any) -> Any:
+    if isinstance(payload, (str, bytes)):
+        return decoder.decode(payload)
+    return msgspec.convert(payload, decoder.type)
+
+
+def decode_markets(payload: Any) -> list[ParadexMarket]:
+    """Decode a ``/v1/markets`` response, raising ``msgspec.ValidationError`` on a schema mismatch."""
+    return _decode(_MARKETS, payload).results
+
+
+def decode_orders(payload: Any) -> list[ParadexOrder]:
+    """Decode a ``/v1/orders`` response."""
+    return _decode(_ORDERS, payload).results
+
+
+def decode_fills(payload: Any) -> list[ParadexFill]:
+    """Decode a ``/v1/fills`` response."""
+    return _decode(_FILLS, payload).results
+
+
+def decode_positions(payload: Any) -> list[ParadexPosition]:
+    """Decode a ``/v1/positions`` response."""
+    return _decode(_POSITIONS, payload).results
+
+
+def decode_account(payload: Any) -> ParadexAccount:
+    """Decode a ``/v1/account`` response."""
+    return _decode(_ACCOUNT, payload)
+
+
+def page_rows(payload: Any) -> list[Any]:
+    """Split a results page into undecoded rows (``msgspec.Raw`` for JSON, else the objects as given)."""
+    if isinstance(payload, (str, bytes)):
+        return _RAW_PAGE.decode(payload).results
+    return payload.get("results", [])
+
+
+def convert_row(row: Any, row_type: type[T]) -> T:
+    """Convert one row from ``page_rows`` (or an already typed row) to ``row_type``."""
+    if isinstance(row, row_type):
+        return row
+    if isinstance(row, msgspec.Raw):
+        return _ROWS[row_type].decode(row)
+    return msgspec.convert(row, row_type)
+
+
+def encode_market(market: ParadexMarket) -> bytes:
+    """Encode a market canonically (fields in declaration order), e.g. for fingerprinting."""
+    return _MARKET_ENCODER.encode(market)
@@ -0,0 +1,142 @@
+# nautilus_trader/adapters/paradex/sequence.py
+"""Per-channel sequence gap detection and recovery for Paradex feeds."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from enum import Enum
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+
+from nautilus_trader.adapters.paradex.latency import LatencyHistogram
+
+# Recovery callback: resyncs `channel` and returns the new baseline seq_no, if known
+RecoverFn = Callable[[str], Awaitable[int | None]]
+
+
+class SequenceStatus(Enum):
+    """Result of checking a message sequence number."""
+
+    OK = "ok"
+    GAP = "gap"
+    STALE = "stale"  # Duplicate or older than the last seen message
+
+
+@dataclass
+class ChannelSequenceStats:
+    """Sequence counters for one channel."""
+
+    messages: int = 0
+    gaps: int = 0
+    missed: int = 0
+    stale: int = 0
+    recoveries: int = 0
+    recovery_failures: int = 0
+    recovery_ns: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> dict:
+        return {
+            "messages": self.messages,
+            "gaps": self.gaps,
+            "missed": self.missed,
+            "stale": self.stale,
+            "recoveries": self.recoveries,
+            "recovery_failures": self.recovery_failures,
+            "recovery_ns": self.recovery_ns.to_dict(),
+        }
+
+
+class SequenceTracker:
+    """Tracks the last ``seq_no`` per channel and classifies each new one."""
+
+    def __init__(self) -> None:
+        self._last: dict[str, int] = {}
+        self.stats: dict[str, ChannelSequenceStats] = {}
+
+    def channel_stats(self, channel: str) -> ChannelSequenceStats:
+        stats = self.stats.get(channel)
+        if stats is None:
+            stats = ChannelSequenceStats()
+            self.stats[channel] = stats
+        return stats
+
+    def observe(self, channel: str, seq: int) -> SequenceStatus:
+        stats = self.channel_stats(channel)
+        stats.messages += 1
+        last = self._last.get(channel)
+        if last is not None and seq <= last:
+            stats.stale += 1
+            return SequenceStatus.STALE
+
+        self._last[channel] = seq
+        if last is not None and seq > last + 1:
+            stats.gaps += 1
+            stats.missed += seq - last - 1
+            return SequenceStatus.GAP
+        return SequenceStatus.OK
+
+    def reset(self, channel: str, seq: int | None = None) -> None:
+        """Set the baseline after a resync; ``None`` accepts the next message as-is."""
+        if seq is None:
+            self._last.pop(channel, None)
+        else:
+            self._last[channel] = seq
+
+
+class SequenceGapMonitor:
+    """
+    Detects gaps on sequenced channels and runs the registered recovery.
+
+    Recovery callbacks are registered per channel prefix (e.g. ``orderbook``)
+    and run as tasks, at most one per channel at a time. Their duration is
+    recorded so feed quality can be alerted on.
+    """
+
+    def __init__(self, clock: LiveClock, logger: Logger) -> None:
+        self._clock = clock
+        self._log = logger
+        self._tracker = SequenceTracker()
+        self._recover_fns: dict[str, RecoverFn] = {}
+        self._recovering: dict[str, asyncio.Task] = {}
+
+    def register(self, prefix: str, recover: RecoverFn) -> None:
+        self._recover_fns[prefix] = recover
+
+    def on_message(self, channel: str, seq: int) -> bool:
+        """Check ``seq`` for ``channel``; returns False if the message should be dropped."""
+        status = self._tracker.observe(channel, seq)
+        if status == SequenceStatus.STALE:
+            return False
+        if status == SequenceStatus.GAP:
+            self._on_gap(channel, seq)
+        return True
+
+    def metrics(self) -> dict:
+        return {channel: stats.to_dict() for channel, stats in self._tracker.stats.items()}
+
+    def _on_gap(self, channel: str, seq: int) -> None:
+        self._log.warning(f"Sequence gap on {channel} at seq_no {seq}")
+        recover = self._recover_fns.get(channel.partition(".")[0])
+        if recover is None or channel in self._recovering:
+            return
+        task = asyncio.get_running_loop().create_task(self._recover(channel, recover))
+        self._recovering[channel] = task
+
+    async def _recover(self, channel: str, recover: RecoverFn) -> None:
+        stats = self._tracker.channel_stats(channel)
+        start_ns = self._clock.timestamp_ns()
+        try:
+            seq = await recover(channel)
+            self._tracker.reset(channel, seq)
+            stats.recoveries += 1
+            elapsed_ns = self._clock.timestamp_ns() - start_ns
+            stats.recovery_ns.record(elapsed_ns)
+            self._log.info(f"Recovered {channel} in {elapsed_ns / 1e6:.1f}ms")
+        except Exception as e:
+            stats.recovery_failures += 1
+            self._log.error(f"Failed to recover {channel} after sequence gap: {e}")
+        finally:
+            self._recovering.pop(channel, None)
@@ -0,0 +1,101 @@
+# nautilus_trader/adapters/paradex/snapshots.py
+"""Order book snapshot cache for Paradex."""
+
+import asyncio
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+@dataclass
+class SnapshotCacheStats:
+    """Counters for order book snapshot requests."""
+
+    requests: int = 0
+    live_book_hits: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    rest_fetches: int = 0
+    staleness_ns_last: int = 0
+    staleness_ns_max: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of requests served without a REST call of their own."""
+        if self.requests == 0:
+            return 0.0
+        return (self.requests - self.rest_fetches) / self.requests
+
+    def record_staleness(self, staleness_ns: int) -> None:
+        self.staleness_ns_last = staleness_ns
+        self.staleness_ns_max = max(self.staleness_ns_max, staleness_ns)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "live_book_hits": self.live_book_hits,
+            "cache_hits": self.cache_hits,
+            "coalesced": self.coalesced,
+            "rest_fetches": self.rest_fetches,
+            "hit_ratio": self.hit_ratio,
+            "staleness_ns_last": self.staleness_ns_last,
+            "staleness_ns_max": self.staleness_ns_max,
+        }
+
+
+class OrderBookSnapshotCache:
+    """
+    Short-TTL cache of decoded REST order book payloads.
+
+    Concurrent requests for the same instrument share a single in-flight
+    fetch, and results younger than ``ttl_ms`` are served without a REST call.
+    """
+
+    def __init__(self, clock: LiveClock, ttl_ms: int) -> None:
+        self._clock = clock
+        self._ttl_ns = ttl_ms * 1_000_000
+
+        self._snapshots: dict[InstrumentId, tuple[int, dict]] = {}
+        self._inflight: dict[InstrumentId, asyncio.Future] = {}
+        self.stats = SnapshotCacheStats()
+
+    async def get(
+        self,
+        instrument_id: InstrumentId,
+        fetch: Callable[[], Awaitable[dict]],
+    ) -> dict:
+        """Return a snapshot for ``instrument_id``, calling ``fetch`` only when required."""
+        self.stats.requests += 1
+        now = self._clock.timestamp_ns()
+
+        cached = self._snapshots.get(instrument_id)
+        if cached is not None and now - cached[0] <= self._ttl_ns:
+            self.stats.cache_hits += 1
+            self.stats.record_staleness(now - cached[0])
+            return cached[1]
+
+        inflight = self._inflight.get(instrument_id)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.stats.rest_fetches += 1
+        future = asyncio.ensure_future(fetch())
+        self._inflight[instrument_id] = future
+        try:
+            snapshot = await asyncio.shield(future)
+        finally:
+            self._inflight.pop(instrument_id, None)
+
+        self._snapshots[instrument_id] = (self._clock.timestamp_ns(), snapshot)
+        self.stats.record_staleness(0)
+        return snapshot
+
+    def record_live_book_hit(self, staleness_ns: int) -> None:
+        """Record a request served from the live local book."""
+        self.stats.requests += 1
+        self.stats.live_book_hits += 1
+        self.stats.record_staleness(staleness_ns)
@@ -0,0 +1,89 @@
+# nautilus_trader/adapters/paradex/state.py
+"""Compact records for the execution client's order and position caches."""
+
+import sys
+
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderStatus
+from nautilus_trader.model.enums import PositionSide
+
+from nautilus_trader.adapters.paradex.factories import parse_order_status
+from nautilus_trader.adapters.paradex.schemas import ParadexOrder
+from nautilus_trader.adapters.paradex.schemas import ParadexPosition
+
+# Venue strings map to shared enum members, so records hold a pointer, not a string
+_ORDER_SIDES = {"BUY": OrderSide.BUY, "SELL": OrderSide.SELL}
+_POSITION_SIDES = {"LONG": PositionSide.LONG, "SHORT": PositionSide.SHORT}
+
+
+class TrackedOrder:
+    """An open venue order as last seen by reconciliation."""
+
+    __slots__ = ("venue_order_id", "client_order_id", "symbol", "side", "status", "size", "filled_size", "ts_last")
+
+    def __init__(
+        self,
+        venue_order_id: str,
+        client_order_id: str,
+        symbol: str,
+        side: OrderSide,
+        status: OrderStatus,
+        size: str,
+        filled_size: str,
+        ts_last: int,
+    ) -> None:
+        self.venue_order_id = venue_order_id
+        self.client_order_id = client_order_id
+        self.symbol = symbol
+        self.side = side
+        self.status = status
+        self.size = size
+        self.filled_size = filled_size
+        self.ts_last = ts_last
+
+    @classmethod
+    def from_order(cls, order: ParadexOrder) -> "TrackedOrder":
+        return cls(
+            order.id,
+            order.client_id,
+            sys.intern(order.market or order.instrument_id),
+            _ORDER_SIDES.get(order.side, OrderSide.NO_ORDER_SIDE),
+            parse_order_status(order.status),
+            order.size,
+            order.filled_size,
+            order.updated_at,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"venue_order_id={self.venue_order_id}, "
+            f"symbol={self.symbol}, "
+            f"side={self.side.name}, "
+            f"status={self.status.name}, "
+            f"filled={self.filled_size}/{self.size})"
+        )
+
+
+class TrackedPosition:
+    """A venue position as last seen by reconciliation."""
+
+    __slots__ = ("symbol", "side", "size", "ts_last")
+
+    def __init__(self, symbol: str, side: PositionSide, size: str, ts_last: int) -> None:
+        self.symbol = symbol
+        self.side = side
+        self.size = size
+        self.ts_last = ts_last
+
+    @classmethod
+    def from_position(cls, position: ParadexPosition) -> "TrackedPosition":
+        return cls(
+            sys.intern(position.market or position.instrument_id),
+            _POSITION_SIDES.get(position.side, PositionSide.FLAT),
+            position.size,
+            position.updated_at,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(symbol={self.symbol}, side={self.side.name}, size={self.size})"
@@ -0,0 +1,92 @@
+# nautilus_trader/adapters/paradex/types.py
+"""Paradex-specific custom data types."""
+
+from decimal import Decimal
+
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+class ParadexOpenInterest(Data):
+    """Open interest for a Paradex market, published as custom data."""
+
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        open_interest: Decimal,
+        ts_event: int,
+        ts_init: int,
+    ) -> None:
+        self.instrument_id = instrument_id
+        self.open_interest = open_interest
+        self._ts_event = ts_event
+        self._ts_init = ts_init
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"open_interest={self.open_interest}, "
+            f"ts_event={self._ts_event})"
+        )
+
+    @property
+    def ts_event(self) -> int:
+        """UNIX timestamp (nanoseconds) when the data event occurred."""
+        return self._ts_event
+
+    @property
+    def ts_init(self) -> int:
+        """UNIX timestamp (nanoseconds) when the object was initialized."""
+        return self._ts_init
+
+
+class ParadexBookMetrics(Data):
+    """
+    Derived top-of-book metrics for a Paradex order book, published as custom data.
+
+    ``imbalance`` and ``weighted_mid`` cover the top ``depth`` levels per side.
+    """
+
+    def __init__(
+        self,
+        instrument_id: InstrumentId,
+        depth: int,
+        spread: float,
+        mid: float,
+        microprice: float,
+        imbalance: float,
+        weighted_mid: float,
+        ts_event: int,
+        ts_init: int,
+    ) -> None:
+        self.instrument_id = instrument_id
+        self.depth = depth
+        self.spread = spread
+        self.mid = mid
+        self.microprice = microprice
+        self.imbalance = imbalance
+        self.weighted_mid = weighted_mid
+        self._ts_event = ts_event
+        self._ts_init = ts_init
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}("
+            f"instrument_id={self.instrument_id}, "
+            f"spread={self.spread}, "
+            f"microprice={self.microprice}, "
+            f"imbalance={self.imbalance}, "
+            f"weighted_mid={self.weighted_mid}, "
+            f"ts_event={self._ts_event})"
+        )
+
+    @property
+    def ts_event(self) -> int:
+        """UNIX timestamp (nanoseconds) when the data event occurred."""
+        return self._ts_event
+
+    @property
+    def ts_init(self) -> int:
+        """UNIX timestamp (nanoseconds) when the object was initialized."""
+        return self._ts_init
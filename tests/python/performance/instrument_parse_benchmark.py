@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark instrument parsing over a synthetic 1,000-market payload.
+
+Usage: instrument_parse_benchmark.py [markets] [rounds]
+
+Compares ``json.loads`` plus per-market parsing with ``Price.from_str``/
+``Quantity.from_str`` on every field against typed decoding plus the bulk
+``parse_instruments``, which interns repeated increments, limits and
+currencies.
+"""
+import json
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+from nautilus_trader.adapters.paradex.constants import PARADEX
+from nautilus_trader.adapters.paradex.factories import parse_instruments
+from nautilus_trader.adapters.paradex.schemas import decode_markets
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.identifiers import Symbol
+from nautilus_trader.model.instruments import CryptoPerpetual
+from nautilus_trader.model.objects import Currency
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+FIXTURE = Path(__file__).parents[2] / "mocks" / "fixtures" / "markets.json"
+
+PRICE_TICKS = ["0.1", "0.01", "0.001", "0.0001", "0.00001"]
+SIZE_TICKS = ["0.001", "0.01", "0.1", "0.0001", "0.00001"]  # The reference parse mis-sizes integer ticks
+
+
+def make_markets(count: int) -> list[dict]:
+    """Build ``count`` markets from the fixture, cycling through common tick sizes."""
+    template = json.loads(FIXTURE.read_text())["results"][0]
+    markets = []
+    for i in range(count):
+        market = dict(template)
+        size_tick = SIZE_TICKS[i % len(SIZE_TICKS)]
+        market.update(
+            symbol=f"TOKEN{i}-USD-PERP",
+            base_currency=f"TOKEN{i}",
+            price_tick_size=PRICE_TICKS[i % len(PRICE_TICKS)],
+            quantity_tick_size=size_tick,
+            min_quantity=size_tick,
+            max_quantity="1000000",
+        )
+        markets.append(market)
+    return markets
+
+
+def parse_per_market(market_data: dict) -> CryptoPerpetual:
+    """Reference per-market parse, building every object from its string."""
+    return CryptoPerpetual(
+        instrument_id=InstrumentId(Symbol(market_data["symbol"]), PARADEX),
+        raw_symbol=Symbol(market_data["symbol"]),
+        base_currency=Currency.from_str(market_data["base_currency"], strict=False),
+        quote_currency=Currency.from_str(market_data["quote_currency"], strict=False),
+        settlement_currency=Currency.from_str(market_data["quote_currency"], strict=False),
+        is_inverse=False,
+        price_precision=len(market_data["price_tick_size"].split(".")[-1]),
+        size_precision=len(market_data["quantity_tick_size"].split(".")[-1]),
+        price_increment=Price.from_str(market_data["price_tick_size"]),
+        size_increment=Quantity.from_str(market_data["quantity_tick_size"]),
+        max_quantity=Quantity.from_str(market_data["max_quantity"]),
+        min_quantity=Quantity.from_str(market_data["min_quantity"]),
+        max_price=None,
+        min_price=None,
+        margin_init=Decimal("0.1"),
+        margin_maint=Decimal("0.05"),
+        maker_fee=Decimal("0.0002"),
+        taker_fee=Decimal("0.0005"),
+        ts_event=0,
+        ts_init=0,
+    )
+
+
+def timed(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main(count: int, rounds: int) -> None:
+    markets = make_markets(count)
+    payload = json.dumps({"results": markets})
+    per_market = timed(lambda: [parse_per_market(m) for m in json.loads(payload)["results"]], rounds)
+    bulk = timed(lambda: parse_instruments(decode_markets(payload), PARADEX), rounds)
+
+    print("=" * 70)
+    print(f"INSTRUMENT PARSING ({len(markets)} markets, {rounds} rounds)")
+    print("=" * 70)
+    print(f"per-market  {per_market * 1_000:>8.2f} ms  {per_market / len(markets) * 1e6:>7.2f} us/market")
+    print(f"bulk        {bulk * 1_000:>8.2f} ms  {bulk / len(markets) * 1e6:>7.2f} us/market")
+    print(f"speedup     {per_market / bulk:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+    )
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Report memory per tracked order for the execution client's order cache.
+
+Usage: order_state_memory.py [orders]
+
+Compares keeping each open order as the raw REST dict plus a ``VenueOrderId``
+in a set (the previous tracking) with a ``TrackedOrder`` record keyed by its
+venue order ID string. Memory is measured with tracemalloc, so allocations
+made outside the Python allocator by native identifier types are not counted.
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from nautilus_trader.adapters.paradex.schemas import decode_orders
+from nautilus_trader.adapters.paradex.state import TrackedOrder
+from nautilus_trader.model.identifiers import VenueOrderId
+
+MARKETS = [f"TOKEN{i}-USD-PERP" for i in range(50)]
+
+
+def make_payload(count: int) -> str:
+    return json.dumps({
+        "results": [
+            {
+                "id": f"{1_700_000_000_000_000 + i}",
+                "client_id": f"O-20260101-000000-001-001-{i}",
+                "market": MARKETS[i % len(MARKETS)],
+                "side": "BUY" if i % 2 else "SELL",
+                "type": "LIMIT",
+                "status": "OPEN",
+                "size": f"{(i % 500 + 1) / 1000:.3f}",
+                "price": f"{64000 + (i % 2000) / 10:.1f}",
+                "filled_size": "0",
+                "created_at": 1_700_000_000_000 + i,
+                "updated_at": 1_700_000_000_000 + i,
+            }
+            for i in range(count)
+        ],
+    })
+
+
+def track_dicts(payload: str) -> tuple:
+    orders = {order["id"]: order for order in json.loads(payload)["results"]}
+    emitted = {VenueOrderId(order_id) for order_id in orders}
+    return orders, emitted
+
+
+def track_records(payload: str) -> dict:
+    return {order.id: TrackedOrder.from_order(order) for order in decode_orders(payload)}
+
+
+def bytes_per_order(track, payload: str, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    state = track(payload)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del state
+    return retained / count
+
+
+def main(count: int) -> None:
+    payload = make_payload(count)
+    before = bytes_per_order(track_dicts, payload, count)
+    after = bytes_per_order(track_records, payload, count)
+
+    print("=" * 70)
+    print(f"ORDER STATE MEMORY ({count} orders)")
+    print("=" * 70)
+    print(f"dict + VenueOrderId  {before:>8.0f} bytes/order")
+    print(f"TrackedOrder         {after:>8.0f} bytes/order")
+    print(f"reduction            {1 - after / before:>8.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded WebSocket feed through ParadexDataClient and report throughput.
+
+Usage: replay_throughput.py <recording_dir> [speed ...]
+
+speed is 1 for real time, N for N times faster and 0 for as fast as
+possible (default). Record a feed first with
+ParadexDataClientConfig(ws_record_path=...).
+"""
+import asyncio
+import sys
+import time
+
+import paradex_adapter
+
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+from nautilus_trader.adapters.paradex.data import ParadexDataClient
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import Logger
+from nautilus_trader.test_kit.stubs.component import TestComponentStubs
+
+DRAIN_TIMEOUT_SECS = 30.0
+
+
+async def _drained(client: ParadexDataClient, ws) -> None:
+    while client.ws_dispatch_metrics()["frames"] < ws.replay_stats()["frames"]:
+        await asyncio.sleep(0.001)
+
+
+async def replay(directory: str, speed: float) -> dict:
+    ws = paradex_adapter.PyReplayWebSocketClient(directory, speed)
+    client = ParadexDataClient(
+        http_client=None,
+        ws_client=ws,
+        instrument_provider=None,
+        cache=TestComponentStubs.cache(),
+        clock=LiveClock(),
+        logger=Logger("ReplayThroughput"),
+        msgbus=TestComponentStubs.msgbus(),
+        # Every frame must be dispatched for the counts below to converge
+        config=ParadexDataClientConfig(
+            ws_reconnect=False,
+            ws_overflow_policies={
+                prefix: "block" for prefix in ParadexDataClientConfig().ws_overflow_policies
+            },
+        ),
+    )
+
+    wall_start = time.perf_counter()
+    await client._connect()
+    await client._ws_task
+
+    # Wait for the event loop to drain the tail of the queue
+    try:
+        await asyncio.wait_for(_drained(client, ws), timeout=DRAIN_TIMEOUT_SECS)
+    except asyncio.TimeoutError:
+        print(f"Warning: queue not drained after {DRAIN_TIMEOUT_SECS:g}s, frames unaccounted for")
+    wall_secs = time.perf_counter() - wall_start
+
+    replayed = ws.replay_stats()
+    dispatch = client.ws_dispatch_metrics()
+    return {
+        "speed": speed,
+        "frames": dispatch["frames"],
+        "msgs_per_sec": dispatch["frames"] / wall_secs if wall_secs else 0.0,
+        "cpu_us_per_msg": dispatch["cpu_ns_per_frame"] / 1_000,
+        "max_lag_ms": replayed["max_lag_ns"] / 1_000_000,
+        "bytes": replayed["bytes"],
+    }
+
+
+async def main(directory: str, speeds: list[float]) -> None:
+    print("=" * 70)
+    print("REPLAY THROUGHPUT")
+    print("=" * 70)
+    for speed in speeds:
+        result = await replay(directory, speed)
+        label = "max" if speed <= 0 else f"{speed:g}x"
+        print(
+            f"{label:>6}  {result['frames']:>9} frames  "
+            f"{result['msgs_per_sec']:>10.0f} msg/s  "
+            f"{result['cpu_us_per_msg']:>7.2f} us/msg CPU  "
+            f"lag max {result['max_lag_ms']:.1f} ms",
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    asyncio.run(main(sys.argv[1], [float(s) for s in sys.argv[2:]] or [0.0]))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark fill report parsing over synthetic REST fills.
+
+Usage: report_parse_benchmark.py [fills]
+
+Compares the string-based construction (``Price.from_str``,
+``Quantity.from_str``, ``Money.from_str``) with ``parse_fill_report``, which
+builds prices, sizes and commissions from raw fixed-point values at the
+instrument's precision.
+"""
+import json
+import sys
+import time
+
+from nautilus_trader.adapters.paradex.constants import PARADEX
+from nautilus_trader.adapters.paradex.factories import parse_fill_report
+from nautilus_trader.adapters.paradex.factories import parse_instruments
+from nautilus_trader.adapters.paradex.schemas import ParadexMarket
+from nautilus_trader.adapters.paradex.schemas import decode_fills
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.core.datetime import millis_to_nanos
+from nautilus_trader.execution.reports import FillReport
+from nautilus_trader.model.enums import LiquiditySide
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.model.identifiers import VenueOrderId
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+INSTRUMENT = parse_instruments(
+    [
+        ParadexMarket(
+            symbol="BTC-USD-PERP",
+            base_currency="BTC",
+            quote_currency="USD",
+            price_tick_size="0.1",
+            quantity_tick_size="0.001",
+            min_quantity="0.001",
+            max_quantity="1000",
+        ),
+    ],
+    PARADEX,
+)[0]
+ACCOUNT_ID = AccountId("PARADEX-001")
+
+
+def make_fills(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"f-{i}",
+            "trade_id": f"t-{i}",
+            "market": "BTC-USD-PERP",
+            "order_id": f"o-{i // 4}",
+            "side": "BUY" if i % 2 else "SELL",
+            "size": f"{(i % 500 + 1) / 1000:.3f}",
+            "price": f"{64000 + (i % 2000) / 10:.1f}",
+            "fee": f"{(i % 97) / 100:.2f}",
+            "fee_currency": "USDC",
+            "liquidity": "MAKER" if i % 3 else "TAKER",
+            "created_at": 1_700_000_000_000 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def parse_fill_report_from_str(fill_data: dict, instrument, account_id: AccountId, clock) -> FillReport:
+    """Reference parse, building every value from its string."""
+    return FillReport(
+        account_id=account_id,
+        instrument_id=instrument.id,
+        venue_order_id=VenueOrderId(fill_data["order_id"]),
+        trade_id=TradeId(fill_data["id"]),
+        order_side=OrderSide.BUY if fill_data["side"] == "BUY" else OrderSide.SELL,
+        last_qty=Quantity.from_str(fill_data["size"]),
+        last_px=Price.from_str(fill_data["price"]),
+        commission=Money.from_str(f"{fill_data['fee']} {fill_data['fee_currency']}"),
+        liquidity_side=LiquiditySide.MAKER if fill_data["liquidity"] == "MAKER" else LiquiditySide.TAKER,
+        ts_event=millis_to_nanos(fill_data["created_at"]),
+        report_id=fill_data["id"],
+        ts_init=clock.timestamp_ns(),
+    )
+
+
+def timed(parse, fills: list, clock: LiveClock) -> float:
+    start = time.perf_counter()
+    for fill_data in fills:
+        parse(fill_data, INSTRUMENT, ACCOUNT_ID, clock)
+    return len(fills) / (time.perf_counter() - start)
+
+
+def main(count: int) -> None:
+    fills = make_fills(count)
+    clock = LiveClock()
+    before = timed(parse_fill_report_from_str, fills, clock)
+    after = timed(parse_fill_report, decode_fills(json.dumps({"results": fills})), clock)
+
+    print("=" * 70)
+    print(f"FILL REPORT PARSING ({count} fills)")
+    print("=" * 70)
+    print(f"from_str     {before:>12,.0f} reports/s")
+    print(f"fixed-point  {after:>12,.0f} reports/s")
+    print(f"speedup      {after / before:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark REST payload decoding: ``json.loads`` dicts against typed structs.
+
+Usage: rest_decode_benchmark.py [fills] [rounds]
+
+Reports decode throughput and the memory retained per decoded record for a
+synthetic ``/v1/fills`` response.
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from nautilus_trader.adapters.paradex.schemas import ParadexFill
+from nautilus_trader.adapters.paradex.schemas import convert_row
+from nautilus_trader.adapters.paradex.schemas import decode_fills
+from nautilus_trader.adapters.paradex.schemas import page_rows
+
+
+def make_payload(count: int) -> str:
+    return json.dumps({
+        "results": [
+            {
+                "id": f"f-{i}",
+                "trade_id": f"t-{i}",
+                "order_id": f"o-{i // 4}",
+                "market": "BTC-USD-PERP",
+                "side": "BUY" if i % 2 else "SELL",
+                "size": f"{(i % 500 + 1) / 1000:.3f}",
+                "price": f"{64000 + (i % 2000) / 10:.1f}",
+                "fee": f"{(i % 97) / 100:.2f}",
+                "fee_currency": "USDC",
+                "liquidity": "MAKER" if i % 3 else "TAKER",
+                "created_at": 1_700_000_000_000 + i,
+            }
+            for i in range(count)
+        ],
+    })
+
+
+def decode_dicts(payload: str) -> list[dict]:
+    return json.loads(payload)["results"]
+
+
+def decode_rows(payload: str) -> list[ParadexFill]:
+    # As reconciliation does: split the page, then validate each row on its own
+    return [convert_row(row, ParadexFill) for row in page_rows(payload)]
+
+
+def throughput(decode, payload: str, count: int, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        decode(payload)
+    return count * rounds / (time.perf_counter() - start)
+
+
+def bytes_per_record(decode, payload: str, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    records = decode(payload)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return retained / count
+
+
+def main(count: int, rounds: int) -> None:
+    payload = make_payload(count)
+
+    print("=" * 70)
+    print(f"REST DECODE ({count} fills, {len(payload) / 1e6:.1f} MB)")
+    print("=" * 70)
+    for label, decode in (
+        ("json dicts", decode_dicts),
+        ("msgspec", decode_fills),
+        ("msgspec row", decode_rows),
+    ):
+        rate = throughput(decode, payload, count, rounds)
+        size = bytes_per_record(decode, payload, count)
+        print(f"{label:<11} {rate:>12,.0f} records/s  {size:>7.0f} bytes/record")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+    )
@@ -0,0 +1,95 @@
+"""Unit tests for incrementally maintained Paradex order book metrics."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from nautilus_trader.adapters.paradex.book_metrics import IncrementalBookMetrics
+from nautilus_trader.adapters.paradex.book_poller import BookDiffer
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+INSTRUMENT = TestInstrumentProvider.btcusdt_perp_binance()
+
+
+def _full_recompute(bids: dict, asks: dict, depth: int) -> tuple[float, float]:
+    top_bids = sorted(bids.items(), reverse=True)[:depth]
+    top_asks = sorted(asks.items())[:depth]
+    bid_qty = float(sum(s for _, s in top_bids))
+    ask_qty = float(sum(s for _, s in top_asks))
+    notional = float(sum(p * s for p, s in top_bids + top_asks))
+    return (bid_qty - ask_qty) / (bid_qty + ask_qty), notional / (bid_qty + ask_qty)
+
+
+def test_metrics_match_full_recompute_under_random_updates():
+    depth = 3
+    metrics = IncrementalBookMetrics(INSTRUMENT.id, depth)
+    books = {OrderSide.BUY: {}, OrderSide.SELL: {}}
+    rng = random.Random(7)
+
+    for _ in range(2_000):
+        side = rng.choice([OrderSide.BUY, OrderSide.SELL])
+        offset = rng.randint(1, 12)
+        price = Decimal(100 - offset) if side == OrderSide.BUY else Decimal(100 + offset)
+        size = Decimal(rng.choice([0, 0, 1, 2, 5]))
+        if size:
+            books[side][price] = size
+        else:
+            books[side].pop(price, None)
+        metrics.update(side, price, size)
+
+        result = metrics.compute(ts_event=1, ts_init=1)
+        if result is None or not books[OrderSide.BUY] or not books[OrderSide.SELL]:
+            continue
+        imbalance, weighted_mid = _full_recompute(books[OrderSide.BUY], books[OrderSide.SELL], depth)
+        assert result.imbalance == pytest.approx(imbalance)
+        assert result.weighted_mid == pytest.approx(weighted_mid)
+        assert result.spread == float(min(books[OrderSide.SELL]) - max(books[OrderSide.BUY]))
+
+
+def test_top_sums_stay_exact_under_deep_book_churn():
+    depth = 5
+    metrics = IncrementalBookMetrics(INSTRUMENT.id, depth)
+    bids: dict = {}
+    rng = random.Random(11)
+
+    for _ in range(20_000):
+        price = Decimal(rng.randint(1, 500)) / 10
+        size = Decimal(rng.choice(["0", "0.1", "0.3", "1.7"]))
+        if size:
+            bids[price] = size
+        else:
+            bids.pop(price, None)
+        metrics.update(OrderSide.BUY, price, size)
+
+    top = sorted(bids.items(), reverse=True)[:depth]
+    assert metrics._bids.top_qty == sum(s for _, s in top)
+    assert metrics._bids.top_notional == sum(p * s for p, s in top)
+
+
+def test_metrics_only_produced_when_top_levels_change():
+    metrics = IncrementalBookMetrics(INSTRUMENT.id, depth=1)
+    metrics.update(OrderSide.BUY, Decimal("99"), Decimal("1"))
+    metrics.update(OrderSide.SELL, Decimal("101"), Decimal("3"))
+
+    result = metrics.compute(ts_event=1, ts_init=1)
+    assert result.spread == 2.0
+    assert result.microprice == pytest.approx((99 * 3 + 101 * 1) / 4)
+    assert result.imbalance == pytest.approx(-0.5)
+
+    # A level below the top N leaves the metrics unchanged
+    metrics.update(OrderSide.BUY, Decimal("98"), Decimal("7"))
+    assert metrics.compute(ts_event=2, ts_init=2) is None
+
+
+def test_differ_feeds_attached_metrics():
+    differ = BookDiffer(INSTRUMENT)
+    differ.apply({"bids": [["100", "1"]], "asks": [["101", "1"]]}, ts_init=1)
+
+    # Attaching to a live book seeds the metrics from its current levels
+    differ.attach_metrics(IncrementalBookMetrics(INSTRUMENT.id, depth=5))
+    assert differ.metrics.compute(ts_event=1, ts_init=1).spread == 1.0
+
+    differ.apply({"bids": [["100.5", "2"]], "asks": [["101", "1"]]}, ts_init=2)
+    assert differ.metrics.compute(ts_event=2, ts_init=2).spread == 0.5
@@ -0,0 +1,40 @@
+"""Unit tests for Paradex order book snapshot diffing."""
+
+from decimal import Decimal
+
+from nautilus_trader.adapters.paradex.book_poller import BookDiffer
+from nautilus_trader.adapters.paradex.book_poller import diff_levels
+from nautilus_trader.model.enums import BookAction
+from nautilus_trader.model.enums import RecordFlag
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+INSTRUMENT = TestInstrumentProvider.btcusdt_perp_binance()
+
+
+def test_diff_levels_emits_only_real_changes():
+    previous = {Decimal("100"): Decimal("1"), Decimal("99"): Decimal("2"), Decimal("98"): Decimal("3")}
+    current = {Decimal("100"): Decimal("1"), Decimal("99"): Decimal("5"), Decimal("97"): Decimal("4")}
+
+    changes = diff_levels(previous, current)
+
+    assert sorted(changes) == sorted([
+        (BookAction.UPDATE, Decimal("99"), Decimal("5")),
+        (BookAction.ADD, Decimal("97"), Decimal("4")),
+        (BookAction.DELETE, Decimal("98"), Decimal("3")),
+    ])
+
+
+def test_differ_publishes_snapshot_then_deltas_only():
+    differ = BookDiffer(INSTRUMENT)
+    book = {"bids": [["100.0", "1.0"], ["99.0", "2.0"]], "asks": [["101.0", "1.0"]]}
+
+    snapshot = differ.apply(book, ts_init=1)
+    assert snapshot.deltas[0].action == BookAction.CLEAR
+
+    # Same levels formatted differently: nothing changed
+    assert differ.apply({"bids": [["100", "1"], ["99", "2"]], "asks": [["101", "1"]]}, ts_init=2) is None
+
+    deltas = differ.apply({"bids": [["100", "1"]], "asks": [{"price": "101", "size": "3"}]}, ts_init=3)
+    actions = [d.action for d in deltas.deltas]
+    assert sorted(actions) == sorted([BookAction.DELETE, BookAction.UPDATE])
+    assert deltas.deltas[-1].flags & RecordFlag.F_LAST
@@ -0,0 +1,66 @@
+"""Unit tests for the Paradex shared-memory market data fan-out."""
+
+import uuid
+
+import pytest
+
+from nautilus_trader.adapters.paradex.fanout import SharedMarketDataReader
+from nautilus_trader.adapters.paradex.fanout import SharedMarketDataWriter
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import AggressorSide
+from nautilus_trader.model.identifiers import TradeId
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+INSTRUMENT = TestInstrumentProvider.btcusdt_perp_binance()
+SYMBOL = INSTRUMENT.id.symbol.value
+
+
+@pytest.fixture
+def writer():
+    writer = SharedMarketDataWriter(f"paradex-test-{uuid.uuid4().hex[:8]}", slots=4, trade_ring=4)
+    yield writer
+    writer.close()
+
+
+def _trade(i: int) -> TradeTick:
+    return TradeTick(
+        instrument_id=INSTRUMENT.id,
+        price=INSTRUMENT.make_price(100 + i),
+        size=INSTRUMENT.make_qty(1),
+        aggressor_side=AggressorSide.BUYER,
+        trade_id=TradeId(str(i)),
+        ts_event=i,
+        ts_init=i,
+    )
+
+
+def test_reader_sees_latest_book_top(writer):
+    reader = SharedMarketDataReader(writer.name)
+    assert reader.book_top(SYMBOL) is None
+
+    writer.write_book_top(SYMBOL, (99.5, 100.5, 2.0, 3.0), 1, 2)
+    writer.write_book_top(SYMBOL, (99.0, 101.0, 1.0, 1.0), 3, 4)
+
+    top = reader.book_top(SYMBOL)
+    assert (top.bid, top.ask, top.ts_event) == (99.0, 101.0, 3)
+    assert reader.quote(SYMBOL) is None
+    assert reader.symbols() == [SYMBOL]
+    reader.close()
+
+
+def test_trade_ring_cursor_reports_lost_trades(writer):
+    reader = SharedMarketDataReader(writer.name)
+    writer.write_trade(_trade(0))
+    writer.write_trade(_trade(1))
+
+    trades, cursor, lost = reader.trades(SYMBOL)
+    assert [t.trade_id for t in trades] == ["0", "1"]
+    assert (cursor, lost) == (2, 0)
+
+    # Fall more than a ring behind: the oldest unread trades are lost
+    for i in range(2, 8):
+        writer.write_trade(_trade(i))
+    ticks, cursor, lost = reader.trade_ticks(INSTRUMENT, cursor)
+    assert [t.trade_id.value for t in ticks] == ["5", "6", "7"]
+    assert (cursor, lost) == (8, 3)
+    reader.close()
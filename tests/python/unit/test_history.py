@@ -0,0 +1,99 @@
+"""Unit tests for Paradex historical data loading helpers."""
+
+import asyncio
+import json
+
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+from nautilus_trader.adapters.paradex.history import ParadexHistoryLoader
+from nautilus_trader.adapters.paradex.history import time_slices
+from nautilus_trader.adapters.paradex.history_cache import ParadexHistoryCache
+from nautilus_trader.adapters.paradex.history_cache import contiguous_runs
+from nautilus_trader.adapters.paradex.history_cache import subtract_intervals
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.data import TestDataStubs
+
+
+def test_time_slices_cover_range_without_overlap():
+    slices = time_slices(0, 9_999, 3_000)
+
+    assert slices == [(0, 2_999), (3_000, 5_999), (6_000, 8_999), (9_000, 9_999)]
+
+
+def test_time_slices_single_slice_when_range_is_small():
+    assert time_slices(1_000, 1_500, 3_600_000) == [(1_000, 1_500)]
+
+
+def test_time_slices_empty_when_start_after_end():
+    assert time_slices(2_000, 1_000, 500) == []
+
+
+def test_subtract_intervals_returns_whole_range_when_nothing_cached():
+    assert subtract_intervals((100, 200), []) == [(100, 200)]
+
+
+def test_subtract_intervals_returns_only_gaps():
+    covered = [(100, 149), (180, 189)]
+
+    assert subtract_intervals((120, 250), covered) == [(150, 179), (190, 250)]
+
+
+def test_subtract_intervals_empty_when_fully_covered():
+    assert subtract_intervals((120, 150), [(100, 139), (140, 200)]) == []
+
+
+def test_contiguous_runs_groups_adjacent_intervals():
+    intervals = [(0, 99), (100, 199), (200, 249), (300, 399), (400, 499)]
+
+    assert contiguous_runs(intervals) == [[0, 1, 2], [3, 4]]
+
+
+def test_contiguous_runs_keeps_gaps_separate():
+    assert contiguous_runs([(0, 9), (20, 29), (40, 49)]) == [[0], [1], [2]]
+
+
+def test_compacting_a_run_that_starts_empty_keeps_data_readable(tmp_path):
+    cache = ParadexHistoryCache(str(tmp_path), max_files=1)
+    ticks = [TestDataStubs.trade_tick(ts_event=ts, ts_init=ts) for ts in (150, 250)]
+
+    cache.write("trades", "BTC", 0, 99, [], TradeTick)
+    cache.write("trades", "BTC", 100, 199, ticks[:1], TradeTick)
+    cache.write("trades", "BTC", 200, 299, ticks[1:], TradeTick)
+    cache.compact("trades", "BTC")
+
+    assert [p.name for p in (tmp_path / "trades" / "BTC").glob("*.parquet")] == ["0-299.parquet"]
+    assert [t.ts_event for t in cache.read("trades", "BTC", 0, 299, TradeTick)] == [150, 250]
+    assert cache.missing_intervals("trades", "BTC", 0, 399) == [(300, 399)]
+
+
+class FakeTradesHttp:
+    """Serves one trade per second and records the slices requested."""
+
+    def __init__(self) -> None:
+        self.requested: list[tuple[int, int]] = []
+
+    async def get_trades_page(self, symbol, start_ms, end_ms, page_size, cursor):
+        self.requested.append((start_ms, end_ms))
+        trades = [
+            {"id": str(ts), "price": "100.0", "size": "0.001", "side": "BUY", "created_at": ts}
+            for ts in range(start_ms, end_ms + 1, 1000)
+        ]
+        return json.dumps({"results": trades})
+
+
+def test_trade_tick_limit_stops_paging_older_slices():
+    http = FakeTradesHttp()
+    config = ParadexDataClientConfig(
+        history_slice_secs=10,
+        history_max_concurrent_requests=2,
+        history_requests_per_second=1000,
+    )
+    loader = ParadexHistoryLoader(http, LiveClock(), None, config)
+    instrument = TestInstrumentProvider.btcusdt_perp_binance()
+
+    ticks = asyncio.run(loader.fetch_trade_ticks(instrument, 0, 99_999_000_000, limit=15))
+
+    # Ten 10s slices, but the newest wave of two already holds 20 ticks
+    assert len(http.requested) == 2
+    assert [t.ts_event // 1_000_000_000 for t in ticks] == list(range(85, 100))
@@ -0,0 +1,89 @@
+"""Unit tests for the Paradex ingestion worker record encoding."""
+
+import json
+
+from nautilus_trader.adapters.paradex.config import ParadexDataClientConfig
+from nautilus_trader.adapters.paradex.ingest import RECORD_FRAME
+from nautilus_trader.adapters.paradex.ingest import RECORD_QUOTE
+from nautilus_trader.adapters.paradex.ingest import RECORD_TRADE
+from nautilus_trader.adapters.paradex.ingest import IngestProcessClient
+from nautilus_trader.adapters.paradex.ingest import RecordEncoder
+from nautilus_trader.adapters.paradex.ingest import decode_records
+
+
+def _frame(channel: str, data: dict) -> str:
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+def test_records_round_trip_through_a_batch():
+    encoder = RecordEncoder()
+    bbo = {
+        "market": "BTC-USD-PERP",
+        "bid": "64000.5",
+        "ask": "64001",
+        "bid_size": "0.25",
+        "ask_size": "1.5",
+        "last_updated_at": 1_700_000_000_000,
+        "seq_no": 42,
+    }
+    trade = {
+        "id": "t-1",
+        "market": "BTC-USD-PERP",
+        "side": "SELL",
+        "price": "64000",
+        "size": "0.1",
+        "created_at": 1_700_000_000_001,
+    }
+    book = {"market": "BTC-USD-PERP", "bids": [["64000", "1"]], "asks": [], "seq_no": 7}
+    encoder.add(1, _frame("bbo.BTC-USD-PERP", bbo))
+    encoder.add(2, _frame("trades.BTC-USD-PERP", trade))
+    encoder.add(3, _frame("orderbook.BTC-USD-PERP", book))
+
+    symbols: dict[int, str] = {}
+    records = decode_records(encoder.flush(), symbols)
+
+    assert records == [
+        (1, (RECORD_QUOTE, "BTC-USD-PERP", 64000.5, 64001.0, 0.25, 1.5, 1_700_000_000_000_000_000, 42)),
+        (2, (RECORD_TRADE, "BTC-USD-PERP", 64000.0, 0.1, 2, 1_700_000_000_001_000_000, "t-1")),
+        (3, (RECORD_FRAME, "orderbook.BTC-USD-PERP", book)),
+    ]
+    assert encoder.flush() is None
+
+
+def test_symbols_are_sent_once_per_worker():
+    encoder = RecordEncoder()
+    trade = {"id": 1, "market": "ETH-USD-PERP", "side": "BUY", "price": "1", "size": "1", "created_at": 0}
+    encoder.add(1, _frame("trades.ETH-USD-PERP", trade))
+    first = encoder.flush()
+    encoder.add(2, _frame("trades.ETH-USD-PERP", trade))
+    second = encoder.flush()
+
+    assert len(second) < len(first)
+    symbols: dict[int, str] = {}
+    decode_records(first, symbols)
+    assert decode_records(second, symbols)[0][1][1] == "ETH-USD-PERP"
+
+
+class FakeConnection:
+    def __init__(self, messages: list[bytes]) -> None:
+        self._messages = messages
+
+    def recv_bytes(self) -> bytes:
+        if not self._messages:
+            raise EOFError
+        return self._messages.pop(0)
+
+
+def test_batches_from_a_replaced_worker_are_discarded():
+    encoder = RecordEncoder()
+    trade = {"id": "t-1", "market": "BTC-USD-PERP", "side": "BUY", "price": "1", "size": "1", "created_at": 1}
+    encoder.add(1, _frame("trades.BTC-USD-PERP", trade))
+    batch = encoder.flush()
+    client = IngestProcessClient(None, ParadexDataClientConfig())
+    client._generation = 2
+
+    client._read_loop(FakeConnection([batch]), generation=1)
+    assert len(client._messages) == 0
+
+    client._read_loop(FakeConnection([batch]), generation=2)
+    assert len(client._messages) == 1
@@ -0,0 +1,43 @@
+"""Unit tests for bulk Paradex instrument parsing."""
+
+from nautilus_trader.adapters.paradex.factories import decimal_precision
+from nautilus_trader.adapters.paradex.factories import parse_instruments
+from nautilus_trader.adapters.paradex.schemas import ParadexMarket
+from nautilus_trader.model.identifiers import Venue
+
+
+def _market(symbol: str, price_tick: str, size_tick: str) -> ParadexMarket:
+    return ParadexMarket(
+        symbol=symbol,
+        base_currency=symbol.split("-")[0],
+        quote_currency="USD",
+        price_tick_size=price_tick,
+        quantity_tick_size=size_tick,
+        min_quantity=size_tick,
+        max_quantity="1000000",
+    )
+
+
+def test_decimal_precision_handles_integers_and_exponents():
+    assert decimal_precision("0.01") == 2
+    assert decimal_precision("0.10") == 2
+    assert decimal_precision("1") == 0
+    assert decimal_precision("5e-05") == 5
+    assert decimal_precision("1E+1") == 0
+
+
+def test_parse_instruments_shares_increment_objects():
+    btc, eth, pepe = parse_instruments(
+        [
+            _market("BTC-USD-PERP", "0.1", "0.001"),
+            _market("ETH-USD-PERP", "0.1", "0.001"),
+            _market("PEPE-USD-PERP", "5e-09", "1"),
+        ],
+        Venue("PARADEX"),
+    )
+
+    assert btc.price_increment is eth.price_increment
+    assert btc.size_increment is eth.size_increment
+    assert btc.quote_currency is pepe.quote_currency
+    assert (pepe.price_precision, pepe.size_precision) == (9, 0)
+    assert str(pepe.price_increment) == "0.000000005"
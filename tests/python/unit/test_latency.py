@@ -0,0 +1,37 @@
+"""Unit tests for Paradex feed latency tracking."""
+
+from nautilus_trader.adapters.paradex.latency import LatencyHistogram
+from nautilus_trader.adapters.paradex.latency import LatencyTracker
+
+
+def test_histogram_percentiles_within_one_bucket():
+    histogram = LatencyHistogram()
+    for value_us in range(1, 1001):
+        histogram.record(value_us * 1_000)
+
+    p50 = histogram.percentile(0.5)
+    assert 500_000 <= p50 <= 1_000_000
+    assert histogram.percentile(1.0) >= 1_000_000
+    assert histogram.count == 1000
+
+
+def test_probe_skew_corrects_venue_latency():
+    tracker = LatencyTracker()
+    # Venue clock runs 50ms ahead; 10ms round trip
+    tracker.record_time_probe(local_send_ns=1_000_000_000, venue_ns=1_055_000_000, local_recv_ns=1_010_000_000)
+    assert tracker.clock_skew_ns == 50_000_000
+
+    # Event stamped by the venue, received 5ms later in true time, dispatched 1ms after
+    tracker.record("markets_summary.BTC-USD-PERP", ts_event=2_050_000_000, ts_recv=2_005_000_000, ts_dispatch=2_006_000_000)
+
+    channel = tracker.to_dict()["channels"]["markets_summary"]
+    assert channel["venue_to_receive"]["min_ns"] == 5_000_000
+    assert channel["receive_to_dispatch"]["min_ns"] == 1_000_000
+
+
+def test_skew_falls_back_to_min_one_way_delay():
+    tracker = LatencyTracker()
+    tracker.record("trades.BTC-USD-PERP", ts_event=100, ts_recv=90, ts_dispatch=95)
+
+    assert tracker.clock_skew_ns == 10
+    assert tracker.to_dict()["clock_skew_source"] == "min_one_way"
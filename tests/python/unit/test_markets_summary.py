@@ -0,0 +1,62 @@
+"""Unit tests for the Paradex markets summary demultiplexer."""
+
+from decimal import Decimal
+
+from nautilus_trader.adapters.paradex.markets_summary import MARKETS_SUMMARY_ALL
+from nautilus_trader.adapters.paradex.markets_summary import MarketsSummaryDemultiplexer
+from nautilus_trader.adapters.paradex.markets_summary import SummaryKind
+from nautilus_trader.model.data import MarkPriceUpdate
+from nautilus_trader.model.identifiers import InstrumentId
+
+BTC = InstrumentId.from_str("BTC-USD-PERP.PARADEX")
+ETH = InstrumentId.from_str("ETH-USD-PERP.PARADEX")
+
+SUMMARY = {
+    "symbol": "BTC-USD-PERP",
+    "mark_price": "95000.5",
+    "underlying_price": "95001.0",
+    "funding_rate": "0.0001",
+    "open_interest": "1234.5",
+    "created_at": 1700000000000,
+}
+
+
+def test_second_kind_on_same_symbol_needs_no_new_channel():
+    demux = MarketsSummaryDemultiplexer(all_threshold=20)
+
+    assert demux.subscribe(SummaryKind.MARK_PRICE, BTC) == (["markets_summary.BTC-USD-PERP"], [])
+    assert demux.subscribe(SummaryKind.FUNDING_RATE, BTC) == ([], [])
+
+
+def test_handle_produces_only_subscribed_kinds():
+    demux = MarketsSummaryDemultiplexer(all_threshold=20)
+    demux.subscribe(SummaryKind.MARK_PRICE, BTC)
+
+    data = demux.handle(SUMMARY, ts_init=1)
+
+    assert len(data) == 1
+    assert isinstance(data[0], MarkPriceUpdate)
+    assert demux.handle({**SUMMARY, "symbol": "ETH-USD-PERP"}, ts_init=1) == []
+
+
+def test_switches_to_all_channel_at_threshold():
+    demux = MarketsSummaryDemultiplexer(all_threshold=2)
+    demux.subscribe(SummaryKind.MARK_PRICE, BTC)
+
+    to_subscribe, to_unsubscribe = demux.subscribe(SummaryKind.MARK_PRICE, ETH)
+
+    assert to_subscribe == [MARKETS_SUMMARY_ALL]
+    assert to_unsubscribe == ["markets_summary.BTC-USD-PERP"]
+    assert demux.channels == {MARKETS_SUMMARY_ALL}
+
+
+def test_last_serves_kind_not_subscribed_when_frame_arrived():
+    demux = MarketsSummaryDemultiplexer(all_threshold=20)
+    demux.subscribe(SummaryKind.MARK_PRICE, BTC)
+    demux.handle(SUMMARY, ts_init=7)
+
+    data = demux.last(SummaryKind.FUNDING_RATE, BTC)
+
+    assert data.rate == Decimal("0.0001")
+    assert data.ts_init == 7
+    assert demux.last(SummaryKind.MARK_PRICE, ETH) is None
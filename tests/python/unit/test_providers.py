@@ -0,0 +1,180 @@
+"""Unit tests for the Paradex instrument provider."""
+
+import asyncio
+import json
+
+from nautilus_trader.adapters.paradex import providers
+from nautilus_trader.adapters.paradex.config import ParadexInstrumentProviderConfig
+from nautilus_trader.adapters.paradex.providers import ParadexInstrumentProvider
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+def _id(symbol: str) -> InstrumentId:
+    return InstrumentId.from_str(f"{symbol}.PARADEX")
+
+
+class FakeInstrument:
+    def __init__(self, symbol: str) -> None:
+        self.id = _id(symbol)
+        self.price_precision = 2
+        self.size_precision = 3
+
+
+def _market(symbol: str, **fields) -> dict:
+    return {
+        "symbol": symbol,
+        "base_currency": symbol.split("-")[0],
+        "quote_currency": "USD",
+        "price_tick_size": "0.1",
+        "quantity_tick_size": "0.001",
+        "min_quantity": "0.001",
+        "max_quantity": "1000",
+        **fields,
+    }
+
+
+class FakeHttp:
+    def __init__(self, markets: list) -> None:
+        self.markets = [m if isinstance(m, dict) else _market(m) for m in markets]
+        self.payload = json.dumps({"results": self.markets})
+        self.calls = 0
+
+    async def get_markets(self) -> str:
+        self.calls += 1
+        return self.payload
+
+    async def get_market(self, symbol: str) -> str:
+        return json.dumps({"results": [m for m in self.markets if m["symbol"] == symbol]})
+
+
+class FakeLogger:
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        pass
+
+    def error(self, msg: str) -> None:
+        pass
+
+
+def _parse_counting(parsed: list[str]):
+    def parse(markets: list[dict], venue) -> list[FakeInstrument]:
+        parsed.extend(market_data.symbol for market_data in markets)
+        return [FakeInstrument(market_data.symbol) for market_data in markets]
+    return parse
+
+
+def test_warm_start_loads_snapshot_and_skips_reparse_when_unchanged(tmp_path, monkeypatch):
+    parsed: list[str] = []
+    monkeypatch.setattr(providers, "parse_instruments", _parse_counting(parsed))
+    config = ParadexInstrumentProviderConfig(snapshot_path=str(tmp_path / "instruments.pkl"))
+
+    async def run() -> None:
+        cold = ParadexInstrumentProvider(FakeHttp(["BTC-USD-PERP", "ETH-USD-PERP"]), None, FakeLogger(), config)
+        await cold.initialize()
+        assert parsed == ["BTC-USD-PERP", "ETH-USD-PERP"]
+
+        http = FakeHttp(["BTC-USD-PERP", "ETH-USD-PERP"])
+        warm = ParadexInstrumentProvider(http, None, FakeLogger(), config)
+        await warm.initialize()
+        assert warm.find_instrument(_id("ETH-USD-PERP")) is not None
+
+        # Revalidation fetched the same payload, so nothing was parsed again
+        await warm._revalidate_task
+        assert http.calls == 1
+        assert len(parsed) == 2
+
+    asyncio.run(run())
+
+
+def test_revalidation_reloads_changed_markets(tmp_path, monkeypatch):
+    parsed: list[str] = []
+    monkeypatch.setattr(providers, "parse_instruments", _parse_counting(parsed))
+    config = ParadexInstrumentProviderConfig(snapshot_path=str(tmp_path / "instruments.pkl"))
+
+    async def run() -> None:
+        await ParadexInstrumentProvider(FakeHttp(["BTC-USD-PERP"]), None, FakeLogger(), config).initialize()
+
+        warm = ParadexInstrumentProvider(FakeHttp(["BTC-USD-PERP", "SOL-USD-PERP"]), None, FakeLogger(), config)
+        await warm.initialize()
+        assert warm.find_instrument(_id("SOL-USD-PERP")) is None
+
+        await warm._revalidate_task
+        assert warm.find_instrument(_id("SOL-USD-PERP")) is not None
+
+    asyncio.run(run())
+
+
+def test_filters_select_markets_and_others_load_on_demand(monkeypatch):
+    parsed: list[str] = []
+    monkeypatch.setattr(providers, "parse_instruments", _parse_counting(parsed))
+    http = FakeHttp([
+        _market("BTC-USD-PERP", asset_kind="PERP"),
+        _market("ETH-USD-PERP", asset_kind="PERP"),
+        _market("BTC-USD-90000-C", asset_kind="PERP_OPTION"),
+        _market("SOL-USD-PERP", asset_kind="PERP"),
+    ])
+    config = ParadexInstrumentProviderConfig(
+        load_ids=["SOL-USD-PERP.PARADEX"],
+        symbol_globs=["BTC-*"],
+        asset_kinds=["PERP"],
+    )
+
+    async def run() -> None:
+        provider = ParadexInstrumentProvider(http, None, FakeLogger(), config)
+        await provider.initialize()
+        assert parsed == ["BTC-USD-PERP", "SOL-USD-PERP"]
+
+        assert await provider.load_async(_id("ETH-USD-PERP")) is not None
+        assert await provider.load_async(_id("DOGE-USD-PERP")) is None
+        assert parsed[-1] == "ETH-USD-PERP"
+
+    asyncio.run(run())
+
+
+def test_refresh_reparses_only_changed_markets(monkeypatch):
+    parsed: list[str] = []
+    monkeypatch.setattr(providers, "parse_instruments", _parse_counting(parsed))
+    http = FakeHttp([_market("BTC-USD-PERP"), _market("ETH-USD-PERP", price_tick_size="0.01")])
+    config = ParadexInstrumentProviderConfig(refresh_interval_secs=1)
+
+    async def run() -> None:
+        provider = ParadexInstrumentProvider(http, None, FakeLogger(), config)
+        await provider.initialize()
+        assert await provider._load_markets() == []
+
+        http.markets[1] = _market("ETH-USD-PERP", price_tick_size="0.05")
+        http.markets.append(_market("SOL-USD-PERP"))
+        http.payload = json.dumps({"results": http.markets})
+        changed = await provider._load_markets()
+        assert [i.id for i in changed] == [_id("ETH-USD-PERP"), _id("SOL-USD-PERP")]
+        assert parsed == ["BTC-USD-PERP", "ETH-USD-PERP", "ETH-USD-PERP", "SOL-USD-PERP"]
+
+        # Reordering keys alone does not change a market's fingerprint
+        http.markets[0] = dict(reversed(_market("BTC-USD-PERP").items()))
+        http.payload = json.dumps({"results": http.markets})
+        assert await provider._load_markets() == []
+
+    asyncio.run(run())
+
+
+def test_resolve_maps_raw_symbols_to_loaded_entries(monkeypatch):
+    monkeypatch.setattr(providers, "parse_instruments", _parse_counting([]))
+    config = ParadexInstrumentProviderConfig(load_ids=["BTC-USD-PERP.PARADEX"])
+
+    async def run() -> None:
+        provider = ParadexInstrumentProvider(FakeHttp(["BTC-USD-PERP", "ETH-USD-PERP"]), None, FakeLogger(), config)
+        await provider.initialize()
+
+        entry = provider.resolve("BTC-USD-PERP")
+        assert entry.instrument_id == _id("BTC-USD-PERP")
+        assert (entry.price_precision, entry.size_precision) == (2, 3)
+        assert provider.resolve("BTC-USD-PERP.PARADEX") is entry
+
+        # A miss starts an on-demand fetch, so the next lookup resolves
+        assert provider.resolve("ETH-USD-PERP") is None
+        await asyncio.sleep(0)
+        assert provider.resolve("ETH-USD-PERP").instrument.id == _id("ETH-USD-PERP")
+
+    asyncio.run(run())
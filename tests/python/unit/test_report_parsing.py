@@ -0,0 +1,149 @@
+"""Unit tests for the Paradex report factories' fixed-point fast path."""
+
+import json
+
+import msgspec
+
+from nautilus_trader.adapters.paradex.factories import parse_fill_report
+from nautilus_trader.adapters.paradex.factories import parse_fill_reports
+from nautilus_trader.adapters.paradex.factories import parse_instruments
+from nautilus_trader.adapters.paradex.factories import parse_order_status_reports
+from nautilus_trader.adapters.paradex.factories import parse_position_status_reports
+from nautilus_trader.adapters.paradex.schemas import ParadexFill
+from nautilus_trader.adapters.paradex.schemas import ParadexMarket
+from nautilus_trader.adapters.paradex.schemas import page_rows
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.model.identifiers import Venue
+from nautilus_trader.model.objects import Money
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+INSTRUMENT = parse_instruments(
+    [
+        ParadexMarket(
+            symbol="BTC-USD-PERP",
+            base_currency="BTC",
+            quote_currency="USD",
+            price_tick_size="0.1",
+            quantity_tick_size="0.001",
+            min_quantity="0.001",
+            max_quantity="1000",
+        ),
+    ],
+    Venue("PARADEX"),
+)[0]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def timestamp_ns(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+class FakeEntry:
+    def __init__(self, instrument) -> None:
+        self.instrument = instrument
+
+
+def _fill(price: str, size: str, fee: str, market: str = "BTC-USD-PERP") -> ParadexFill:
+    return ParadexFill(
+        id="f-1",
+        trade_id="t-1",
+        order_id="o-1",
+        side="BUY",
+        size=size,
+        price=price,
+        fee=fee,
+        fee_currency="USDC",
+        liquidity="TAKER",
+        created_at=1_700_000_000_000,
+        market=market,
+    )
+
+
+def test_fill_report_matches_string_parsing():
+    report = parse_fill_report(_fill("64000.5", "0.250", "-1.25"), INSTRUMENT, AccountId("PARADEX-001"), FakeClock())
+
+    assert report.last_px == Price.from_str("64000.5")
+    assert report.last_px.precision == INSTRUMENT.price_precision
+    assert report.last_qty == Quantity.from_str("0.250")
+    assert report.commission == Money.from_str("-1.25 USDC")
+
+
+def test_fill_report_falls_back_for_exponents_and_excess_decimals():
+    report = parse_fill_report(_fill("64000.55", "1e-3", "0.0000001"), INSTRUMENT, AccountId("PARADEX-001"), FakeClock())
+
+    assert report.last_px.precision == INSTRUMENT.price_precision
+    assert report.last_qty == Quantity.from_str("0.001")
+
+
+def test_batch_collects_failed_rows_and_shares_ts_init():
+    bad_price = _fill("not-a-price", "1", "0")
+    unknown = _fill("1", "1", "0", market="DOGE-USD-PERP")
+    results = [_fill("64000.5", "1", "0"), bad_price, unknown, _fill("64001", "2", "0")]
+    entries = {"BTC-USD-PERP": FakeEntry(INSTRUMENT)}
+    clock = FakeClock()
+
+    reports, errors = parse_fill_reports(results, entries.get, AccountId("PARADEX-001"), clock)
+
+    assert [r.last_qty for r in reports] == [Quantity.from_str("1.000"), Quantity.from_str("2.000")]
+    assert {r.ts_init for r in reports} == {1}
+    assert clock.calls == 1
+    assert [e.row for e in errors] == [bad_price, unknown]
+
+
+def test_malformed_row_fails_alone_and_on_row_skips():
+    good = msgspec.to_builtins(_fill("64000.5", "1", "0"))
+    missing_fee = {k: v for k, v in good.items() if k != "fee"}
+    seen = {**good, "trade_id": "t-seen"}
+    rows = page_rows(json.dumps({"results": [good, missing_fee, seen]}))
+    entries = {"BTC-USD-PERP": FakeEntry(INSTRUMENT)}
+
+    reports, errors = parse_fill_reports(
+        rows,
+        entries.get,
+        AccountId("PARADEX-001"),
+        FakeClock(),
+        on_row=lambda fill: fill.trade_id != "t-seen",
+    )
+
+    assert [r.last_qty for r in reports] == [Quantity.from_str("1.000")]
+    assert len(errors) == 1
+    assert isinstance(errors[0].error, msgspec.ValidationError)
+
+
+def test_order_and_position_batches_build_reports():
+    entries = {"BTC-USD-PERP": FakeEntry(INSTRUMENT)}
+    order = {
+        "id": "o-1",
+        "market": "BTC-USD-PERP",
+        "side": "BUY",
+        "type": "LIMIT",
+        "status": "OPEN",
+        "size": "0.5",
+        "price": "64000",
+        "created_at": 1,
+        "updated_at": 2,
+    }
+    position = {"id": "p-1", "market": "BTC-USD-PERP", "side": "LONG", "size": "2", "updated_at": 5}
+
+    orders, order_errors = parse_order_status_reports(
+        page_rows(json.dumps({"results": [order]})),
+        entries.get,
+        AccountId("PARADEX-001"),
+        FakeClock(),
+    )
+    positions, position_errors = parse_position_status_reports(
+        page_rows(json.dumps({"results": [position]})),
+        entries.get,
+        AccountId("PARADEX-001"),
+        FakeClock(),
+    )
+
+    assert order_errors == position_errors == []
+    assert orders[0].venue_order_id.value == "o-1"
+    assert orders[0].quantity == Quantity.from_str("0.500")
+    assert positions[0].quantity == Quantity.from_str("2.000")
@@ -0,0 +1,69 @@
+"""Unit tests for typed Paradex REST payload decoding."""
+
+import json
+
+import msgspec
+import pytest
+
+from nautilus_trader.adapters.paradex.schemas import ParadexPosition
+from nautilus_trader.adapters.paradex.schemas import convert_row
+from nautilus_trader.adapters.paradex.schemas import decode_account
+from nautilus_trader.adapters.paradex.schemas import decode_fills
+from nautilus_trader.adapters.paradex.schemas import decode_orders
+from nautilus_trader.adapters.paradex.schemas import decode_positions
+from nautilus_trader.adapters.paradex.schemas import page_rows
+
+
+def _page(*rows: dict) -> str:
+    return json.dumps({"results": list(rows)})
+
+
+def test_orders_decode_with_defaults_and_ignore_unknown_fields():
+    payload = _page({
+        "id": "o-1",
+        "market": "BTC-USD-PERP",
+        "side": "BUY",
+        "type": "LIMIT",
+        "status": "OPEN",
+        "size": "0.5",
+        "price": "64000",
+        "created_at": 1,
+        "updated_at": 2,
+        "flags": ["REDUCE_ONLY"],
+    })
+
+    (order,) = decode_orders(payload)
+
+    assert (order.market, order.price, order.filled_size, order.client_id) == ("BTC-USD-PERP", "64000", "0", "")
+    assert not hasattr(order, "__dict__")
+
+
+def test_missing_required_field_fails_validation():
+    fill = {"id": "f-1", "trade_id": "t-1", "order_id": "o-1", "side": "BUY", "size": "1", "price": "1"}
+
+    with pytest.raises(msgspec.ValidationError, match="fee"):
+        decode_fills(_page(fill))
+
+
+def test_empty_page_and_account():
+    assert decode_orders("{}") == []
+    account = decode_account(json.dumps({"account": "0xabc", "account_value": "100.5", "status": "ACTIVE"}))
+    assert (account.account, account.account_value, account.free_collateral) == ("0xabc", "100.5", None)
+
+
+def test_native_client_objects_convert_without_json():
+    row = {"id": "p-1", "market": "ETH-USD-PERP", "side": "LONG", "size": "2", "updated_at": 5}
+
+    assert decode_positions({"results": [row]}) == decode_positions(_page(row))
+
+
+def test_page_rows_defer_validation_to_each_row():
+    row = {"id": "p-1", "market": "ETH-USD-PERP", "side": "LONG", "size": "2", "updated_at": 5}
+    bad = {"id": "p-2", "side": "LONG"}
+
+    good_raw, bad_raw = page_rows(_page(row, bad))
+
+    assert convert_row(good_raw, ParadexPosition) == convert_row(row, ParadexPosition)
+    with pytest.raises(msgspec.ValidationError):
+        convert_row(bad_raw, ParadexPosition)
+    assert page_rows({"results": [row]}) == [row]
@@ -0,0 +1,65 @@
+"""Unit tests for Paradex sequence gap detection."""
+
+import asyncio
+
+from nautilus_trader.adapters.paradex.sequence import SequenceGapMonitor
+from nautilus_trader.adapters.paradex.sequence import SequenceStatus
+from nautilus_trader.adapters.paradex.sequence import SequenceTracker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now_ns = 0
+
+    def timestamp_ns(self) -> int:
+        return self.now_ns
+
+
+class FakeLogger:
+    def info(self, msg: str) -> None:
+        pass
+
+    def warning(self, msg: str) -> None:
+        pass
+
+    def error(self, msg: str) -> None:
+        pass
+
+
+def test_tracker_classifies_gaps_and_stale_messages():
+    tracker = SequenceTracker()
+
+    assert tracker.observe("orderbook.BTC-USD-PERP", 10) == SequenceStatus.OK
+    assert tracker.observe("orderbook.BTC-USD-PERP", 11) == SequenceStatus.OK
+    assert tracker.observe("orderbook.BTC-USD-PERP", 14) == SequenceStatus.GAP
+    assert tracker.observe("orderbook.BTC-USD-PERP", 12) == SequenceStatus.STALE
+
+    stats = tracker.stats["orderbook.BTC-USD-PERP"]
+    assert (stats.gaps, stats.missed, stats.stale) == (1, 2, 1)
+
+
+async def test_gap_runs_recovery_once_and_resets_baseline():
+    clock = FakeClock()
+    monitor = SequenceGapMonitor(clock, FakeLogger())
+    calls = []
+
+    async def resync(channel):
+        calls.append(channel)
+        await asyncio.sleep(0)
+        clock.now_ns += 5_000_000
+        return 100
+
+    monitor.register("orderbook", resync)
+    channel = "orderbook.BTC-USD-PERP"
+    monitor.on_message(channel, 1)
+    monitor.on_message(channel, 5)
+    monitor.on_message(channel, 9)  # Second gap while recovering does not start another
+    await asyncio.sleep(0.01)
+
+    assert calls == [channel]
+    assert monitor.on_message(channel, 100) is False  # Covered by the snapshot
+    assert monitor.on_message(channel, 101) is True
+
+    metrics = monitor.metrics()[channel]
+    assert metrics["recoveries"] == 1
+    assert metrics["recovery_ns"]["max_ns"] == 5_000_000
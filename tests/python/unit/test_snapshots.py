@@ -0,0 +1,56 @@
+"""Unit tests for the Paradex order book snapshot cache."""
+
+import asyncio
+
+from nautilus_trader.adapters.paradex.snapshots import OrderBookSnapshotCache
+from nautilus_trader.model.identifiers import InstrumentId
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now_ns = 1_000_000_000
+
+    def timestamp_ns(self) -> int:
+        return self.now_ns
+
+
+INSTRUMENT_ID = InstrumentId.from_str("BTC-USD-PERP.PARADEX")
+
+
+async def test_concurrent_requests_share_one_fetch():
+    cache = OrderBookSnapshotCache(FakeClock(), ttl_ms=500)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"bids": [], "asks": []}
+
+    results = await asyncio.gather(*(cache.get(INSTRUMENT_ID, fetch) for _ in range(10)))
+
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert cache.stats.coalesced == 9
+    assert cache.stats.hit_ratio == 0.9
+
+
+async def test_expired_snapshot_is_refetched():
+    clock = FakeClock()
+    cache = OrderBookSnapshotCache(clock, ttl_ms=500)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return {"bids": [], "asks": []}
+
+    await cache.get(INSTRUMENT_ID, fetch)
+    clock.now_ns += 400_000_000
+    await cache.get(INSTRUMENT_ID, fetch)
+    assert calls == 1
+    assert cache.stats.staleness_ns_last == 400_000_000
+
+    clock.now_ns += 200_000_000
+    await cache.get(INSTRUMENT_ID, fetch)
+    assert calls == 2
@@ -0,0 +1,42 @@
+"""Unit tests for the Paradex execution client's compact state records."""
+
+import pytest
+
+from nautilus_trader.adapters.paradex.schemas import ParadexOrder
+from nautilus_trader.adapters.paradex.schemas import ParadexPosition
+from nautilus_trader.adapters.paradex.state import TrackedOrder
+from nautilus_trader.adapters.paradex.state import TrackedPosition
+from nautilus_trader.model.enums import OrderSide
+from nautilus_trader.model.enums import OrderStatus
+from nautilus_trader.model.enums import PositionSide
+
+
+def _order(i: int) -> ParadexOrder:
+    return ParadexOrder(
+        id=f"o-{i}",
+        side="SELL",
+        type="LIMIT",
+        status="OPEN",
+        size="1.5",
+        created_at=1,
+        updated_at=2,
+        market="".join(["BTC", "-USD-PERP"]),  # A fresh string, as from a decoder
+    )
+
+
+def test_tracked_order_interns_symbol_and_maps_enums():
+    first = TrackedOrder.from_order(_order(1))
+    second = TrackedOrder.from_order(_order(2))
+
+    assert first.symbol is second.symbol
+    assert (first.side, first.status) == (OrderSide.SELL, OrderStatus.ACCEPTED)
+    with pytest.raises(AttributeError):
+        first.extra = 1  # Slotted, no per-instance dict
+
+
+def test_tracked_position_from_venue_position():
+    position = TrackedPosition.from_position(
+        ParadexPosition(id="p-1", side="SHORT", size="2", updated_at=5, market="ETH-USD-PERP"),
+    )
+
+    assert (position.symbol, position.side, position.size) == ("ETH-USD-PERP", PositionSide.SHORT, "2")